@@ -0,0 +1,55 @@
+"""
+Measure the cold start cost of the library.
+
+Every step runs in a fresh interpreter so nothing is served from an earlier import.
+
+    python benchmarks/import_time.py [--runs 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+# Each step runs after the setup of the steps before it
+STEPS = {
+    "import trackbear_api": "import trackbear_api",
+    "import TrackBearClient": "from trackbear_api import TrackBearClient",
+    "TrackBearClient()": "client = TrackBearClient(api_token='benchmark')",
+    "first sub-client": "client.project",
+}
+
+TIMER = """
+import time
+started = time.perf_counter()
+{statement}
+print(time.perf_counter() - started)
+"""
+
+
+def time_step(setup: str, statement: str) -> float:
+    """Return the seconds a statement takes in a fresh interpreter after `setup`."""
+    code = setup + TIMER.format(statement=statement)
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, check=True)
+    return float(output.stdout)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=20, help="Interpreters started per step")
+    args = parser.parse_args()
+
+    print(f"{'step':<24} {'median ms':>10} {'min ms':>10}")
+    setup = ""
+    for name, statement in STEPS.items():
+        timings = [time_step(setup, statement) * 1000 for _ in range(args.runs)]
+        print(f"{name:<24} {statistics.median(timings):>10.2f} {min(timings):>10.2f}")
+        setup += statement + "\n"
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,79 @@
+"""
+Compare the per-call overhead of the transports.
+
+Requests go through a full TrackBearClient to a local keep-alive HTTP server that
+answers every request with the same small body, so the timings are dominated by
+client-side work rather than the network.
+
+    python benchmarks/transport_overhead.py [--calls 2000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.server
+import threading
+import time
+
+from trackbear_api import TrackBearClient
+from trackbear_api.transport import InMemoryTransport
+from trackbear_api.transport import Transport
+
+BODY = b'{"success": true, "data": "pong"}'
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    wbufsize = -1
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.send_header("RateLimit", '"100-in-1min"; r=100; t=60')
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+def time_calls(transport: str | Transport, api_url: str, calls: int) -> float:
+    """Return the mean microseconds per GET through a client using the transport."""
+    client = TrackBearClient(api_token="benchmark", api_url=api_url, transport=transport)
+
+    client.bare.get("/ping")
+    started = time.perf_counter()
+    for _ in range(calls):
+        client.bare.get("/ping")
+
+    return (time.perf_counter() - started) / calls * 1_000_000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=2000, help="Requests sent per transport")
+    args = parser.parse_args()
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    in_memory = InMemoryTransport()
+    in_memory.add("GET", f"{api_url}/ping", body=BODY)
+
+    print(f"{'transport':<12} {'us/call':>10}")
+    for name, transport in (
+        ("requests", "requests"),
+        ("urllib3", "urllib3"),
+        ("in-memory", in_memory),
+    ):
+        print(f"{name:<12} {time_calls(transport, api_url, args.calls):>10.1f}")
+
+    server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,7 +1,35 @@
 from __future__ import annotations
 
-from .trackbearclient import TrackBearClient
+import importlib
+from typing import TYPE_CHECKING
+from typing import Any
+
+if TYPE_CHECKING:
+    from .clientpool import TrackBearClientPool
+    from .trackbearclient import TrackBearClient
 
 __all__ = [
     "TrackBearClient",
+    "TrackBearClientPool",
 ]
+
+# Public names and the module defining them, imported on first access
+_LAZY_ATTRIBUTES = {
+    "TrackBearClient": "trackbearclient",
+    "TrackBearClientPool": "clientpool",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
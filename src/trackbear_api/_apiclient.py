@@ -1,14 +1,31 @@
 from __future__ import annotations
 
+import contextvars
+import json
 import logging
+import queue
 import re
+import threading
+import time
+from collections.abc import Callable
 from collections.abc import Mapping
+from typing import TYPE_CHECKING
 from typing import Any
 
-import requests
-
 from . import exceptions
-from . import models
+from ._cache import ResponseCache
+from ._deadline import current_deadline
+from ._ratelimit import RateLimit
+from ._singleflight import SingleFlight
+from .transport import RequestsTransport
+
+if TYPE_CHECKING:
+    import requests
+
+    from . import models
+    from .circuitbreaker import CircuitBreaker
+    from .hedging import HedgePolicy
+    from .transport import Transport
 
 
 class APIClient:
@@ -16,18 +33,50 @@ class APIClient:
 
     logger = logging.getLogger("trackbear-api")
 
-    def __init__(self, session: requests.sessions.Session, api_url: str, timeout: int) -> None:
+    def __init__(self, transport: Transport, api_url: str, timeout: int) -> None:
         """
-        Initialize client with session built from TrackBearClient.
+        Initialize client with transport built from TrackBearClient.
 
         Args:
-            session (requests.sessions.Session): Configured requests Session
+            transport (Transport): Configured transport sending the HTTP requests
             api_url (str): Base url for the TrackBear API
             timeout (int): HTTP Timeout in seconds
         """
-        self.session = session
+        self.transport = transport
         self.api_url = api_url
         self.timeout = timeout
+        self.rate_limit = RateLimit()
+        self.single_flight = True
+        self.cache: ResponseCache | None = None
+        self.circuit_breaker: CircuitBreaker | None = None
+        self.hedging: HedgePolicy | None = None
+        self._flights: SingleFlight[models.TrackBearResponse] = SingleFlight()
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        The requests Session of the default transport.
+
+        Raises:
+            AttributeError: If the client uses another transport
+        """
+        if not isinstance(self.transport, RequestsTransport):
+            raise AttributeError(f"{type(self.transport).__name__} has no requests Session")
+
+        return self.transport.session
+
+    @session.setter
+    def session(self, session: requests.Session) -> None:
+        """
+        Send requests through `session`, replacing the current transport.
+
+        Headers of the current transport missing from the session, such as the
+        Authorization and User-Agent headers, are added to it.
+        """
+        for key, value in self.transport.headers.items():
+            session.headers.setdefault(key, value)
+
+        self.transport = RequestsTransport(session=session)
 
     def get(
         self,
@@ -37,6 +86,14 @@ class APIClient:
         """
         GET request to the TrackBear API.
 
+        While `single_flight` is True, concurrent GETs of the same route and params
+        share a single request and its response. When a `cache` is set, successful
+        responses are served from it until they expire. Within a `deadline()`,
+        waiting on another caller's request is limited to the time left. When the
+        `circuit_breaker` serves stale responses, a GET rejected by an open circuit
+        is answered from the cache, expired or not. With `hedging`, a GET slower than
+        usual is sent a second time and the first response is used.
+
         Args:
             route (str): Route to call from API; example: "/project"
             params (Mapping): key-value pairs of URL parameters for the call
@@ -46,8 +103,53 @@ class APIClient:
 
         Raises:
             exceptions.APITimeoutError: If the call exceeds defined time-out
+            exceptions.DeadlineExceededError: If the call exceeds the current deadline
+            exceptions.CircuitOpenError: If the circuit of the route's group is open
         """
-        return self._handle_request("GET", route, params=params)
+        key = (route.lstrip("/"), json.dumps(params, sort_keys=True, default=str))
+
+        # A write clearing the cache while this GET is in flight keeps it uncached
+        generation = self.cache.generation if self.cache is not None else 0
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.logger.debug("Cached API response. Route: %s Params: %s", route, params)
+                return cached
+
+        def request() -> models.TrackBearResponse:
+            if self.hedging is not None and self.hedging.applies(route):
+                return self._hedged_get(self.hedging, route, params)
+
+            return self._handle_request("GET", route, params=params)
+
+        try:
+            if self.single_flight:
+                # Waiters only time out when a deadline bounds their wait
+                remaining, budget = current_deadline() or (None, 0.0)
+                try:
+                    response = self._flights.do(key, request, timeout=remaining)
+
+                except TimeoutError as err:
+                    raise self._deadline_exceeded("GET", route, budget) from err
+            else:
+                response = request()
+
+        except exceptions.CircuitOpenError:
+            breaker = self.circuit_breaker
+            if self.cache is None or breaker is None or not breaker.serve_stale:
+                raise
+
+            stale = self.cache.get(key, stale=True)
+            if stale is None:
+                raise
+
+            self.logger.warning("Circuit open, serving cached response. Route: %s", route)
+            return stale
+
+        if self.cache is not None and response.success:
+            self.cache.set(key, response, generation)
+
+        return response
 
     def post(
         self,
@@ -66,6 +168,8 @@ class APIClient:
 
         Raises:
             exceptions.APITimeoutError: If the call exceeds defined time-out
+            exceptions.DeadlineExceededError: If the call exceeds the current deadline
+            exceptions.CircuitOpenError: If the circuit of the route's group is open
         """
         return self._handle_request("POST", route, payload=payload)
 
@@ -86,6 +190,8 @@ class APIClient:
 
         Raises:
             exceptions.APITimeoutError: If the call exceeds defined time-out
+            exceptions.DeadlineExceededError: If the call exceeds the current deadline
+            exceptions.CircuitOpenError: If the circuit of the route's group is open
         """
         return self._handle_request("PATCH", route, payload=payload)
 
@@ -101,10 +207,97 @@ class APIClient:
 
         Raises:
             exceptions.APITimeoutError: If the call exceeds defined time-out
+            exceptions.DeadlineExceededError: If the call exceeds the current deadline
+            exceptions.CircuitOpenError: If the circuit of the route's group is open
 
         """
         return self._handle_request("DELETE", route)
 
+    def _hedged_get(
+        self,
+        hedging: HedgePolicy,
+        route: str,
+        params: Mapping[str, Any] | None,
+    ) -> models.TrackBearResponse:
+        """
+        GET which is sent a second time when slower than the hedging delay.
+
+        Both requests run in daemon threads within copies of the caller's context. The
+        first successful response is returned. When both fail, an unsuccessful
+        response is returned if there is one, otherwise the last error is raised.
+        """
+        delay = hedging.delay()
+        if delay is None:
+            return self._timed_get(hedging, route, params, acquire=True)
+
+        outcomes: queue.SimpleQueue[tuple[models.TrackBearResponse | None, BaseException | None]]
+        outcomes = queue.SimpleQueue()
+
+        def send(acquire: bool) -> None:
+            try:
+                outcomes.put((self._timed_get(hedging, route, params, acquire=acquire), None))
+
+            except BaseException as err:
+                outcomes.put((None, err))
+
+        self._start_thread(send, True)
+        pending = 1
+
+        try:
+            first = outcomes.get(timeout=delay)
+            hedging.record_waited()
+
+        except queue.Empty:
+            first = None
+            if hedging.try_hedge(self.rate_limit):
+                self.logger.debug("Hedging GET after %.3f seconds. Route: %s", delay, route)
+                self._start_thread(send, False)
+                pending = 2
+
+        failed: models.TrackBearResponse | None = None
+        error: BaseException | None = None
+        while pending:
+            response, raised = first if first is not None else outcomes.get()
+            first = None
+            pending -= 1
+            if response is None:
+                error = raised
+            elif response.success:
+                return response
+            else:
+                failed = response
+
+        if failed is not None:
+            return failed
+
+        raise error  # type: ignore[misc]
+
+    def _timed_get(
+        self,
+        hedging: HedgePolicy,
+        route: str,
+        params: Mapping[str, Any] | None,
+        *,
+        acquire: bool,
+    ) -> models.TrackBearResponse:
+        """GET recording the latency of completed requests for the hedging delay."""
+        started = time.perf_counter()
+        response = self._handle_request("GET", route, params=params, acquire=acquire)
+        hedging.record_latency(time.perf_counter() - started)
+        return response
+
+    @staticmethod
+    def _start_thread(target: Callable[[bool], None], argument: bool) -> None:
+        """Run `target` in a daemon thread within a copy of the current context."""
+        context = contextvars.copy_context()
+        thread = threading.Thread(
+            target=context.run,
+            args=(target, argument),
+            name="trackbear-hedge",
+            daemon=True,
+        )
+        thread.start()
+
     def _handle_request(
         self,
         method: str,
@@ -112,22 +305,82 @@ class APIClient:
         *,
         params: Mapping[str, Any] | None = None,
         payload: Mapping[str, Any] | None = None,
+        acquire: bool = True,
     ) -> models.TrackBearResponse:
-        """Internal logic for making all API requests."""
+        """
+        Internal logic for making all API requests.
+
+        `acquire` is False when the request was already taken from the rate limit.
+        """
+        # Deferred to keep importing the library fast
+        from . import models
+
         route = route.lstrip("/") if route.startswith("/") else route
         url = f"{self.api_url}/{route}"
 
+        # Fail fast, before waiting for budget, while the route's group is failing
+        group = route.split("/", 1)[0]
+        breaker = self.circuit_breaker
+        if breaker is not None and not breaker.allow(group):
+            circuit_open = exceptions.CircuitOpenError(
+                method, url, group, breaker.retry_after(group)
+            )
+            self.logger.error("%s", circuit_open)
+            raise circuit_open
+
+        # Within a deadline, waits for budget and the request share the time left
+        deadline = current_deadline()
+        timeout: float = self.timeout
+        budget = 0.0
+        if deadline is None:
+            if acquire:
+                self.rate_limit.acquire()
+
+        else:
+            left, budget = deadline
+            held = not acquire or (left > 0 and self.rate_limit.acquire(timeout=left))
+            left = (current_deadline() or deadline)[0]
+            if not held or left <= 0:
+                # A request given up on never spends its share of the budget
+                if held:
+                    self.rate_limit.release()
+                raise self._deadline_exceeded(method, url, budget)
+
+            timeout = min(timeout, left)
+
         try:
-            if params:
-                response = self.session.request(method, url, params=params, timeout=self.timeout)
-            else:
-                response = self.session.request(method, url, json=payload, timeout=self.timeout)
+            response = self.transport.request(
+                method,
+                url,
+                params=params or None,
+                payload=payload,
+                timeout=timeout,
+            )
+
+        except TimeoutError as err:
+            if breaker is not None:
+                breaker.record(group, failed=True)
+
+            if timeout < self.timeout:
+                raise self._deadline_exceeded(method, url, budget) from err
 
-        except requests.exceptions.Timeout as err:
             exc = exceptions.APITimeoutError(err, method, url, self.timeout)
             self.logger.error("%s", exc)
             raise exc from err
 
+        except Exception:
+            if breaker is not None:
+                breaker.record(group, failed=True)
+            raise
+
+        finally:
+            # A write may have landed even when its response was lost
+            if method != "GET" and self.cache is not None:
+                self.cache.clear()
+
+        if breaker is not None:
+            breaker.record(group, failed=response.status_code >= 500)
+
         if not response.ok:
             log_body = f"Code: {response.status_code} Route: {route} Parames: {params} Text: {response.text} Headers: {response.headers}"
             self.logger.error("Bad API response. %s", log_body)
@@ -137,6 +390,9 @@ class APIClient:
 
         rheaders = response.headers.get("RateLimit", "Undefined")
         remaining, reset = self.parse_response_rate_limit(rheaders)
+        limit_search = re.search(r"q=(\d+)", response.headers.get("RateLimit-Policy", ""))
+        limit = int(limit_search.group(1)) if limit_search is not None else None
+        self.rate_limit.update(remaining, reset, limit)
 
         self.logger.debug("%d requets remaining; resets in %s seconds", remaining, reset)
 
@@ -147,6 +403,14 @@ class APIClient:
             status_code=response.status_code,
         )
 
+    def _deadline_exceeded(
+        self, method: str, url: str, budget: float
+    ) -> exceptions.DeadlineExceededError:
+        """Log and return the error of a request which ran out of deadline."""
+        exc = exceptions.DeadlineExceededError(method, url, budget)
+        self.logger.error("%s", exc)
+        return exc
+
     def parse_response_rate_limit(self, rate_limit: str) -> tuple[int, int]:
         """
         Process the RateLimit response header, returns Requests Remaining and Window Reset Time
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from collections.abc import Hashable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import models
+
+
+class ResponseCache:
+    """
+    Thread-safe time-to-live cache of successful GET responses.
+
+    Any write made through the APIClient clears the cache, as a single write can
+    change several resources (a tally changes project totals, stats, and goals).
+    `generation` counts the clears, so state derived from cached responses can
+    tell when it is outdated. Responses expired for longer than `ttl_seconds` are
+    evicted as new ones are cached.
+    """
+
+    def __init__(self, ttl_seconds: float, clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            ttl_seconds (float): Seconds a response is served from the cache
+            clock (Callable): Monotonic clock returning seconds, replaceable for tests
+        """
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be greater than 0")
+
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[Hashable, tuple[float, models.TrackBearResponse]] = {}
+        self._next_eviction = clock() + ttl_seconds
+        self.generation = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def now(self) -> float:
+        """Return the current time of the cache's clock, in seconds."""
+        return self._clock()
+
+    def get(self, key: Hashable, *, stale: bool = False) -> models.TrackBearResponse | None:
+        """
+        Return the cached response of `key`, or None if missing or expired.
+
+        Expired responses are returned when `stale` is True, until replaced, evicted,
+        or cleared.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry is None or (entry[0] <= self.now() and not stale):
+            return None
+
+        return entry[1]
+
+    def set(
+        self,
+        key: Hashable,
+        response: models.TrackBearResponse,
+        generation: int | None = None,
+    ) -> None:
+        """
+        Cache the response of `key` for `ttl_seconds`.
+
+        When `generation` is given, the response is dropped if the cache was cleared
+        since, as a write may have landed while the response was in flight.
+        """
+        now = self.now()
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+
+            # At most once per ttl_seconds, evict responses too old to serve even stale
+            if now >= self._next_eviction:
+                self._next_eviction = now + self.ttl_seconds
+                cutoff = now - self.ttl_seconds
+                for old_key in [
+                    k for k, (expires, _) in self._entries.items() if expires <= cutoff
+                ]:
+                    del self._entries[old_key]
+
+            self._entries[key] = (now + self.ttl_seconds, response)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._entries.clear()
+            self.generation += 1
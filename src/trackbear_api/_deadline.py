@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import dataclasses
+import time
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _Deadline:
+    """Monotonic time a budget of seconds runs out at."""
+
+    expires_at: float
+    seconds: float
+
+
+# Deadline of requests made from the current context
+_DEADLINE: contextvars.ContextVar[_Deadline | None] = contextvars.ContextVar(
+    "trackbear_api_deadline",
+    default=None,
+)
+
+
+class _DeadlineContext:
+    """
+    Context manager setting the deadline of the current context.
+
+    Not a `contextlib.contextmanager`: on exit it would assign `__traceback__` to the
+    exceptions passing through, which the frozen library exceptions reject.
+    """
+
+    def __init__(self, seconds: float) -> None:
+        self._seconds = seconds
+        self._tokens: list[contextvars.Token[_Deadline | None]] = []
+
+    def __enter__(self) -> None:
+        new = _Deadline(time.monotonic() + self._seconds, self._seconds)
+        current = _DEADLINE.get()
+        if current is not None and current.expires_at < new.expires_at:
+            new = current
+
+        self._tokens.append(_DEADLINE.set(new))
+
+    def __exit__(self, *args: object) -> None:
+        _DEADLINE.reset(self._tokens.pop())
+
+
+def deadline(seconds: float) -> contextlib.AbstractContextManager[None]:
+    """
+    Limit all requests made within the context to an overall budget of seconds.
+
+    The budget starts when the context is entered. A nested deadline never extends
+    the enclosing one.
+
+    Raises:
+        ValueError: If `seconds` is not greater than 0
+    """
+    if seconds <= 0:
+        raise ValueError("Deadline seconds must be greater than 0")
+
+    return _DeadlineContext(seconds)
+
+
+def current_deadline() -> tuple[float, float] | None:
+    """
+    Return the time left and the total budget of the current deadline, in seconds.
+
+    Returns None when no deadline is set. The time left is never below 0.
+    """
+    current = _DEADLINE.get()
+    if current is None:
+        return None
+
+    return max(0.0, current.expires_at - time.monotonic()), current.seconds
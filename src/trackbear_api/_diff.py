@@ -0,0 +1,127 @@
+"""Build PATCH payloads holding only the fields of a model which changed."""
+
+from __future__ import annotations
+
+import dataclasses
+import enum
+import types
+import typing
+from collections.abc import Collection
+from collections.abc import Mapping
+from collections.abc import Sequence
+from typing import Any
+
+from . import _serialize
+
+_field_types: dict[type, dict[str, Any]] = {}
+
+
+def _coerce(hint: Any, value: Any, current: Any = None) -> Any:
+    """
+    Convert a changed value to the type of its field.
+
+    A mapping given for a nested model is built into the model. Fields it leaves
+    out are kept from `current`, the field's value before the change.
+
+    Raises:
+        ValueError: When a value is not a member of the field's enum
+        ValueError: When a mapping does not hold the fields of the nested model
+    """
+    if isinstance(hint, type) and issubclass(hint, enum.Enum):
+        return hint(value)
+
+    options = _models_of(hint)
+    if options and isinstance(value, Mapping):
+        return _build(options, value, current)
+
+    if typing.get_origin(hint) in (list, Sequence) and not isinstance(value, str):
+        (item_hint,) = typing.get_args(hint)
+        return [_coerce(item_hint, item) for item in value]
+
+    return value
+
+
+def _models_of(hint: Any) -> list[type]:
+    """Return the model types a field holds, by itself or in a union."""
+    is_union = typing.get_origin(hint) in (typing.Union, types.UnionType)
+    return [
+        option
+        for option in (typing.get_args(hint) if is_union else (hint,))
+        if isinstance(option, type) and dataclasses.is_dataclass(option)
+    ]
+
+
+def _build(options: list[type], value: Mapping[str, Any], current: Any) -> Any:
+    """Build the first model type, the current one first, holding the given fields."""
+    for option in sorted(options, key=lambda option: not isinstance(current, option)):
+        base = current if isinstance(current, option) else None
+        fields = {field.name: field for field in dataclasses.fields(option)}
+        required = {
+            name
+            for name, field in fields.items()
+            if field.default is dataclasses.MISSING and field.default_factory is dataclasses.MISSING
+        }
+        if value.keys() - fields.keys() or (base is None and required - value.keys()):
+            continue
+
+        hints = _hints(option)
+        kwargs = {name: getattr(base, name) for name in fields if base is not None}
+        for name, item in value.items():
+            kwargs[name] = _coerce(hints[name], item, getattr(base, name, None))
+
+        return option(**kwargs)
+
+    names = " or ".join(option.__name__ for option in options)
+    keys = ", ".join(sorted(value)) or "none"
+    raise ValueError(f"Cannot build {names} from the given fields: {keys}")
+
+
+def _hints(cls: type) -> dict[str, Any]:
+    """Return the resolved field types of a model, cached per type."""
+    hints = _field_types.get(cls)
+    if hints is None:
+        hints = _field_types[cls] = typing.get_type_hints(cls)
+
+    return hints
+
+
+def patch_payload(
+    model: Any,
+    changes: Mapping[str, Any],
+    writable: Collection[str],
+) -> dict[str, Any]:
+    """
+    Return the API payload of the changes which differ from the model.
+
+    Only changed fields are serialized; an empty payload means nothing changed.
+
+    Args:
+        model (Any): Current state of the resource
+        changes (Mapping[str, Any]): New values by snake_case field name
+        writable (Collection[str]): Fields the API accepts in an update
+
+    Returns:
+        The camelCase payload of the changed fields
+
+    Raises:
+        ValueError: When a field is not writable or an enum value is not valid
+        ValueError: When a mapping does not hold the fields of a nested model
+    """
+    unknown = sorted(changes.keys() - set(writable))
+    if unknown:
+        name = type(model).__name__
+        raise ValueError(f"Cannot update {name} field(s): {', '.join(unknown)}")
+
+    hints = _hints(type(model))
+
+    changed = {}
+    for name, value in changes.items():
+        value = _coerce(hints[name], value, getattr(model, name))
+        if value != getattr(model, name):
+            changed[name] = value
+
+    if not changed:
+        return {}
+
+    updated = dataclasses.replace(model, **changed).to_api_dict()
+    return {key: updated[key] for key in (_serialize.camel_case(name) for name in changed)}
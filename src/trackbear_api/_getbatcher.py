@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import abc
+import threading
+import time
+from collections.abc import Callable
+from collections.abc import Sequence
+from typing import Generic
+from typing import Protocol
+from typing import TypeVar
+
+
+class _HasId(Protocol):
+    @property
+    def id(self) -> int: ...
+
+
+_M = TypeVar("_M", bound=_HasId)
+
+
+class _Batch(Generic[_M]):
+    """Ids gathered within one window and the outcome shared by their callers."""
+
+    def __init__(self) -> None:
+        self.ids: set[int] = set()
+        self.done = threading.Event()
+        self.models: dict[int, _M] | None = None
+        self.error: BaseException | None = None
+
+
+class GetBatcher(Generic[_M]):
+    """
+    Coalesce bursts of get-by-id calls into a single list request.
+
+    The first caller opens a batch and waits up to `window_seconds` for other ids to
+    arrive. When the batch holds at least `threshold` ids, it is dispatched right
+    away as one list request that answers every caller. Smaller batches fall back to
+    one get request per id. Ids missing from the list response also fall back to a
+    get request, so the original API error is raised.
+    """
+
+    def __init__(
+        self,
+        list_func: Callable[[], Sequence[_M]],
+        get_func: Callable[[int], _M],
+        window_seconds: float,
+        threshold: int,
+    ) -> None:
+        if window_seconds <= 0:
+            raise ValueError("window_seconds must be greater than 0")
+
+        if threshold < 2:
+            raise ValueError("threshold must be at least 2")
+
+        self._list_func = list_func
+        self._get_func = get_func
+        self._window_seconds = window_seconds
+        self._threshold = threshold
+        self._lock = threading.Condition()
+        self._batch: _Batch[_M] | None = None
+
+    def get(self, model_id: int) -> _M:
+        """Return the model of `model_id`, sharing a list request when possible."""
+        with self._lock:
+            batch = self._batch
+            leader = batch is None
+            if batch is None:
+                batch = self._batch = _Batch()
+
+            batch.ids.add(model_id)
+            if len(batch.ids) >= self._threshold:
+                self._lock.notify_all()
+
+            if leader:
+                deadline = time.monotonic() + self._window_seconds
+                while len(batch.ids) < self._threshold:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._lock.wait(remaining)
+
+                self._batch = None
+
+        if leader:
+            self._dispatch(batch)
+        else:
+            batch.done.wait()
+
+        if batch.error is not None:
+            raise batch.error
+
+        if batch.models is not None and model_id in batch.models:
+            return batch.models[model_id]
+
+        return self._get_func(model_id)
+
+    def _dispatch(self, batch: _Batch[_M]) -> None:
+        """Run the list request for a full batch and release its callers."""
+        try:
+            if len(batch.ids) >= self._threshold:
+                batch.models = {model.id: model for model in self._list_func()}
+
+        except BaseException as err:
+            batch.error = err
+
+        finally:
+            batch.done.set()
+
+
+class CoalescedGets(abc.ABC, Generic[_M]):
+    """Mixin giving a sub-client with `list()` and `_get()` the `coalesce_gets()` method."""
+
+    _get_batcher: GetBatcher[_M] | None = None
+
+    @abc.abstractmethod
+    def list(self) -> Sequence[_M]:
+        """List every model, answering a coalesced burst of gets."""
+        ...
+
+    @abc.abstractmethod
+    def _get(self, model_id: int) -> _M:
+        """Request a single model by id."""
+        ...
+
+    def _batched_get(self, model_id: int) -> _M:
+        """Request a single model by id, through the batcher when coalescing."""
+        if self._get_batcher is not None:
+            return self._get_batcher.get(model_id)
+
+        return self._get(model_id)
+
+    def coalesce_gets(self, window_seconds: float = 0.02, threshold: int = 3) -> None:
+        """
+        Coalesce bursts of `get()` calls into a single `list()` request.
+
+        Calls to `get()` arriving within `window_seconds` of each other are gathered.
+        Once `threshold` ids are pending, one `list()` request answers every caller.
+        Smaller bursts fall back to one request per id. Pass `window_seconds=0` to
+        disable coalescing.
+
+        Args:
+            window_seconds (float): Seconds to gather ids before dispatching (default: 0.02)
+            threshold (int): Pending ids which trigger a `list()` request (default: 3)
+
+        Raises:
+            ValueError: If `window_seconds` is negative or `threshold` is less than 2
+        """
+        if window_seconds == 0:
+            self._get_batcher = None
+            return
+
+        self._get_batcher = GetBatcher(self.list, self._get, window_seconds, threshold)
@@ -2,21 +2,47 @@ from __future__ import annotations
 
 import re
 from collections.abc import Sequence
+from typing import Any
 
 from . import enums
 from . import exceptions
 from . import models
+from . import schemas
 from ._apiclient import APIClient
+from ._diff import patch_payload
+from ._getbatcher import CoalescedGets
+from ._tagclient import TagClient
 
 _DATE_PATTERN = re.compile(r"[\d]{4}-[\d]{2}-[\d]{2}")
 
-
-class GoalClient:
+# Fields accepted by the API when updating
+_WRITABLE = (
+    "title",
+    "description",
+    "parameters",
+    "start_date",
+    "end_date",
+    "work_ids",
+    "tag_ids",
+    "starred",
+    "display_on_profile",
+)
+
+
+class GoalClient(CoalescedGets[models.Goal]):
     """Provides methods and models for Goal API routes."""
 
-    def __init__(self, api_client: APIClient) -> None:
-        """Initialize client by providing defined APIClient."""
+    def __init__(self, api_client: APIClient, tag_client: TagClient | None = None) -> None:
+        """
+        Initialize client by providing defined APIClient.
+
+        Args:
+            api_client (APIClient): Client used for all requests
+            tag_client (TagClient): (Optional) Client whose name index resolves tag
+                names. A new TagClient is created if not provided.
+        """
         self._api_client = api_client
+        self._tag_client = tag_client if tag_client is not None else TagClient(api_client)
 
     def list(self) -> Sequence[models.Goal]:
         """
@@ -39,6 +65,31 @@ class GoalClient:
 
         return [models.Goal.build(data) for data in response.data]
 
+    def list_raw(self, *, validate: bool = False) -> Sequence[schemas.GoalDict]:
+        """
+        List all goals as the decoded API data, without building models.
+
+        Args:
+            validate (bool): Check each record has the required keys (default: False)
+
+        Returns:
+            A sequence of trackbear_api.schemas.GoalDict
+
+        Raises:
+            exceptions.APIResponseError: On any failure message returned from TrackBear API
+            exceptions.ModelBuildError: If `validate` is True and a key is missing
+        """
+        response = self._api_client.get("/goal")
+
+        if not response.success:
+            raise exceptions.APIResponseError(
+                status_code=response.status_code,
+                code=response.error.code,
+                message=response.error.message,
+            )
+
+        return schemas._check(response.data, schemas.GoalDict, validate)
+
     def get(self, goal_id: int) -> models.Goal:
         """
         Get Goal by id.
@@ -52,6 +103,36 @@ class GoalClient:
         Raises:
             exceptions.APIResponseError: On failure to retrieve requested model
         """
+        return self._batched_get(goal_id)
+
+    def get_raw(self, goal_id: int, *, validate: bool = False) -> schemas.GoalDict:
+        """
+        Get Goal by id as the decoded API data, without building a model.
+
+        Args:
+            goal_id (int): Goal ID to request from TrackBear
+            validate (bool): Check the record has the required keys (default: False)
+
+        Returns:
+            trackbear_api.schemas.GoalDict
+
+        Raises:
+            exceptions.APIResponseError: On failure to retrieve requested model
+            exceptions.ModelBuildError: If `validate` is True and a key is missing
+        """
+        response = self._api_client.get(f"/goal/{goal_id}")
+
+        if not response.success:
+            raise exceptions.APIResponseError(
+                status_code=response.status_code,
+                code=response.error.code,
+                message=response.error.message,
+            )
+
+        return schemas._check(response.data, schemas.GoalDict, validate)
+
+    def _get(self, goal_id: int) -> models.Goal:
+        """Request a single Goal by id."""
         response = self._api_client.get(f"/goal/{goal_id}")
 
         if not response.success:
@@ -72,7 +153,7 @@ class GoalClient:
         start_date: str | None = None,
         end_date: str | None = None,
         work_ids: Sequence[int] | None = None,
-        tag_ids: Sequence[int] | None = None,
+        tag_ids: Sequence[int | str] | None = None,
         starred: bool = False,
         display_on_profile: bool = False,
         goal_id: int | None = None,
@@ -93,8 +174,8 @@ class GoalClient:
             end_date (str): (Optional) Ending date to pull (YYYY-MM-DD)
             work_ids (Sequence[int]): (Optional) List of work ids that apply to the
                 goal. Default: None, all works apply to goal
-            tag_ids (Sequence[int]): (Optional) List of tag ids that apply to the
-                goal. Default: None, all tags apply to goal
+            tag_ids (Sequence[int | str]): (Optional) List of tag ids, or tag names,
+                that apply to the goal. Default: None, all tags apply to goal
             starred (bool): Star the project (default: False)
             display_on_profile (bool): Display project on public profile (default: False)
             goal_id (int): (Optional) Existing tag id if request is to update
@@ -107,6 +188,7 @@ class GoalClient:
             exceptions.APIResponseError: On any failure message returned from TrackBear API
             ValueError: When `measure` is not a valid value
             ValueError: If `start_date` or `end_date` are not "YYYY-MM-DD"
+            ValueError: If a tag name in `tag_ids` does not exist
         """
         # Forcing the use of the Enum here allows for fast failures at runtime if the
         # incorrect string is provided.
@@ -134,7 +216,7 @@ class GoalClient:
             "startDate": start_date,
             "endDate": end_date,
             "workIds": work_ids if work_ids is not None else [],
-            "tagIds": tag_ids if tag_ids is not None else [],
+            "tagIds": self._tag_client.resolve_ids(tag_ids or []),
             "starred": starred,
             "displayOnProfile": display_on_profile,
         }
@@ -164,7 +246,7 @@ class GoalClient:
         measure: enums.Measure | str | None = None,
         count: int | None = None,
         work_ids: Sequence[int] | None = None,
-        tag_ids: Sequence[int] | None = None,
+        tag_ids: Sequence[int | str] | None = None,
         starred: bool = False,
         display_on_profile: bool = False,
         goal_id: int | None = None,
@@ -188,8 +270,8 @@ class GoalClient:
             count (int): (Optional) Goal of the given measure
             work_ids (Sequence[int]): List of work ids that apply to the goal.
                 Default: None, all works apply to goal
-            tag_ids (Sequence[int]): (Optional) List of tag ids that apply to the goal.
-                Default: None, all tags apply to goal
+            tag_ids (Sequence[int | str]): (Optional) List of tag ids, or tag names,
+                that apply to the goal. Default: None, all tags apply to goal
             starred (bool): Star the project (default: False)
             display_on_profile (bool): Display project on public profile (default: False)
             goal_id (int): (Optional) Existing tag id if request is to update
@@ -202,6 +284,7 @@ class GoalClient:
             exceptions.APIResponseError: On any failure message returned from TrackBear API
             ValueError: When `unit` or `measure` are not valid
             ValueError: If `start_date` or `end_date` are not "YYYY-MM-DD"
+            ValueError: If a tag name in `tag_ids` does not exist
         """
         # Forcing the use of the Enum here allows for fast failures at runtime if the
         # incorrect string is provided.
@@ -240,7 +323,7 @@ class GoalClient:
             "startDate": start_date,
             "endDate": end_date,
             "workIds": work_ids if work_ids is not None else [],
-            "tagIds": tag_ids if tag_ids is not None else [],
+            "tagIds": self._tag_client.resolve_ids(tag_ids or []),
             "starred": starred,
             "displayOnProfile": display_on_profile,
         }
@@ -259,6 +342,51 @@ class GoalClient:
 
         return models.Goal.build(response.data)
 
+    def update(self, goal: models.Goal, **changes: Any) -> models.Goal | None:
+        """
+        Update a Goal, sending only the fields which differ from `goal`.
+
+        No request is made when nothing changed.
+
+        Args:
+            goal (Goal): Current state of the goal
+            **changes: New values by field name. One of `title`, `description`,
+                `parameters`, `start_date`, `end_date`, `work_ids`, `tag_ids`,
+                `starred`, or `display_on_profile`. `tag_ids` may hold tag names.
+
+        Returns:
+            trackbear_api.models.Goal, or None if nothing changed
+
+        Raises:
+            exceptions.APIResponseError: On any failure message returned from TrackBear API
+            ValueError: When a field cannot be updated
+            ValueError: When a dict does not hold the fields of a nested model
+            ValueError: If `start_date` or `end_date` are not "YYYY-MM-DD"
+            ValueError: If a tag name in `tag_ids` does not exist
+        """
+        for key in ("start_date", "end_date"):
+            date = changes.get(key)
+            if date is not None and _DATE_PATTERN.match(date) is None:
+                raise ValueError(f"Invalid {key} '{date}'. Must be YYYY-MM-DD")
+
+        if "tag_ids" in changes:
+            changes["tag_ids"] = self._tag_client.resolve_ids(changes["tag_ids"])
+
+        payload = patch_payload(goal, changes, _WRITABLE)
+        if not payload:
+            return None
+
+        response = self._api_client.patch(f"/goal/{goal.id}", payload)
+
+        if not response.success:
+            raise exceptions.APIResponseError(
+                status_code=response.status_code,
+                code=response.error.code,
+                message=response.error.message,
+            )
+
+        return models.Goal.build(response.data)
+
     def delete(self, goal_id: int) -> models.Goal:
         """
         Delete an existing Goal.
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import datetime
+
+from . import enums
+from . import models
+
+
+def to_date(value: str) -> datetime.date:
+    """Parse a YYYY-MM-DD string."""
+    return datetime.date.fromisoformat(value[:10])
+
+
+def align(anchor: datetime.date, unit: enums.HabitUnit) -> datetime.date:
+    """
+    Align a date to the start of its calendar unit.
+
+    Days are unchanged, weeks start on Monday, months on the first, years on January 1st.
+    """
+    if unit is enums.HabitUnit.WEEK:
+        return anchor - datetime.timedelta(days=anchor.weekday())
+
+    if unit is enums.HabitUnit.MONTH:
+        return anchor.replace(day=1)
+
+    if unit is enums.HabitUnit.YEAR:
+        return anchor.replace(month=1, day=1)
+
+    return anchor
+
+
+def period_index(
+    origin: datetime.date,
+    day: datetime.date,
+    unit: enums.HabitUnit,
+    period: int,
+) -> int:
+    """
+    Return the index of the cadence period containing `day`.
+
+    Args:
+        origin (date): Start of period zero, aligned with `align()`
+        day (date): Date to locate
+        unit (HabitUnit): Unit of the cadence
+        period (int): Number of units in each period
+    """
+    if unit is enums.HabitUnit.DAY:
+        units = (day - origin).days
+
+    elif unit is enums.HabitUnit.WEEK:
+        units = (day - origin).days // 7
+
+    elif unit is enums.HabitUnit.MONTH:
+        units = (day.year - origin.year) * 12 + day.month - origin.month
+
+    else:
+        units = day.year - origin.year
+
+    return units // period
+
+
+def period_bounds(
+    origin: datetime.date,
+    index: int,
+    unit: enums.HabitUnit,
+    period: int,
+) -> tuple[datetime.date, datetime.date]:
+    """Return the first and last date (inclusive) of the cadence period at `index`."""
+    start = _add_units(origin, index * period, unit)
+    end = _add_units(origin, (index + 1) * period, unit) - datetime.timedelta(days=1)
+    return start, end
+
+
+def _add_units(origin: datetime.date, units: int, unit: enums.HabitUnit) -> datetime.date:
+    """Move an aligned origin forward by a number of units."""
+    if unit is enums.HabitUnit.DAY:
+        return origin + datetime.timedelta(days=units)
+
+    if unit is enums.HabitUnit.WEEK:
+        return origin + datetime.timedelta(weeks=units)
+
+    if unit is enums.HabitUnit.MONTH:
+        months = origin.month - 1 + units
+        return origin.replace(year=origin.year + months // 12, month=months % 12 + 1)
+
+    return origin.replace(year=origin.year + units)
+
+
+def threshold_of(goal: models.Goal) -> models.Threshold | None:
+    """Return the threshold of a goal, None for habits without one."""
+    return goal.parameters.threshold
+
+
+def applies(goal: models.Goal, tally: models.Tally) -> bool:
+    """
+    Return True if the tally counts toward the goal.
+
+    Checks the tally state, the goal's date range, `work_ids`, `tag_ids`, and the
+    threshold measure. Empty `work_ids` or `tag_ids` apply to all works or tags.
+    """
+    if tally.state is not enums.State.ACTIVE:
+        return False
+
+    if goal.start_date is not None and tally.date < goal.start_date:
+        return False
+
+    if goal.end_date is not None and tally.date > goal.end_date:
+        return False
+
+    if goal.work_ids and tally.work_id not in goal.work_ids:
+        return False
+
+    if goal.tag_ids and not any(tag.id in goal.tag_ids for tag in tally.tags):
+        return False
+
+    threshold = threshold_of(goal)
+
+    return threshold is None or tally.measure == threshold.measure
@@ -2,14 +2,31 @@ from __future__ import annotations
 
 import re
 from collections.abc import Sequence
+from typing import Any
 
 from . import enums
 from . import exceptions
 from . import models
+from . import schemas
 from ._apiclient import APIClient
+from ._diff import patch_payload
 
 _DATE_PATTERN = re.compile(r"[\d]{4}-[\d]{2}-[\d]{2}")
 
+# Fields accepted by the API when updating
+_WRITABLE = (
+    "title",
+    "description",
+    "start_date",
+    "end_date",
+    "individual_goal_mode",
+    "fundraiser_mode",
+    "measures",
+    "goal",
+    "is_joinable",
+    "starred",
+)
+
 
 class LeaderboardClient:
     """Provides methods and models for Leaderboard API routes."""
@@ -39,6 +56,31 @@ class LeaderboardClient:
 
         return [models.LeaderboardExtended.build(data) for data in response.data]
 
+    def list_raw(self, *, validate: bool = False) -> Sequence[schemas.LeaderboardExtendedDict]:
+        """
+        List all leaderboards as the decoded API data, without building models.
+
+        Args:
+            validate (bool): Check each record has the required keys (default: False)
+
+        Returns:
+            A sequence of trackbear_api.schemas.LeaderboardExtendedDict
+
+        Raises:
+            exceptions.APIResponseError: On any failure message returned from TrackBear API
+            exceptions.ModelBuildError: If `validate` is True and a key is missing
+        """
+        response = self._api_client.get("/leaderboard")
+
+        if not response.success:
+            raise exceptions.APIResponseError(
+                status_code=response.status_code,
+                code=response.error.code,
+                message=response.error.message,
+            )
+
+        return schemas._check(response.data, schemas.LeaderboardExtendedDict, validate)
+
     def list_participants(self, board_uuid: str) -> Sequence[models.Participant]:
         """
         List all participants of a given leaderboard.
@@ -60,6 +102,34 @@ class LeaderboardClient:
 
         return [models.Participant.build(data) for data in response.data]
 
+    def list_participants_raw(
+        self, board_uuid: str, *, validate: bool = False
+    ) -> Sequence[schemas.ParticipantDict]:
+        """
+        List participants of a leaderboard as the decoded API data, without models.
+
+        Args:
+            board_uuid (str): Leaderboard UUID to request from TrackBear
+            validate (bool): Check each record has the required keys (default: False)
+
+        Returns:
+            A sequence of trackbear_api.schemas.ParticipantDict
+
+        Raises:
+            exceptions.APIResponseError: On any failure message returned from TrackBear API
+            exceptions.ModelBuildError: If `validate` is True and a key is missing
+        """
+        response = self._api_client.get(f"/leaderboard/{board_uuid}/participants")
+
+        if not response.success:
+            raise exceptions.APIResponseError(
+                status_code=response.status_code,
+                code=response.error.code,
+                message=response.error.message,
+            )
+
+        return schemas._check(response.data, schemas.ParticipantDict, validate)
+
     def get(self, board_uuid: str) -> models.Leaderboard:
         """
         Get Leaderboard by uuid.
@@ -75,6 +145,32 @@ class LeaderboardClient:
         """
         return self._get(board_uuid, "/leaderboard")
 
+    def get_raw(self, board_uuid: str, *, validate: bool = False) -> schemas.LeaderboardDict:
+        """
+        Get Leaderboard by uuid as the decoded API data, without building a model.
+
+        Args:
+            board_uuid (str): Leaderboard UUID to request from TrackBear
+            validate (bool): Check the record has the required keys (default: False)
+
+        Returns:
+            trackbear_api.schemas.LeaderboardDict
+
+        Raises:
+            exceptions.APIResponseError: On failure to retrieve requested model
+            exceptions.ModelBuildError: If `validate` is True and a key is missing
+        """
+        response = self._api_client.get(f"/leaderboard/{board_uuid}")
+
+        if not response.success:
+            raise exceptions.APIResponseError(
+                status_code=response.status_code,
+                code=response.error.code,
+                message=response.error.message,
+            )
+
+        return schemas._check(response.data, schemas.LeaderboardDict, validate)
+
     def get_by_join_code(self, join_code: str) -> models.Leaderboard:
         """
         Get Leaderboard by a join code.
@@ -211,6 +307,51 @@ class LeaderboardClient:
 
         return models.Leaderboard.build(response.data)
 
+    def update(
+        self,
+        board: models.Leaderboard | models.LeaderboardExtended,
+        **changes: Any,
+    ) -> models.Leaderboard | None:
+        """
+        Update a Leaderboard, sending only the fields which differ from `board`.
+
+        No request is made when nothing changed.
+
+        Args:
+            board (Leaderboard | LeaderboardExtended): Current state of the leaderboard
+            **changes: New values by field name. One of `title`, `description`,
+                `start_date`, `end_date`, `individual_goal_mode`, `fundraiser_mode`,
+                `measures`, `goal`, `is_joinable`, or `starred`.
+
+        Returns:
+            trackbear_api.models.Leaderboard, or None if nothing changed
+
+        Raises:
+            exceptions.APIResponseError: On any failure message returned from TrackBear API
+            ValueError: When a field cannot be updated or a measure is not a valid value
+            ValueError: When a dict does not hold the fields of a nested model
+            ValueError: If `start_date` or `end_date` are not "YYYY-MM-DD"
+        """
+        for key in ("start_date", "end_date"):
+            date = changes.get(key)
+            if date is not None and _DATE_PATTERN.match(date) is None:
+                raise ValueError(f"Invalid {key} '{date}'. Must be YYYY-MM-DD")
+
+        payload = patch_payload(board, changes, _WRITABLE)
+        if not payload:
+            return None
+
+        response = self._api_client.patch(f"/leaderboard/{board.uuid}", payload)
+
+        if not response.success:
+            raise exceptions.APIResponseError(
+                status_code=response.status_code,
+                code=response.error.code,
+                message=response.error.message,
+            )
+
+        return models.Leaderboard.build(response.data)
+
     def save_star(self, board_uuid: int, *, starred: bool = True) -> models.Starred:
         """
         Star or unstar a Leaderboard
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from typing import Any
 
 from . import enums
 from . import exceptions
 from . import models
+from . import schemas
 from ._apiclient import APIClient
+from ._diff import patch_payload
+from ._getbatcher import CoalescedGets
 
+# Fields accepted by the API when updating
+_WRITABLE = ("title", "description", "phase", "starting_balance", "starred", "display_on_profile")
 
-class ProjectClient:
+
+class ProjectClient(CoalescedGets[models.Project]):
     """Provides methods and models for Project API routes."""
 
     def __init__(self, api_client: APIClient) -> None:
@@ -36,6 +43,31 @@ class ProjectClient:
 
         return [models.Project.build(data) for data in response.data]
 
+    def list_raw(self, *, validate: bool = False) -> Sequence[schemas.ProjectDict]:
+        """
+        List all projects as the decoded API data, without building models.
+
+        Args:
+            validate (bool): Check each record has the required keys (default: False)
+
+        Returns:
+            A sequence of trackbear_api.schemas.ProjectDict
+
+        Raises:
+            exceptions.APIResponseError: On any failure message returned from TrackBear API
+            exceptions.ModelBuildError: If `validate` is True and a key is missing
+        """
+        response = self._api_client.get("/project")
+
+        if not response.success:
+            raise exceptions.APIResponseError(
+                status_code=response.status_code,
+                code=response.error.code,
+                message=response.error.message,
+            )
+
+        return schemas._check(response.data, schemas.ProjectDict, validate)
+
     def get(self, project_id: int) -> models.Project:
         """
         Get Project by id.
@@ -49,6 +81,36 @@ class ProjectClient:
         Raises:
             exceptions.APIResponseError: On failure to retrieve requested model
         """
+        return self._batched_get(project_id)
+
+    def get_raw(self, project_id: int, *, validate: bool = False) -> schemas.ProjectDict:
+        """
+        Get Project by id as the decoded API data, without building a model.
+
+        Args:
+            project_id (int): Project ID to request from TrackBear
+            validate (bool): Check the record has the required keys (default: False)
+
+        Returns:
+            trackbear_api.schemas.ProjectDict
+
+        Raises:
+            exceptions.APIResponseError: On failure to retrieve requested model
+            exceptions.ModelBuildError: If `validate` is True and a key is missing
+        """
+        response = self._api_client.get(f"/project/{project_id}")
+
+        if not response.success:
+            raise exceptions.APIResponseError(
+                status_code=response.status_code,
+                code=response.error.code,
+                message=response.error.message,
+            )
+
+        return schemas._check(response.data, schemas.ProjectDict, validate)
+
+    def _get(self, project_id: int) -> models.Project:
+        """Request a single Project by id."""
         response = self._api_client.get(f"/project/{project_id}")
 
         if not response.success:
@@ -144,6 +206,44 @@ class ProjectClient:
 
         return models.ProjectStub.build(response.data)
 
+    def update(
+        self,
+        project: models.Project | models.ProjectStub,
+        **changes: Any,
+    ) -> models.ProjectStub | None:
+        """
+        Update a Project, sending only the fields which differ from `project`.
+
+        No request is made when nothing changed.
+
+        Args:
+            project (Project | ProjectStub): Current state of the project
+            **changes: New values by field name. One of `title`, `description`,
+                `phase`, `starting_balance`, `starred`, or `display_on_profile`.
+
+        Returns:
+            trackbear.models.ProjectStub, or None if nothing changed
+
+        Raises:
+            exceptions.APIResponseError: On any failure message returned from TrackBear API
+            ValueError: When a field cannot be updated or `phase` is not a valid value
+            ValueError: When a dict does not hold the fields of a nested model
+        """
+        payload = patch_payload(project, changes, _WRITABLE)
+        if not payload:
+            return None
+
+        response = self._api_client.patch(f"/project/{project.id}", payload)
+
+        if not response.success:
+            raise exceptions.APIResponseError(
+                status_code=response.status_code,
+                code=response.error.code,
+                message=response.error.message,
+            )
+
+        return models.ProjectStub.build(response.data)
+
     def delete(self, project_id: int) -> models.ProjectStub:
         """
         Delete an existing project.
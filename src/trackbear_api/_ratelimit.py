@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import logging
+import math
+import threading
+import time
+from collections.abc import Callable
+
+from . import enums
+
+# Priority of requests made from the current context
+_PRIORITY: contextvars.ContextVar[enums.Priority] = contextvars.ContextVar(
+    "trackbear_api_priority",
+    default=enums.Priority.INTERACTIVE,
+)
+
+
+class _Prioritized:
+    """
+    Context manager setting the priority of the current context.
+
+    Not a `contextlib.contextmanager`: on exit it would assign `__traceback__` to the
+    exceptions passing through, which the frozen library exceptions reject.
+    """
+
+    def __init__(self, priority: enums.Priority) -> None:
+        self._priority = priority
+        self._tokens: list[contextvars.Token[enums.Priority]] = []
+
+    def __enter__(self) -> None:
+        self._tokens.append(_PRIORITY.set(self._priority))
+
+    def __exit__(self, *args: object) -> None:
+        _PRIORITY.reset(self._tokens.pop())
+
+
+def prioritized(priority: enums.Priority | str) -> contextlib.AbstractContextManager[None]:
+    """
+    Make requests within the context at the given priority.
+
+    Raises:
+        ValueError: If `priority` is not a valid value
+    """
+    return _Prioritized(enums.Priority(priority))
+
+
+def current_priority() -> enums.Priority:
+    """Return the priority of requests made from the current context."""
+    return _PRIORITY.get()
+
+
+class RateLimit:
+    """
+    Thread-safe tracker of the TrackBear API rate limit window.
+
+    The state is updated from the `RateLimit` response header of every request. Before
+    a request is sent `acquire()` reserves one request from the remaining budget and
+    blocks until the window resets when no budget is left.
+
+    Background requests leave `reserve_share` of the window's budget to interactive
+    requests, and yield to interactive requests waiting for budget.
+
+    https://help.trackbear.app/api/rate-limits
+    """
+
+    logger = logging.getLogger("trackbear-api")
+
+    def __init__(
+        self,
+        clock: Callable[[], float] = time.monotonic,
+        reserve_share: float = 0.2,
+    ) -> None:
+        """
+        Initialize with an unknown rate limit state.
+
+        Args:
+            clock (Callable): Monotonic clock returning seconds, replaceable for tests
+            reserve_share (float): Share of the window's budget kept for interactive
+                requests (default: 0.2)
+        """
+        self.reserve_share = reserve_share
+        self._clock = clock
+        self._lock = threading.Condition()
+        self._remaining: int | None = None
+        self._limit: int | None = None
+        self._reset_at = 0.0
+        self._interactive_waiting = 0
+
+    @property
+    def remaining(self) -> int | None:
+        """Requests remaining in the current window, None if no response seen yet."""
+        with self._lock:
+            return self._remaining
+
+    @property
+    def reserved(self) -> int:
+        """Requests of the window held back from background requests."""
+        with self._lock:
+            return self._reserved()
+
+    @property
+    def reset(self) -> float:
+        """Seconds until the current window resets."""
+        with self._lock:
+            return max(0.0, self._reset_at - self._clock())
+
+    def update(self, remaining: int, reset: int, limit: int | None = None) -> None:
+        """
+        Record the rate limit state reported by the API.
+
+        Args:
+            remaining (int): Requests remaining in the window (`r=` of the header)
+            reset (int): Seconds until the window resets (`t=` of the header)
+            limit (int): (Optional) Requests allowed per window (`q=` of the
+                RateLimit-Policy header). Estimated from the largest remaining
+                budget seen when not provided.
+        """
+        with self._lock:
+            if limit is not None:
+                self._limit = limit
+            else:
+                self._limit = max(self._limit or 0, remaining + 1)
+
+            self._remaining = remaining
+            self._reset_at = self._clock() + reset
+            self._lock.notify_all()
+
+    def acquire(
+        self,
+        priority: enums.Priority | str | None = None,
+        timeout: float | None = None,
+    ) -> bool:
+        """
+        Reserve one request from the budget, waiting for the window to reset if needed.
+
+        Args:
+            priority (Priority): (Optional) Priority of the request. Defaults to the
+                priority of the current context, see `prioritized()`.
+            timeout (float): (Optional) Most seconds to wait for budget. Waits as long
+                as needed when not provided.
+
+        Returns:
+            True once reserved, False if no budget was available within `timeout`
+        """
+        priority = current_priority() if priority is None else enums.Priority(priority)
+        background = priority is enums.Priority.BACKGROUND
+        give_up_at = self._clock() + timeout if timeout is not None else None
+
+        with self._lock:
+            if not background:
+                self._interactive_waiting += 1
+
+            try:
+                if not self._wait_for_budget(background, give_up_at):
+                    return False
+
+            finally:
+                if not background:
+                    self._interactive_waiting -= 1
+                    self._lock.notify_all()
+
+            if self._remaining is not None:
+                self._remaining -= 1
+
+            return True
+
+    def release(self) -> None:
+        """Return a request reserved by `acquire()` which was never sent."""
+        with self._lock:
+            # A limit is always known once the remaining budget is
+            if self._remaining is not None and self._limit is not None:
+                self._remaining = min(self._remaining + 1, self._limit)
+                self._lock.notify_all()
+
+    def _wait_for_budget(self, background: bool, give_up_at: float | None) -> bool:
+        """
+        Block until a request of the priority may be sent. Caller holds the lock.
+
+        Returns False without waiting further once `give_up_at` would be passed.
+        """
+        while True:
+            now = self._clock()
+            patience = give_up_at - now if give_up_at is not None else None
+
+            if background and self._interactive_waiting:
+                if patience is not None and patience <= 0:
+                    return False
+
+                self._lock.wait(patience)
+                continue
+
+            floor = self._reserved() if background else 0
+            if self._remaining is None or self._remaining > floor:
+                return True
+
+            wait = self._reset_at - now
+            if wait <= 0:
+                # The window has reset; the next response reports the new budget.
+                self._remaining = None
+                return True
+
+            if patience is not None and patience < wait:
+                self.logger.warning("Rate limit reset in %.1f seconds is past the deadline", wait)
+                return False
+
+            if background:
+                self.logger.debug("Background request waiting %.1f seconds for budget", wait)
+            else:
+                self.logger.warning("Rate limit reached, waiting %.1f seconds", wait)
+
+            self._lock.wait(wait)
+
+    def _reserved(self) -> int:
+        """Requests held back from background requests. Caller holds the lock."""
+        if self._limit is None:
+            return 0
+
+        return math.ceil(self._limit * self.reserve_share)
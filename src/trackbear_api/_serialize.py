@@ -0,0 +1,146 @@
+"""
+Generated serializers for the models.
+
+Each model gets a specialized function per direction, built once from its field types
+on first use. This avoids the per-call recursion and type inspection of
+`dataclasses.asdict()` and the validation of `build()`.
+"""
+
+from __future__ import annotations
+
+import collections.abc
+import dataclasses
+import enum
+import itertools
+import threading
+import types
+import typing
+from collections.abc import Callable
+from typing import Any
+
+# Serializer modes: snake_case dict, camelCase API dict, and from a snake_case dict
+TO_DICT = "to_dict"
+TO_API_DICT = "to_api_dict"
+FROM_DICT = "from_dict"
+
+_SCALARS = (int, float, str, bool, type(None))
+_SEQUENCES = (list, collections.abc.Sequence)
+_UNIONS = (typing.Union, types.UnionType)
+
+_serializers: dict[tuple[type, str], Callable[[Any], Any]] = {}
+_lock = threading.RLock()
+
+
+def camel_case(name: str) -> str:
+    """Convert a snake_case field name to the camelCase key of the API."""
+    first, *rest = name.split("_")
+    return first + "".join(word.title() for word in rest)
+
+
+def serializer(cls: type, mode: str) -> Callable[[Any], Any]:
+    """Return the serializer of a dataclass for a mode, generating it on first use."""
+    key = (cls, mode)
+    function = _serializers.get(key)
+    if function is None:
+        with _lock:
+            function = _serializers.get(key) or _generate(cls, mode)
+            _serializers[key] = function
+
+    return function
+
+
+def _generate(cls: type, mode: str) -> Callable[[Any], Any]:
+    """Compile the serializer of a dataclass for a mode."""
+    hints = typing.get_type_hints(cls)
+    namespace: dict[str, Any] = {"cls": cls}
+    names = (f"_{index}" for index in itertools.count())
+
+    if mode == FROM_DICT:
+        arguments = []
+        for field in dataclasses.fields(cls):
+            if field.default is dataclasses.MISSING:
+                value = f"data[{field.name!r}]"
+            else:
+                default = next(names)
+                namespace[default] = field.default
+                value = f"data.get({field.name!r}, {default})"
+
+            arguments.append(
+                f"{field.name}={_convert(hints[field.name], value, mode, namespace, names)}"
+            )
+
+        source = f"def from_dict(data):\n    return cls({', '.join(arguments)})\n"
+
+    else:
+        items = []
+        for field in dataclasses.fields(cls):
+            key = camel_case(field.name) if mode == TO_API_DICT else field.name
+            value = _convert(hints[field.name], f"obj.{field.name}", mode, namespace, names)
+            items.append(f"{key!r}: {value}")
+
+        source = f"def {mode}(obj):\n    return {{{', '.join(items)}}}\n"
+
+    exec(source, namespace)
+    return namespace[mode]
+
+
+def _convert(
+    hint: Any,
+    value: str,
+    mode: str,
+    namespace: dict[str, Any],
+    names: collections.abc.Iterator[str],
+) -> str:
+    """Return a source expression converting `value` of type `hint`."""
+    origin = typing.get_origin(hint)
+    arguments = typing.get_args(hint)
+
+    if hint is Any or hint in _SCALARS:
+        return value
+
+    if isinstance(hint, type) and issubclass(hint, enum.Enum):
+        # Some models keep enum fields as the raw string from the API
+        if mode == FROM_DICT:
+            members = next(names)
+            namespace[members] = hint._value2member_map_
+            return f"{members}.get({value}, {value})"
+
+        return f"getattr({value}, 'value', {value})"
+
+    if dataclasses.is_dataclass(hint):
+        function = next(names)
+        namespace[function] = serializer(hint, mode)  # type: ignore[arg-type]
+        return f"{function}({value})"
+
+    if origin in _SEQUENCES:
+        item = next(names)
+        converted = _convert(arguments[0], item, mode, namespace, names)
+        if converted == item:
+            return f"list({value})"
+
+        return f"[{converted} for {item} in {value}]"
+
+    if origin in _UNIONS:
+        options = [argument for argument in arguments if argument is not type(None)]
+        if len(options) == 1:
+            converted = _convert(options[0], value, mode, namespace, names)
+            return value if converted == value else f"(None if {value} is None else {converted})"
+
+        function = next(names)
+        namespace[function] = _union(options, mode)
+        return f"{function}({value})"
+
+    raise TypeError(f"Cannot serialize field of type {hint!r}")
+
+
+def _union(options: list[type], mode: str) -> Callable[[Any], Any]:
+    """Dispatch a union of dataclasses by type, or by the keys of the dict."""
+    if mode == FROM_DICT:
+        by_keys = {
+            frozenset(field.name for field in dataclasses.fields(option)): serializer(option, mode)
+            for option in options
+        }
+        return lambda data: None if data is None else by_keys[frozenset(data)](data)
+
+    by_type = {option: serializer(option, mode) for option in options}
+    return lambda obj: None if obj is None else by_type[type(obj)](obj)
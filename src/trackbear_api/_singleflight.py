@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from collections.abc import Hashable
+from typing import Generic
+from typing import TypeVar
+
+_T = TypeVar("_T")
+
+
+class _Call(Generic[_T]):
+    """A single in-flight call and the outcome shared with its waiters."""
+
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: _T | None = None
+        self.error: BaseException | None = None
+        self.waiters = 0
+
+
+class SingleFlight(Generic[_T]):
+    """
+    Collapse concurrent calls sharing a key into one execution.
+
+    The first caller for a key runs the function. Callers arriving while it is in
+    flight block and receive the same result, or the same raised exception. Once
+    the call completes the key is released and the next caller runs it again.
+
+    Thread based, asyncio callers share flights when calling through
+    `asyncio.to_thread()` or an executor.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call[_T]] = {}
+
+    def in_flight(self, key: Hashable) -> int:
+        """Return the number of callers waiting on the in-flight call of a key."""
+        with self._lock:
+            call = self._calls.get(key)
+            return call.waiters if call is not None else 0
+
+    def do(self, key: Hashable, func: Callable[[], _T], timeout: float | None = None) -> _T:
+        """
+        Run `func` once for all concurrent callers of `key`.
+
+        Args:
+            key (Hashable): Key shared by the callers of a flight
+            func (Callable): Called by the first caller of a flight
+            timeout (float): (Optional) Most seconds a waiting caller blocks for the
+                result. The flight keeps running for the other callers.
+
+        Returns:
+            The result of `func`, shared with all callers of the same flight
+
+        Raises:
+            TimeoutError: If a waiting caller does not get the result within `timeout`
+            Any exception raised by `func`, shared with all callers of the same flight
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+
+        if not leader:
+            if not call.done.wait(timeout):
+                raise TimeoutError(f"Waited {timeout} seconds for the in-flight call")
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[return-value]
+
+        try:
+            call.result = func()
+
+        except BaseException as err:
+            call.error = err
+            raise
+
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result
@@ -5,6 +5,7 @@ from collections.abc import Sequence
 
 from . import exceptions
 from . import models
+from . import schemas
 from ._apiclient import APIClient
 
 _DATE_PATTERN = re.compile(r"[\d]{4}-[\d]{2}-[\d]{2}")
@@ -36,6 +37,55 @@ class StatClient:
             APIResponseError: On any failure message returned from TrackBear API
             ValueError: If `start_date` or `end_date` are not "YYYY-MM-DD"
         """
+        params = self._list_params(start_date, end_date)
+        response = self._api_client.get("/stats/days", params)
+
+        if not response.success:
+            raise exceptions.APIResponseError(
+                status_code=response.status_code,
+                code=response.error.code,
+                message=response.error.message,
+            )
+
+        return [models.Stat.build(data) for data in response.data]
+
+    def list_raw(
+        self,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        *,
+        validate: bool = False,
+    ) -> Sequence[schemas.StatDict]:
+        """
+        List stats as the decoded API data, without building models.
+
+        Args:
+            start_date (str): Starting date to pull (YYYY-MM-DD)
+            end_date (str): Ending date to pull (YYYY-MM-DD)
+            validate (bool): Check each record has the required keys (default: False)
+
+        Returns:
+            A sequence of trackbear_api.schemas.StatDict
+
+        Raises:
+            APIResponseError: On any failure message returned from TrackBear API
+            ModelBuildError: If `validate` is True and a key is missing
+            ValueError: If `start_date` or `end_date` are not "YYYY-MM-DD"
+        """
+        params = self._list_params(start_date, end_date)
+        response = self._api_client.get("/stats/days", params)
+
+        if not response.success:
+            raise exceptions.APIResponseError(
+                status_code=response.status_code,
+                code=response.error.code,
+                message=response.error.message,
+            )
+
+        return schemas._check(response.data, schemas.StatDict, validate)
+
+    def _list_params(self, start_date: str | None, end_date: str | None) -> dict[str, str]:
+        """Validate the date range of a stat listing and convert it to URL parameters."""
         if start_date is not None:
             if _DATE_PATTERN.match(start_date) is None:
                 raise ValueError(f"Invalid start_date '{start_date}'. Must be YYYY-MM-DD")
@@ -50,13 +100,4 @@ class StatClient:
         if end_date:
             params["endDate"] = end_date
 
-        response = self._api_client.get("/stats/days", params)
-
-        if not response.success:
-            raise exceptions.APIResponseError(
-                status_code=response.status_code,
-                code=response.error.code,
-                message=response.error.message,
-            )
-
-        return [models.Stat.build(data) for data in response.data]
+        return params
@@ -1,19 +1,35 @@
 from __future__ import annotations
 
+import threading
+from collections.abc import Iterable
 from collections.abc import Sequence
+from typing import Any
 
 from . import enums
 from . import exceptions
 from . import models
+from . import schemas
 from ._apiclient import APIClient
+from ._diff import patch_payload
+from ._getbatcher import CoalescedGets
 
+# Fields accepted by the API when updating
+_WRITABLE = ("name", "color")
 
-class TagClient:
-    """Provides methods and models for Tag API routes."""
+
+class TagClient(CoalescedGets[models.Tag]):
+    """
+    Provides methods and models for Tag API routes.
+
+    Maintains a lazily loaded index of tag names to ids. The index is refreshed by
+    every `list`, `save`, and `delete` and reloaded when a name cannot be resolved.
+    """
 
     def __init__(self, api_client: APIClient) -> None:
         """Initialize client by providing defined APIClient."""
         self._api_client = api_client
+        self._index_lock = threading.Lock()
+        self._index: dict[str, int] | None = None
 
     def list(self) -> Sequence[models.Tag]:
         """
@@ -34,7 +50,37 @@ class TagClient:
                 message=response.error.message,
             )
 
-        return [models.Tag.build(data) for data in response.data]
+        tags = [models.Tag.build(data) for data in response.data]
+
+        with self._index_lock:
+            self._index = {tag.name: tag.id for tag in tags}
+
+        return tags
+
+    def list_raw(self, *, validate: bool = False) -> Sequence[schemas.TagDict]:
+        """
+        List all tags as the decoded API data, without building models.
+
+        Args:
+            validate (bool): Check each record has the required keys (default: False)
+
+        Returns:
+            A sequence of trackbear_api.schemas.TagDict
+
+        Raises:
+            exceptions.APIResponseError: On any failure message returned from TrackBear API
+            exceptions.ModelBuildError: If `validate` is True and a key is missing
+        """
+        response = self._api_client.get("/tag")
+
+        if not response.success:
+            raise exceptions.APIResponseError(
+                status_code=response.status_code,
+                code=response.error.code,
+                message=response.error.message,
+            )
+
+        return schemas._check(response.data, schemas.TagDict, validate)
 
     def get(self, tag_id: int) -> models.Tag:
         """
@@ -49,6 +95,36 @@ class TagClient:
         Raises:
             exceptions.APIResponseError: On failure to retrieve requested model
         """
+        return self._batched_get(tag_id)
+
+    def get_raw(self, tag_id: int, *, validate: bool = False) -> schemas.TagDict:
+        """
+        Get Tag by id as the decoded API data, without building a model.
+
+        Args:
+            tag_id (int): Tag ID to request from TrackBear
+            validate (bool): Check the record has the required keys (default: False)
+
+        Returns:
+            trackbear_api.schemas.TagDict
+
+        Raises:
+            exceptions.APIResponseError: On failure to retrieve requested model
+            exceptions.ModelBuildError: If `validate` is True and a key is missing
+        """
+        response = self._api_client.get(f"/tag/{tag_id}")
+
+        if not response.success:
+            raise exceptions.APIResponseError(
+                status_code=response.status_code,
+                code=response.error.code,
+                message=response.error.message,
+            )
+
+        return schemas._check(response.data, schemas.TagDict, validate)
+
+    def _get(self, tag_id: int) -> models.Tag:
+        """Request a single Tag by id."""
         response = self._api_client.get(f"/tag/{tag_id}")
 
         if not response.success:
@@ -109,7 +185,45 @@ class TagClient:
                 message=response.error.message,
             )
 
-        return models.Tag.build(response.data)
+        tag = models.Tag.build(response.data)
+        self.update_index([tag])
+
+        return tag
+
+    def update(self, tag: models.Tag, **changes: Any) -> models.Tag | None:
+        """
+        Update a Tag, sending only the fields which differ from `tag`.
+
+        No request is made when nothing changed.
+
+        Args:
+            tag (Tag): Current state of the tag
+            **changes: New values by field name. One of `name` or `color`.
+
+        Returns:
+            trackbear_api.models.Tag, or None if nothing changed
+
+        Raises:
+            exceptions.APIResponseError: On any failure message returned from TrackBear API
+            ValueError: When a field cannot be updated or `color` is not a valid value
+        """
+        payload = patch_payload(tag, changes, _WRITABLE)
+        if not payload:
+            return None
+
+        response = self._api_client.patch(f"/tag/{tag.id}", payload)
+
+        if not response.success:
+            raise exceptions.APIResponseError(
+                status_code=response.status_code,
+                code=response.error.code,
+                message=response.error.message,
+            )
+
+        updated = models.Tag.build(response.data)
+        self.update_index([updated])
+
+        return updated
 
     def delete(self, tag_id: int) -> models.Tag:
         """
@@ -133,4 +247,104 @@ class TagClient:
                 message=response.error.message,
             )
 
-        return models.Tag.build(response.data)
+        tag = models.Tag.build(response.data)
+
+        with self._index_lock:
+            if self._index is not None:
+                self._index = {name: id_ for name, id_ in self._index.items() if id_ != tag.id}
+
+        return tag
+
+    def resolve_ids(self, tags: Iterable[int | str]) -> Sequence[int]:
+        """
+        Translate tag names to tag ids. Ids are returned unchanged.
+
+        The name index is loaded on first use and reloaded once if a name is missing.
+        No request is made when only ids are provided.
+
+        Args:
+            tags (Iterable[int | str]): Tag ids or tag names
+
+        Returns:
+            A sequence of tag ids in the order provided
+
+        Raises:
+            exceptions.APIResponseError: If the tags cannot be listed
+            ValueError: If a tag name does not exist
+        """
+        tags = list(tags)
+        names = {tag for tag in tags if isinstance(tag, str)}
+        if not names:
+            return [int(tag) for tag in tags]
+
+        index = self._load_index(names)
+
+        missing = sorted(names - index.keys())
+        if missing:
+            raise ValueError(f"Unknown tag name(s): {', '.join(missing)}")
+
+        return [index[tag] if isinstance(tag, str) else tag for tag in tags]
+
+    def resolve_names(self, tags: Iterable[int | str]) -> Sequence[str]:
+        """
+        Translate tag ids to tag names. Names are returned unchanged.
+
+        The name index is loaded on first use and reloaded once if an id is missing.
+        No request is made when only names are provided.
+
+        Args:
+            tags (Iterable[int | str]): Tag ids or tag names
+
+        Returns:
+            A sequence of tag names in the order provided
+
+        Raises:
+            exceptions.APIResponseError: If the tags cannot be listed
+            ValueError: If a tag id does not exist
+        """
+        tags = list(tags)
+        ids = {tag for tag in tags if not isinstance(tag, str)}
+        if not ids:
+            return [str(tag) for tag in tags]
+
+        names = {id_: name for name, id_ in self._load_index(set(), ids).items()}
+
+        missing = sorted(ids - names.keys())
+        if missing:
+            raise ValueError(f"Unknown tag id(s): {', '.join(str(id_) for id_ in missing)}")
+
+        return [tag if isinstance(tag, str) else names[tag] for tag in tags]
+
+    def update_index(self, tags: Iterable[models.Tag]) -> None:
+        """Record tags returned by the API in the name index, if it is loaded."""
+        with self._index_lock:
+            if self._index is None:
+                return
+
+            # Copy on write, resolved indexes may be read outside of the lock
+            index = dict(self._index)
+            for tag in tags:
+                for name in [name for name, id_ in index.items() if id_ == tag.id]:
+                    del index[name]
+                index[tag.name] = tag.id
+
+            self._index = index
+
+    def invalidate_index(self) -> None:
+        """Drop the name index. It is reloaded on the next resolve."""
+        with self._index_lock:
+            self._index = None
+
+    def _load_index(self, names: set[str], ids: set[int] | None = None) -> dict[str, int]:
+        """Return the name index, reloading it if any name or id is missing."""
+        with self._index_lock:
+            index = self._index
+
+        if index is not None:
+            if names <= index.keys() and (not ids or ids <= set(index.values())):
+                return index
+
+        self.list()
+
+        with self._index_lock:
+            return self._index or {}
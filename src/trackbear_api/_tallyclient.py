@@ -1,12 +1,28 @@
 from __future__ import annotations
 
+import concurrent.futures
+import contextvars
+import functools
+import pathlib
 import re
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Mapping
 from collections.abc import Sequence
+from typing import Any
 
 from . import enums
 from . import exceptions
 from . import models
+from . import schemas
 from ._apiclient import APIClient
+from ._tagclient import TagClient
+from ._tallycoalescer import TallyCoalescer
+from ._tallyimport import TallyKey
+from ._tallyimport import normalize_row
+from ._tallyimport import read_rows
+from ._tallyimport import row_key
+from ._tallyplanner import TallyQueryPlanner
 
 _DATE_PATTERN = re.compile(r"[\d]{4}-[\d]{2}-[\d]{2}")
 
@@ -14,14 +30,23 @@ _DATE_PATTERN = re.compile(r"[\d]{4}-[\d]{2}-[\d]{2}")
 class TallyClient:
     """Provides methods and models for Tally API routes."""
 
-    def __init__(self, api_client: APIClient) -> None:
-        """Initialize client by providing defined APIClient."""
+    def __init__(self, api_client: APIClient, tag_client: TagClient | None = None) -> None:
+        """
+        Initialize client by providing defined APIClient.
+
+        Args:
+            api_client (APIClient): Client used for all requests
+            tag_client (TagClient): (Optional) Client whose name index resolves tag
+                names and ids. A new TagClient is created if not provided.
+        """
         self._api_client = api_client
+        self._tag_client = tag_client if tag_client is not None else TagClient(api_client)
+        self._planner: TallyQueryPlanner | None = None
 
     def list(
         self,
         works: Sequence[int] | None = None,
-        tags: Sequence[int] | None = None,
+        tags: Sequence[int | str] | None = None,
         measure: enums.Measure | str | None = None,
         start_date: str | None = None,
         end_date: str | None = None,
@@ -31,9 +56,14 @@ class TallyClient:
 
         All arguements are optional and act as filters for the results.
 
+        While the client caches responses, a listing whose filters are narrower than
+        an earlier listing's is filtered locally from it, and only the dates the
+        earlier listings do not cover are requested. Tallies are then returned in
+        date order.
+
         Args:
             works (Sequence[int]): (Optional) List of project ids
-            tags: (Sequence[int]): (Optional) List of tag ids
+            tags: (Sequence[int | str]): (Optional) List of tag ids or tag names
             measure (Measure | str): (Optional) Measure enum of the following: `word`,
                 `time`, `page`, `chapter`, `scene`, or `line`.
             start_date (str): (Optional) Starting date to pull (YYYY-MM-DD)
@@ -46,7 +76,88 @@ class TallyClient:
             exceptions.APIResponseError: On any failure message returned from TrackBear API
             ValueError: When `measure` is not a valid value
             ValueError: If `start_date` or `end_date` are not "YYYY-MM-DD"
+            ValueError: If a tag name in `tags` does not exist
         """
+        params = self._list_params(works, tags, measure, start_date, end_date)
+
+        cache = self._api_client.cache
+        if cache is None:
+            return self._list(params)
+
+        planner = self._planner
+        if planner is None or planner.cache is not cache:
+            planner = self._planner = TallyQueryPlanner(cache)
+
+        return planner.list(params, self._list)
+
+    def _list(self, params: Mapping[str, Any]) -> Sequence[models.Tally]:
+        """Request a tally listing of URL parameters."""
+        response = self._api_client.get("/tally", params=params)
+
+        if not response.success:
+            raise exceptions.APIResponseError(
+                status_code=response.status_code,
+                code=response.error.code,
+                message=response.error.message,
+            )
+
+        return [models.Tally.build(data) for data in response.data]
+
+    def list_raw(
+        self,
+        works: Sequence[int] | None = None,
+        tags: Sequence[int | str] | None = None,
+        measure: enums.Measure | str | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        *,
+        validate: bool = False,
+    ) -> Sequence[schemas.TallyDict]:
+        """
+        List tallies as the decoded API data, without building models.
+
+        Accepts the same filters as `list()`.
+
+        Args:
+            works (Sequence[int]): (Optional) List of project ids
+            tags: (Sequence[int | str]): (Optional) List of tag ids or tag names
+            measure (Measure | str): (Optional) Measure enum of the following: `word`,
+                `time`, `page`, `chapter`, `scene`, or `line`.
+            start_date (str): (Optional) Starting date to pull (YYYY-MM-DD)
+            end_date (str): (Optional) Ending date to pull (YYYY-MM-DD)
+            validate (bool): Check each record has the required keys (default: False)
+
+        Returns:
+            A sequence of trackbear_api.schemas.TallyDict
+
+        Raises:
+            exceptions.APIResponseError: On any failure message returned from TrackBear API
+            exceptions.ModelBuildError: If `validate` is True and a key is missing
+            ValueError: When `measure` is not a valid value
+            ValueError: If `start_date` or `end_date` are not "YYYY-MM-DD"
+            ValueError: If a tag name in `tags` does not exist
+        """
+        params = self._list_params(works, tags, measure, start_date, end_date)
+        response = self._api_client.get("/tally", params=params)
+
+        if not response.success:
+            raise exceptions.APIResponseError(
+                status_code=response.status_code,
+                code=response.error.code,
+                message=response.error.message,
+            )
+
+        return schemas._check(response.data, schemas.TallyDict, validate)
+
+    def _list_params(
+        self,
+        works: Sequence[int] | None,
+        tags: Sequence[int | str] | None,
+        measure: enums.Measure | str | None,
+        start_date: str | None,
+        end_date: str | None,
+    ) -> dict[str, Any]:
+        """Validate the filters of a tally listing and convert them to URL parameters."""
         # Forcing the use of the Enum here allows for fast failures at runtime if the
         # incorrect string is provided.
         if measure is not None:
@@ -62,14 +173,29 @@ class TallyClient:
 
         params = {
             "works[]": works,
-            "tags[]": tags,
+            "tags[]": self._tag_client.resolve_ids(tags) if tags is not None else None,
             "measure": measure.value if measure is not None else None,
             "startDate": start_date,
             "endDate": end_date,
         }
         params = {k: v for k, v in params.items() if v is not None}
 
-        response = self._api_client.get("/tally", params=params)
+        return params
+
+    def get(self, tally_id: int) -> models.Tally:
+        """
+        Get Tally by id.
+
+        Args:
+            tally_id (int): Tally ID to request from TrackBear
+
+        Returns:
+            trackbear_api.models.Tally
+
+        Raises:
+            exceptions.APIResponseError: On failure to retrieve requested model
+        """
+        response = self._api_client.get(f"/tally/{tally_id}")
 
         if not response.success:
             raise exceptions.APIResponseError(
@@ -78,20 +204,22 @@ class TallyClient:
                 message=response.error.message,
             )
 
-        return [models.Tally.build(data) for data in response.data]
+        return models.Tally.build(response.data)
 
-    def get(self, tally_id: int) -> models.Tally:
+    def get_raw(self, tally_id: int, *, validate: bool = False) -> schemas.TallyDict:
         """
-        Get Tally by id.
+        Get Tally by id as the decoded API data, without building a model.
 
         Args:
             tally_id (int): Tally ID to request from TrackBear
+            validate (bool): Check the record has the required keys (default: False)
 
         Returns:
-            trackbear_api.models.Tally
+            trackbear_api.schemas.TallyDict
 
         Raises:
             exceptions.APIResponseError: On failure to retrieve requested model
+            exceptions.ModelBuildError: If `validate` is True and a key is missing
         """
         response = self._api_client.get(f"/tally/{tally_id}")
 
@@ -102,7 +230,7 @@ class TallyClient:
                 message=response.error.message,
             )
 
-        return models.Tally.build(response.data)
+        return schemas._check(response.data, schemas.TallyDict, validate)
 
     def save(
         self,
@@ -111,7 +239,7 @@ class TallyClient:
         measure: enums.Measure | str,
         count: int,
         note: str = "",
-        tags: Sequence[str] | None = None,
+        tags: Sequence[str | int] | None = None,
         tally_id: int | None = None,
         *,
         set_total: bool = False,
@@ -129,8 +257,8 @@ class TallyClient:
                 `page`, `chapter`, `scene`, or `line`.
             count (int): Value of the measure
             note (str): A note for the tally
-            tags (Sequence[str]): (Optional) A list of tag names to apply. New tags
-                will be created.
+            tags (Sequence[str | int]): (Optional) A list of tag names, or existing
+                tag ids, to apply. New tags will be created for unknown names.
             tally_id (int): (Optional) Existing project id if request is to update
                 existing projects
             set_total (bool): If true, the provided count will be set as the project total.
@@ -142,6 +270,7 @@ class TallyClient:
             exceptions.APIResponseError: On any failure message returned from TrackBear API
             ValueError: When `measure` is not a valid value
             ValueError: If `date` is not "YYYY-MM-DD"
+            ValueError: If a tag id in `tags` does not exist
         """
         # Forcing the use of the Enum here allows for fast failures at runtime if the
         # incorrect string is provided.
@@ -154,7 +283,7 @@ class TallyClient:
             "note": note,
             "workId": work_id,
             "setTotal": set_total,
-            "tags": tags or [],
+            "tags": self._tag_client.resolve_names(tags or []),
         }
 
         if tally_id is None:
@@ -169,7 +298,42 @@ class TallyClient:
                 message=response.error.message,
             )
 
-        return models.Tally.build(response.data)
+        tally = models.Tally.build(response.data)
+
+        # Tags created by name are recorded so they resolve without a reload
+        self._tag_client.update_index(tally.tags)
+
+        return tally
+
+    def coalesce(
+        self,
+        window_seconds: float = 5.0,
+        max_pending: int = 50,
+    ) -> TallyCoalescer:
+        """
+        Create a buffer which merges tally increments before saving.
+
+        Increments for the same (work_id, date, measure) are summed and saved as a
+        single tally. Notes and tags are combined. The buffer flushes when the oldest
+        increment has waited `window_seconds`, when `max_pending` increments are
+        buffered, when the context manager exits, and at interpreter exit.
+
+        Example:
+            with client.tally.coalesce(window_seconds=30) as buffer:
+                buffer.save(work_id=123, date="2025-01-01", measure="word", count=50)
+
+        Args:
+            window_seconds (float): Seconds an increment may wait before a flush
+                (default: 5.0)
+            max_pending (int): Buffered increments which trigger a flush (default: 50)
+
+        Returns:
+            TallyCoalescer
+
+        Raises:
+            ValueError: If `window_seconds` or `max_pending` are not positive
+        """
+        return TallyCoalescer(self, window_seconds, max_pending)
 
     def delete(self, tally_id: int) -> models.Tally:
         """
@@ -194,3 +358,136 @@ class TallyClient:
             )
 
         return models.Tally.build(response.data)
+
+    def save_many(
+        self,
+        rows: Iterable[Mapping[str, Any]],
+        *,
+        max_workers: int = 4,
+        skip_existing: bool = True,
+    ) -> Iterator[models.TallySaveResult]:
+        """
+        Save many tallies concurrently, streaming a result for each row.
+
+        All rows are validated before any request is made. Rows are then written by a
+        bounded pool of workers; no more than `max_workers` saves are in flight at once
+        and new rows are only submitted as the returned iterator is consumed. All
+        requests share the client's rate limit.
+
+        Each row is a mapping with the keys `work_id`, `date`, `measure`, `count` and
+        optionally `note` and `tags` (a sequence of tag names).
+
+        Args:
+            rows (Iterable[Mapping]): Rows of tallies to create
+            max_workers (int): Number of concurrent save requests (default: 4)
+            skip_existing (bool): When True, rows matching an existing tally, or an
+                earlier row, on (work_id, date, measure, count, note) are skipped.
+                Costs one `list` request. (default: True)
+
+        Returns:
+            An iterator of trackbear_api.models.TallySaveResult in completion order
+
+        Raises:
+            exceptions.APIResponseError: If the existing tallies cannot be listed
+            ValueError: If any row is missing a key or has an invalid value
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        normalized = [normalize_row(index, row) for index, row in enumerate(rows)]
+
+        existing: set[TallyKey] | None = None
+        if skip_existing:
+            existing = self._existing_keys(normalized) if normalized else set()
+
+        return self._save_rows(normalized, existing, max_workers)
+
+    def import_file(
+        self,
+        path: str | pathlib.Path,
+        *,
+        max_workers: int = 4,
+        skip_existing: bool = True,
+    ) -> Iterator[models.TallySaveResult]:
+        """
+        Import tallies from a `.csv`, `.ndjson`, or `.jsonl` file.
+
+        CSV files require a header row of `work_id`, `date`, `measure`, `count`, `note`,
+        and `tags`. Multiple tags are separated by `;`. See `save_many` for details.
+
+        Args:
+            path (str | Path): File to import
+            max_workers (int): Number of concurrent save requests (default: 4)
+            skip_existing (bool): Skip rows matching existing tallies (default: True)
+
+        Returns:
+            An iterator of trackbear_api.models.TallySaveResult in completion order
+
+        Raises:
+            exceptions.APIResponseError: If the existing tallies cannot be listed
+            ValueError: If the file type is unsupported or any row is invalid
+        """
+        rows = read_rows(path)
+
+        return self.save_many(rows, max_workers=max_workers, skip_existing=skip_existing)
+
+    def _existing_keys(self, rows: Sequence[dict[str, Any]]) -> set[TallyKey]:
+        """Pull the existing tallies covering the rows and return their keys."""
+        dates = [row["date"] for row in rows]
+        tallies = self.list(
+            works=sorted({row["work_id"] for row in rows}),
+            start_date=min(dates),
+            end_date=max(dates),
+        )
+
+        return {
+            (tally.work_id, tally.date, tally.measure.value, tally.count, tally.note)
+            for tally in tallies
+        }
+
+    def _save_rows(
+        self,
+        rows: Sequence[dict[str, Any]],
+        existing: set[TallyKey] | None,
+        max_workers: int,
+    ) -> Iterator[models.TallySaveResult]:
+        """Submit rows to a bounded worker pool, yielding results as they complete."""
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending: dict[concurrent.futures.Future[models.Tally], int] = {}
+
+            for index, row in enumerate(rows):
+                if existing is not None:
+                    key = row_key(row)
+                    if key in existing:
+                        yield models.TallySaveResult(index, enums.SaveStatus.SKIPPED)
+                        continue
+                    existing.add(key)
+
+                if len(pending) >= max_workers:
+                    done, _ = concurrent.futures.wait(
+                        pending,
+                        return_when=concurrent.futures.FIRST_COMPLETED,
+                    )
+                    for future in done:
+                        yield self._save_result(pending.pop(future), future)
+
+                context = contextvars.copy_context()
+                pending[executor.submit(context.run, functools.partial(self.save, **row))] = index
+
+            for future in concurrent.futures.as_completed(pending):
+                yield self._save_result(pending[future], future)
+
+    @staticmethod
+    def _save_result(
+        index: int,
+        future: concurrent.futures.Future[models.Tally],
+    ) -> models.TallySaveResult:
+        """Translate a completed save into a result, capturing any failure of the row."""
+        try:
+            tally = future.result()
+
+        # Transport, deadline, and circuit breaker errors fail the row, not the stream
+        except Exception as err:
+            return models.TallySaveResult(index, enums.SaveStatus.FAILED, error=err)
+
+        return models.TallySaveResult(index, enums.SaveStatus.SAVED, tally=tally)
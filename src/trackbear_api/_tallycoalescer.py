@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import atexit
+import dataclasses
+import logging
+import threading
+from collections.abc import Sequence
+from types import TracebackType
+from typing import TYPE_CHECKING
+
+from . import enums
+from . import models
+
+if TYPE_CHECKING:
+    from ._tallyclient import TallyClient
+
+# Pending tallies are merged on (work_id, date, measure)
+_CoalesceKey = tuple[int, str, enums.Measure]
+
+
+@dataclasses.dataclass(slots=True)
+class _PendingTally:
+    """Running total of the increments buffered for a single key."""
+
+    count: int = 0
+    notes: list[str] = dataclasses.field(default_factory=list)
+    tags: list[str] = dataclasses.field(default_factory=list)
+    increments: int = 0
+
+    def merge(self, count: int, note: str, tags: Sequence[str]) -> None:
+        """Merge another increment into the pending total."""
+        self.count += count
+        self.increments += 1
+        if note and note not in self.notes:
+            self.notes.append(note)
+        self.tags.extend(tag for tag in tags if tag not in self.tags)
+
+
+class TallyCoalescer:
+    """
+    Buffer tally increments and save them as one tally per (work_id, date, measure).
+
+    Pending increments are flushed when the oldest has waited `window_seconds`, when
+    `max_pending` increments are buffered, when `flush()` or `close()` is called, when
+    the context manager exits, and at interpreter exit.
+
+    Created by `TallyClient.coalesce()`.
+    """
+
+    logger = logging.getLogger("trackbear-api")
+
+    def __init__(
+        self,
+        tally_client: TallyClient,
+        window_seconds: float,
+        max_pending: int,
+    ) -> None:
+        """
+        Initialize the buffer. Prefer `TallyClient.coalesce()`.
+
+        Args:
+            tally_client (TallyClient): Client used to save the merged tallies
+            window_seconds (float): Seconds an increment may wait before a flush
+            max_pending (int): Number of buffered increments which triggers a flush
+        """
+        if window_seconds <= 0:
+            raise ValueError("window_seconds must be greater than 0")
+
+        if max_pending < 1:
+            raise ValueError("max_pending must be at least 1")
+
+        self._tally_client = tally_client
+        self._window_seconds = window_seconds
+        self._max_pending = max_pending
+        self._lock = threading.Lock()
+        self._pending: dict[_CoalesceKey, _PendingTally] = {}
+        self._increments = 0
+        self._timer: threading.Timer | None = None
+        self._closed = False
+
+        atexit.register(self.close)
+
+    def __enter__(self) -> TallyCoalescer:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @property
+    def pending(self) -> int:
+        """Number of increments waiting to be flushed."""
+        with self._lock:
+            return self._increments
+
+    def save(
+        self,
+        work_id: int,
+        date: str,
+        measure: enums.Measure | str,
+        count: int,
+        note: str = "",
+        tags: Sequence[str] | None = None,
+    ) -> None:
+        """
+        Buffer a tally increment. Arguments match `TallyClient.save`.
+
+        Raises:
+            RuntimeError: If the buffer has been closed
+            ValueError: When `measure` is not a valid value
+        """
+        # Forcing the use of the Enum here allows for fast failures at runtime if the
+        # incorrect string is provided.
+        measure = measure if isinstance(measure, enums.Measure) else enums.Measure(measure)
+
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Cannot save to a closed TallyCoalescer")
+
+            key = (work_id, date, measure)
+            self._pending.setdefault(key, _PendingTally()).merge(count, note, tags or [])
+            self._increments += 1
+
+            self._arm_timer()
+            flush_now = self._increments >= self._max_pending
+
+        if flush_now:
+            self.flush()
+
+    def flush(self) -> list[models.Tally]:
+        """
+        Save all pending increments, one tally per key.
+
+        Keys which fail to save are returned to the buffer and retried on the next flush.
+        Every key is tried before the error of a failed save is raised.
+
+        Returns:
+            A list of the saved trackbear_api.models.Tally
+
+        Raises:
+            exceptions.APIResponseError: If any save is rejected by the TrackBear API
+            exceptions.APITimeoutError: If any save times out
+            Exception: Any other error of a failed save, such as a lost connection
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._increments = 0
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+        saved: list[models.Tally] = []
+        error: Exception | None = None
+
+        for key, tally in pending.items():
+            if tally.count == 0:
+                continue
+
+            work_id, date, measure = key
+            try:
+                saved.append(
+                    self._tally_client.save(
+                        work_id=work_id,
+                        date=date,
+                        measure=measure,
+                        count=tally.count,
+                        note="\n".join(tally.notes),
+                        tags=tally.tags,
+                    )
+                )
+
+            # Any failure, including a lost connection, keeps the key for a retry
+            except Exception as err:
+                self.logger.error("Failed to flush coalesced tally %s: %s", key, err)
+                self._requeue(key, tally)
+                error = err
+
+        self.logger.debug("Flushed %d coalesced tallies", len(saved))
+
+        if error is not None:
+            raise error
+
+        return saved
+
+    def close(self) -> list[models.Tally]:
+        """
+        Flush pending increments and stop accepting new ones.
+
+        The buffer only closes once everything is saved. If the flush fails the error
+        is raised and the buffer stays open, keeping the unsaved increments for the
+        window timer, the exit hook, or another `close()` to retry.
+
+        Returns:
+            A list of the saved trackbear_api.models.Tally
+
+        Raises:
+            exceptions.APIResponseError: If any save is rejected by the TrackBear API
+            exceptions.APITimeoutError: If any save times out
+            Exception: Any other error of a failed save, such as a lost connection
+        """
+        saved: list[models.Tally] = []
+        while True:
+            saved.extend(self.flush())
+
+            # Increments saved while flushing are flushed before closing
+            with self._lock:
+                if not self._pending:
+                    self._closed = True
+                    break
+
+        atexit.unregister(self.close)
+
+        return saved
+
+    def _flush_on_timer(self) -> None:
+        """Flush when the window expires, logging failures instead of raising."""
+        try:
+            self.flush()
+
+        except Exception:
+            pass  # Logged in flush, tallies remain buffered for the next flush
+
+    def _requeue(self, key: _CoalesceKey, tally: _PendingTally) -> None:
+        """Return a failed tally to the buffer without losing newer increments."""
+        with self._lock:
+            pending = self._pending.setdefault(key, _PendingTally())
+            pending.count += tally.count
+            pending.increments += tally.increments
+            pending.notes[:0] = [note for note in tally.notes if note not in pending.notes]
+            pending.tags[:0] = [tag for tag in tally.tags if tag not in pending.tags]
+            self._increments += tally.increments
+            self._arm_timer()
+
+    def _arm_timer(self) -> None:
+        """Start the window timer unless running. Caller holds the lock."""
+        if self._timer is None:
+            self._timer = threading.Timer(self._window_seconds, self._flush_on_timer)
+            self._timer.daemon = True
+            self._timer.start()
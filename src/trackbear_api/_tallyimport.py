@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import csv
+import json
+import pathlib
+import re
+from collections.abc import Iterator
+from collections.abc import Mapping
+from typing import Any
+
+from . import enums
+
+_DATE_PATTERN = re.compile(r"[\d]{4}-[\d]{2}-[\d]{2}")
+
+# Tags in a CSV cell are separated by this character: "draft;sprint"
+_CSV_TAG_SEPARATOR = ";"
+
+# Key used to detect a tally that already exists on the account
+TallyKey = tuple[int, str, str, int, str]
+
+
+def normalize_row(index: int, row: Mapping[str, Any]) -> dict[str, Any]:
+    """
+    Validate a single row and normalize it into `TallyClient.save` keyword arguments.
+
+    Args:
+        index (int): Position of the row in the import, used for error messages
+        row (Mapping): Row with keys `work_id`, `date`, `measure`, `count` and
+            optionally `note` and `tags`
+
+    Raises:
+        ValueError: If a required key is missing or a value is invalid
+    """
+    try:
+        work_id = int(row["work_id"])
+        date = str(row["date"])
+        measure = enums.Measure(row["measure"])
+        count = int(row["count"])
+
+    except KeyError as err:
+        raise ValueError(f"Row {index}: missing required key {err}") from err
+
+    except ValueError as err:
+        raise ValueError(f"Row {index}: {err}") from err
+
+    if _DATE_PATTERN.match(date) is None:
+        raise ValueError(f"Row {index}: invalid date '{date}'. Must be YYYY-MM-DD")
+
+    tags = row.get("tags") or []
+    if isinstance(tags, str):
+        tags = [tag.strip() for tag in tags.split(_CSV_TAG_SEPARATOR) if tag.strip()]
+
+    return {
+        "work_id": work_id,
+        "date": date,
+        "measure": measure,
+        "count": count,
+        "note": str(row.get("note") or ""),
+        "tags": list(tags),
+    }
+
+
+def row_key(row: Mapping[str, Any]) -> TallyKey:
+    """Build the duplicate detection key of a normalized row."""
+    return (row["work_id"], row["date"], row["measure"].value, row["count"], row["note"])
+
+
+def read_csv(path: str | pathlib.Path) -> Iterator[dict[str, Any]]:
+    """
+    Read tally rows from a CSV file with a header row.
+
+    Expected columns: `work_id`, `date`, `measure`, `count`, `note`, `tags`. Multiple
+    tags are separated by `;` within the cell.
+    """
+    with open(path, encoding="utf-8", newline="") as infile:
+        yield from csv.DictReader(infile)
+
+
+def read_ndjson(path: str | pathlib.Path) -> Iterator[dict[str, Any]]:
+    """
+    Read tally rows from a newline delimited JSON file, one object per line.
+
+    Blank lines are ignored.
+    """
+    with open(path, encoding="utf-8") as infile:
+        for line in infile:
+            if line.strip():
+                yield json.loads(line)
+
+
+def read_rows(path: str | pathlib.Path) -> Iterator[dict[str, Any]]:
+    """
+    Read tally rows from a file, choosing the format from the file extension.
+
+    Raises:
+        ValueError: If the extension is not `.csv`, `.ndjson`, or `.jsonl`
+    """
+    suffix = pathlib.Path(path).suffix.lower()
+
+    if suffix == ".csv":
+        return read_csv(path)
+
+    if suffix in (".ndjson", ".jsonl"):
+        return read_ndjson(path)
+
+    raise ValueError(f"Unsupported import file type '{suffix}'. Use .csv, .ndjson, or .jsonl")
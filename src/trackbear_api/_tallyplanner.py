@@ -0,0 +1,224 @@
+"""Serve tally listings from cached listings of wider filters, fetching only the gaps."""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import logging
+import threading
+from collections.abc import Callable
+from collections.abc import Mapping
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+from typing import Any
+
+from . import enums
+from . import models
+from .tallyindex import TallyIndex
+
+if TYPE_CHECKING:
+    from ._cache import ResponseCache
+
+# Bounds standing in for a missing startDate or endDate
+_FIRST_DATE = "0001-01-01"
+_LAST_DATE = "9999-12-31"
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class TallyFilter:
+    """The non-date filters of a `/tally` listing. None matches everything."""
+
+    works: frozenset[int] | None
+    tags: frozenset[int] | None
+    measure: enums.Measure | None
+
+    @classmethod
+    def from_params(cls, params: Mapping[str, Any]) -> TallyFilter:
+        """Build from the URL parameters of a `/tally` listing."""
+        works = params.get("works[]")
+        tags = params.get("tags[]")
+        measure = params.get("measure")
+        return cls(
+            works=frozenset(works) if works else None,
+            tags=frozenset(tags) if tags else None,
+            measure=enums.Measure(measure) if measure is not None else None,
+        )
+
+    def covers(self, other: TallyFilter) -> bool:
+        """Return True if every tally matching `other` also matches this filter."""
+        return (
+            _covers(self.works, other.works)
+            and _covers(self.tags, other.tags)
+            and (self.measure is None or self.measure == other.measure)
+        )
+
+
+def _covers(wider: frozenset[int] | None, narrower: frozenset[int] | None) -> bool:
+    """Return True if matching any of `narrower` implies matching any of `wider`."""
+    return wider is None or (narrower is not None and narrower <= wider)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _Coverage:
+    """Tallies fetched for a filter between two inclusive dates."""
+
+    filters: TallyFilter
+    start: str
+    end: str
+    index: TallyIndex
+    expires_at: float
+    generation: int
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _Step:
+    """Part of a listing's date range, answered locally from `coverage` or fetched."""
+
+    start: str
+    end: str
+    coverage: _Coverage | None
+
+
+class TallyQueryPlanner:
+    """
+    Thread-safe planner answering tally listings from earlier, wider listings.
+
+    Each fetched listing is kept with its filter and date range for the time-to-live
+    of the response cache. A listing whose filter is narrower than, or equal to, a
+    kept one is filtered locally over the dates the kept listings cover. Only the
+    dates they do not cover are fetched. Everything kept is dropped whenever the
+    response cache is cleared, which any write through the client does.
+    """
+
+    logger = logging.getLogger("trackbear-api")
+
+    def __init__(self, cache: ResponseCache, max_entries: int = 32) -> None:
+        """
+        Initialize without any listings.
+
+        Args:
+            cache (ResponseCache): Cache whose time-to-live, clock, and clears apply
+            max_entries (int): Most listings kept; the oldest is dropped first
+                (default: 32)
+        """
+        self.cache = cache
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._coverages: list[_Coverage] = []
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._coverages)
+
+    def list(
+        self,
+        params: Mapping[str, Any],
+        fetch: Callable[[Mapping[str, Any]], Sequence[models.Tally]],
+    ) -> Sequence[models.Tally]:
+        """
+        Answer a listing, calling `fetch` only for the dates not covered locally.
+
+        Args:
+            params (Mapping): Validated URL parameters of the `/tally` listing
+            fetch (Callable): Lists tallies of URL parameters from the API
+
+        Returns:
+            The tallies of the listing in date order
+        """
+        filters = TallyFilter.from_params(params)
+        start = params.get("startDate") or _FIRST_DATE
+        end = params.get("endDate") or _LAST_DATE
+        generation = self.cache.generation
+
+        results: list[models.Tally] = []
+        for step in self._plan(filters, start, end, generation):
+            if step.coverage is not None:
+                results.extend(_local(step.coverage.index, filters, step.start, step.end))
+                continue
+
+            gap = dict(params)
+            gap["startDate"] = step.start if step.start != _FIRST_DATE else None
+            gap["endDate"] = step.end if step.end != _LAST_DATE else None
+            gap = {key: value for key, value in gap.items() if value is not None}
+
+            self.logger.debug("Fetching uncovered tally dates %s to %s", step.start, step.end)
+            index = self._store(filters, step.start, step.end, fetch(gap), generation)
+            results.extend(index)
+
+        return results
+
+    def clear(self) -> None:
+        """Drop all kept listings."""
+        with self._lock:
+            self._coverages.clear()
+
+    def _plan(self, filters: TallyFilter, start: str, end: str, generation: int) -> Sequence[_Step]:
+        """Split the date range into steps covered by a kept listing and gaps."""
+        now = self.cache.now()
+        with self._lock:
+            self._coverages = [
+                coverage
+                for coverage in self._coverages
+                if coverage.generation == generation and coverage.expires_at > now
+            ]
+            candidates = [
+                coverage for coverage in self._coverages if coverage.filters.covers(filters)
+            ]
+
+        steps: list[_Step] = []
+        cursor = start
+        while cursor <= end:
+            covering = [c for c in candidates if c.start <= cursor <= c.end]
+            if covering:
+                best = max(covering, key=lambda coverage: coverage.end)
+                stop = min(best.end, end)
+                steps.append(_Step(cursor, stop, best))
+            else:
+                later = [c.start for c in candidates if c.start > cursor]
+                stop = min(_shift(min(later), -1), end) if later else end
+                steps.append(_Step(cursor, stop, None))
+
+            if stop >= end:
+                break
+
+            cursor = _shift(stop, 1)
+
+        return steps
+
+    def _store(
+        self,
+        filters: TallyFilter,
+        start: str,
+        end: str,
+        tallies: Sequence[models.Tally],
+        generation: int,
+    ) -> TallyIndex:
+        """Keep a fetched listing unless the cache was cleared while fetching."""
+        index = TallyIndex(tallies)
+        if self.cache.generation != generation:
+            return index
+
+        expires_at = self.cache.now() + self.cache.ttl_seconds
+        coverage = _Coverage(filters, start, end, index, expires_at, generation)
+        with self._lock:
+            self._coverages.append(coverage)
+            del self._coverages[: -self.max_entries]
+
+        return index
+
+
+def _local(index: TallyIndex, filters: TallyFilter, start: str, end: str) -> Sequence[models.Tally]:
+    """Filter a kept listing."""
+    return index.query(
+        works=sorted(filters.works) if filters.works is not None else None,
+        tags=sorted(filters.tags) if filters.tags is not None else None,
+        measure=filters.measure,
+        start_date=start if start != _FIRST_DATE else None,
+        end_date=end if end != _LAST_DATE else None,
+    )
+
+
+def _shift(date: str, days: int) -> str:
+    """Return the date `days` after `date`."""
+    shifted = datetime.date.fromisoformat(date) + datetime.timedelta(days=days)
+    return shifted.isoformat()
@@ -0,0 +1,178 @@
+"""Stop sending requests to route groups which keep failing during API outages."""
+
+from __future__ import annotations
+
+import collections
+import dataclasses
+import logging
+import threading
+import time
+from collections.abc import Callable
+
+from . import enums
+
+__all__ = ["CircuitBreaker"]
+
+
+@dataclasses.dataclass(slots=True)
+class _Circuit:
+    """State of a single route group."""
+
+    state: enums.CircuitState = enums.CircuitState.CLOSED
+    outcomes: collections.deque[tuple[float, bool]] = dataclasses.field(
+        default_factory=collections.deque
+    )
+    opened_at: float = 0.0
+    probe_started: float | None = None
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker per route group (`project`, `tally`, `stats`, ...).
+
+    A closed circuit lets requests through and tracks their outcomes. Timeouts,
+    connection errors, and 5xx responses are failures. Once at least `min_requests`
+    were sent in the last `window_seconds` and `failure_rate` of them failed, the
+    circuit opens and requests of the group fail fast with `CircuitOpenError`. After
+    `open_seconds` the circuit is half-open and lets a single probe through. A
+    successful probe closes the circuit, a failed one opens it again.
+
+    With `serve_stale`, GETs rejected by an open circuit are answered from the
+    client's response cache, even past their expiry, when a response is cached.
+    """
+
+    logger = logging.getLogger("trackbear-api")
+
+    def __init__(
+        self,
+        *,
+        failure_rate: float = 0.5,
+        min_requests: int = 10,
+        window_seconds: float = 60.0,
+        open_seconds: float = 30.0,
+        serve_stale: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize with every circuit closed.
+
+        Args:
+            failure_rate (float): Share of failed requests opening a circuit
+                (default: 0.5)
+            min_requests (int): Fewest requests in the window before a circuit can
+                open (default: 10)
+            window_seconds (float): Seconds of outcomes considered (default: 60.0)
+            open_seconds (float): Seconds a circuit stays open before a probe is let
+                through (default: 30.0)
+            serve_stale (bool): Answer GETs rejected by an open circuit from the
+                response cache when possible (default: False)
+            clock (Callable): Monotonic clock returning seconds, replaceable for tests
+
+        Raises:
+            ValueError: If `failure_rate` is not greater than 0 and at most 1
+        """
+        if not 0 < failure_rate <= 1:
+            raise ValueError("failure_rate must be greater than 0 and at most 1")
+
+        self.failure_rate = failure_rate
+        self.min_requests = min_requests
+        self.window_seconds = window_seconds
+        self.open_seconds = open_seconds
+        self.serve_stale = serve_stale
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._circuits: dict[str, _Circuit] = {}
+
+    def state(self, group: str) -> enums.CircuitState:
+        """Return the state of a route group's circuit."""
+        with self._lock:
+            circuit = self._circuits.get(group)
+            if circuit is None:
+                return enums.CircuitState.CLOSED
+
+            if circuit.state is enums.CircuitState.OPEN and self._retry_after(circuit) <= 0:
+                return enums.CircuitState.HALF_OPEN
+
+            return circuit.state
+
+    def retry_after(self, group: str) -> float:
+        """Return the seconds until an open circuit lets a probe through, else 0."""
+        with self._lock:
+            circuit = self._circuits.get(group)
+            return self._retry_after(circuit) if circuit is not None else 0.0
+
+    def allow(self, group: str) -> bool:
+        """Return True if a request of the route group may be sent."""
+        with self._lock:
+            circuit = self._circuits.setdefault(group, _Circuit())
+            if circuit.state is enums.CircuitState.CLOSED:
+                return True
+
+            now = self._clock()
+            if circuit.state is enums.CircuitState.OPEN:
+                if self._retry_after(circuit) > 0:
+                    return False
+
+                circuit.state = enums.CircuitState.HALF_OPEN
+                circuit.probe_started = None
+
+            # A probe which never reported back is given up after `open_seconds`
+            probe_started = circuit.probe_started
+            if probe_started is not None and now - probe_started < self.open_seconds:
+                return False
+
+            circuit.probe_started = now
+            self.logger.info("Circuit of '%s' is half-open, sending a probe", group)
+            return True
+
+    def record(self, group: str, *, failed: bool) -> None:
+        """Record the outcome of a request of the route group."""
+        with self._lock:
+            circuit = self._circuits.setdefault(group, _Circuit())
+            now = self._clock()
+
+            if circuit.state is enums.CircuitState.HALF_OPEN:
+                if failed:
+                    self._open(group, circuit, now)
+                else:
+                    circuit.state = enums.CircuitState.CLOSED
+                    circuit.probe_started = None
+                    self.logger.info("Circuit of '%s' closed", group)
+                return
+
+            if circuit.state is enums.CircuitState.OPEN:
+                # Late outcome of a request sent before the circuit opened
+                return
+
+            circuit.outcomes.append((now, failed))
+            while circuit.outcomes[0][0] <= now - self.window_seconds:
+                circuit.outcomes.popleft()
+
+            total = len(circuit.outcomes)
+            failures = sum(outcome for _, outcome in circuit.outcomes)
+            if total >= self.min_requests and failures >= total * self.failure_rate:
+                self._open(group, circuit, now)
+
+    def reset(self) -> None:
+        """Close every circuit and forget all outcomes."""
+        with self._lock:
+            self._circuits.clear()
+
+    def _open(self, group: str, circuit: _Circuit, now: float) -> None:
+        """Open a circuit. Caller holds the lock."""
+        circuit.state = enums.CircuitState.OPEN
+        circuit.opened_at = now
+        circuit.probe_started = None
+        circuit.outcomes.clear()
+        self.logger.warning(
+            "Circuit of '%s' opened, failing requests fast for %.1f seconds",
+            group,
+            self.open_seconds,
+        )
+
+    def _retry_after(self, circuit: _Circuit) -> float:
+        """Seconds until an open circuit may probe. Caller holds the lock."""
+        if circuit.state is not enums.CircuitState.OPEN:
+            return 0.0
+
+        return max(0.0, circuit.opened_at + self.open_seconds - self._clock())
@@ -0,0 +1,329 @@
+"""
+Command-line interface of the library, installed as `trackbear`.
+
+The client and its dependencies are only loaded by the subcommand which needs
+them, so `trackbear --help` starts fast.
+"""
+
+from __future__ import annotations
+
+import argparse
+import collections
+import concurrent.futures
+import contextlib
+import contextvars
+import csv
+import datetime
+import json
+import logging
+import os
+import re
+import sys
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+from typing import Any
+
+from .restore import MANIFEST_NAME
+
+if TYPE_CHECKING:
+    from .trackbearclient import TrackBearClient
+
+__all__ = ["main"]
+
+EXPORT_RESOURCES = ("project", "tag", "goal", "tally", "stat", "leaderboard")
+EXPORT_FORMATS = ("ndjson", "csv")
+RESTORE_STATE_NAME = "restore-state.jsonl"
+
+_DATE_PATTERN = re.compile(r"[\d]{4}-[\d]{2}-[\d]{2}")
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Run the command line.
+
+    Args:
+        argv (Sequence[str]): (Optional) Arguments, defaults to `sys.argv[1:]`
+
+    Returns:
+        The exit code: 0 on success, 1 if any work failed, 2 on usage errors
+    """
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.WARNING,
+        format="%(levelname)s %(message)s",
+    )
+
+    if args.command is None:
+        parser.print_help()
+        return 2
+
+    command: Callable[[argparse.Namespace], int] = args.handler
+    return command(args)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the parser of every subcommand."""
+    parser = argparse.ArgumentParser(prog="trackbear", description="TrackBear API tools")
+    parser.add_argument(
+        "--token",
+        help="API token. Defaults to the TRACKBEAR_API_TOKEN environment variable",
+    )
+    parser.add_argument("--url", help="API url. Defaults to TRACKBEAR_API_URL or the public API")
+    parser.add_argument("--timeout", type=int, help="Seconds to wait for each response")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Log requests to stderr")
+    subparsers = parser.add_subparsers(dest="command")
+
+    export = subparsers.add_parser(
+        "export",
+        help="Export the account to files",
+        description="Export the account, one file per resource, into a directory.",
+    )
+    export.add_argument("output", help="Directory the files are written to")
+    export.add_argument("--format", choices=EXPORT_FORMATS, default="ndjson")
+    export.add_argument(
+        "--resources",
+        nargs="+",
+        choices=EXPORT_RESOURCES,
+        default=list(EXPORT_RESOURCES),
+        metavar="RESOURCE",
+        help=f"Resources to export (default: all of {', '.join(EXPORT_RESOURCES)})",
+    )
+    export.add_argument(
+        "--since",
+        type=_date,
+        help="Only export records updated, or tallies and stats dated, on or after "
+        "this date (YYYY-MM-DD)",
+    )
+    export.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Number of resources fetched concurrently (default: 4)",
+    )
+    export.set_defaults(handler=_export)
+
+    restore = subparsers.add_parser(
+        "restore",
+        help="Restore an export snapshot into the account",
+        description="Create the projects, tags, goals, and tallies of an ndjson export "
+        "snapshot in the account. Run again with the same state file to resume.",
+    )
+    restore.add_argument("snapshot", help="Directory written by the export subcommand")
+    restore.add_argument(
+        "--state",
+        help="File mapping snapshot ids to restored ids "
+        f"(default: <snapshot>/{RESTORE_STATE_NAME})",
+    )
+    restore.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Number of records created concurrently (default: 4)",
+    )
+    restore.set_defaults(handler=_restore)
+
+    return parser
+
+
+def _date(value: str) -> str:
+    """Argument type of a YYYY-MM-DD date."""
+    if _DATE_PATTERN.fullmatch(value) is None:
+        raise argparse.ArgumentTypeError(f"invalid date '{value}', must be YYYY-MM-DD")
+    return value
+
+
+def _client(args: argparse.Namespace) -> TrackBearClient:
+    """Build the client from the global options."""
+    from .trackbearclient import TrackBearClient
+
+    return TrackBearClient(api_token=args.token, api_url=args.url, timeout_seconds=args.timeout)
+
+
+def _export(args: argparse.Namespace) -> int:
+    """Run the export subcommand."""
+    try:
+        client = _client(args)
+
+    except ValueError as err:
+        print(f"trackbear: {err}", file=sys.stderr)
+        return 2
+
+    os.makedirs(args.output, exist_ok=True)
+    counts: dict[str, int] = {}
+    failed = False
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(args.workers, 1)) as executor:
+        futures = {
+            executor.submit(
+                contextvars.copy_context().run,
+                export_resource,
+                client,
+                resource,
+                args.output,
+                args.format,
+                args.since,
+            ): resource
+            for resource in args.resources
+        }
+
+        for future in concurrent.futures.as_completed(futures):
+            resource = futures[future]
+            try:
+                counts[resource] = future.result()
+
+            except Exception as err:
+                print(f"trackbear: failed to export {resource}: {err}", file=sys.stderr)
+                failed = True
+                continue
+
+            print(f"Exported {counts[resource]} {resource} records", file=sys.stderr)
+
+    manifest = {
+        "exported_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "format": args.format,
+        "since": args.since,
+        "counts": counts,
+    }
+    with open(os.path.join(args.output, MANIFEST_NAME), "w", encoding="utf-8") as file:
+        json.dump(manifest, file, indent=2)
+
+    return 1 if failed else 0
+
+
+def _restore(args: argparse.Namespace) -> int:
+    """Run the restore subcommand."""
+    from .restore import SnapshotRestore
+
+    try:
+        client = _client(args)
+        snapshot = SnapshotRestore(
+            client,
+            args.snapshot,
+            args.state or os.path.join(args.snapshot, RESTORE_STATE_NAME),
+        )
+
+    except ValueError as err:
+        print(f"trackbear: {err}", file=sys.stderr)
+        return 2
+
+    with snapshot:
+        results = snapshot.run(max_workers=max(args.workers, 1))
+
+    counts: dict[str, collections.Counter[str]] = {}
+    for result in results:
+        counts.setdefault(result.resource, collections.Counter())[result.status.value] += 1
+
+    for resource, statuses in counts.items():
+        print(
+            f"Restored {statuses['saved']} {resource} records "
+            f"({statuses['skipped']} skipped, {statuses['failed']} failed)",
+            file=sys.stderr,
+        )
+
+    return 1 if any(statuses["failed"] for statuses in counts.values()) else 0
+
+
+def export_resource(
+    client: TrackBearClient,
+    resource: str,
+    directory: str,
+    file_format: str,
+    since: str | None = None,
+) -> int:
+    """
+    Fetch a resource and stream its records to `<directory>/<resource>.<format>`.
+
+    Records are the API data as returned by the `list_raw()` methods. The file is
+    written under a temporary name and renamed once complete, so an interrupted
+    export never leaves a partial file behind.
+
+    Args:
+        client (TrackBearClient): Client used to fetch the records
+        resource (str): One of `project`, `tag`, `goal`, `tally`, `stat`, or
+            `leaderboard`
+        directory (str): Directory the file is written to
+        file_format (str): `ndjson`, or `csv` with nested values as JSON
+        since (str): (Optional) Only records updated on or after this date
+            (YYYY-MM-DD). Stats are always exported in full.
+
+    Returns:
+        The number of records written
+
+    Raises:
+        exceptions.APIResponseError: On any failure message returned from TrackBear API
+        ValueError: If `resource` or `file_format` are unknown
+    """
+    if resource not in EXPORT_RESOURCES:
+        raise ValueError(f"Unknown resource '{resource}'")
+
+    if file_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown format '{file_format}'")
+
+    records: Iterable[Any] = getattr(client, resource).list_raw()
+    # Stats have no updatedAt and a backdated tally changes an old day, so every
+    # stat is exported. Tallies filter on updatedAt too, not on their date.
+    if since is not None and resource != "stat":
+        records = (record for record in records if record["updatedAt"][:10] >= since)
+
+    path = os.path.join(directory, f"{resource}.{file_format}")
+    temp_path = f"{path}.part"
+    try:
+        with open(temp_path, "w", encoding="utf-8", newline="") as file:
+            if file_format == "ndjson":
+                count = _write_ndjson(file, records)
+            else:
+                count = _write_csv(file, records, _fieldnames(resource))
+
+        os.replace(temp_path, path)
+
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
+        raise
+
+    return count
+
+
+def _write_ndjson(file: Any, records: Iterable[Any]) -> int:
+    """Write one JSON object per line."""
+    count = 0
+    for record in records:
+        file.write(json.dumps(record, separators=(",", ":")))
+        file.write("\n")
+        count += 1
+    return count
+
+
+def _write_csv(file: Any, records: Iterable[Any], fieldnames: Sequence[str]) -> int:
+    """Write a CSV row per record, nested values as JSON."""
+    writer = csv.DictWriter(file, fieldnames=fieldnames, extrasaction="ignore")
+    writer.writeheader()
+    count = 0
+    for record in records:
+        writer.writerow(
+            {
+                key: json.dumps(value) if isinstance(value, (dict, list)) else value
+                for key, value in record.items()
+            }
+        )
+        count += 1
+    return count
+
+
+def _fieldnames(resource: str) -> Sequence[str]:
+    """Return the CSV columns of a resource from its schema, required keys first."""
+    from . import schemas
+
+    schema: Any = {
+        "project": schemas.ProjectDict,
+        "tag": schemas.TagDict,
+        "goal": schemas.GoalDict,
+        "tally": schemas.TallyDict,
+        "stat": schemas.StatDict,
+        "leaderboard": schemas.LeaderboardExtendedDict,
+    }[resource]
+    return sorted(schema.__annotations__, key=lambda key: key in schema.__optional_keys__)
@@ -0,0 +1,288 @@
+"""Serve many API tokens from one pool with fair scheduling of their work."""
+
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import contextvars
+import dataclasses
+import logging
+import threading
+from collections.abc import Callable
+from typing import Any
+from typing import TypeVar
+
+from ._ratelimit import RateLimit
+from .trackbearclient import TrackBearClient
+
+__all__ = ["TrackBearClientPool"]
+
+T = TypeVar("T")
+
+
+@dataclasses.dataclass(slots=True)
+class _Task:
+    """Work queued for a single token."""
+
+    func: Callable[[TrackBearClient], Any]
+    future: concurrent.futures.Future[Any]
+    context: contextvars.Context
+
+
+@dataclasses.dataclass(slots=True)
+class _Entry:
+    """A pooled client and the number of its tasks queued or running."""
+
+    client: TrackBearClient
+    pending: int = 0
+
+
+class TrackBearClientPool:
+    """
+    Manage TrackBearClients for many API tokens.
+
+    Every client shares one connection pool while keeping its own session headers and
+    rate limit state. Queued work is scheduled round-robin across tokens, so a token
+    with a long queue cannot starve the others, and tokens which have spent their
+    rate limit are passed over until their window resets. Idle clients beyond
+    `max_clients` are closed, least recently used first.
+    """
+
+    logger = logging.getLogger("trackbear-api")
+
+    def __init__(
+        self,
+        *,
+        max_clients: int = 32,
+        max_workers: int = 4,
+        pool_maxsize: int = 10,
+        api_url: str | None = None,
+        user_agent: str | None = None,
+        timeout_seconds: int | None = None,
+        cache_seconds: int | None = None,
+    ) -> None:
+        """
+        Initialize the pool.
+
+        Args:
+            max_clients (int): Number of idle clients kept open (default: 32)
+            max_workers (int): Number of threads running submitted work (default: 4)
+            pool_maxsize (int): Connections kept open in the shared pool (default: 10)
+            api_url (str): (Optional) Passed to each TrackBearClient
+            user_agent (str): (Optional) Passed to each TrackBearClient
+            timeout_seconds (int): (Optional) Passed to each TrackBearClient
+            cache_seconds (int): (Optional) Passed to each TrackBearClient
+        """
+        self._max_clients = max_clients
+        self._max_workers = max_workers
+        self._api_url = api_url
+        self._user_agent = user_agent
+        self._timeout_seconds = timeout_seconds
+        self._cache_seconds = cache_seconds
+
+        import requests.adapters
+
+        self._adapter = requests.adapters.HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_maxsize,
+        )
+
+        self._lock = threading.Condition()
+        self._entries: collections.OrderedDict[str, _Entry] = collections.OrderedDict()
+        self._queues: collections.OrderedDict[str, collections.deque[_Task]] = (
+            collections.OrderedDict()
+        )
+        self._workers: list[threading.Thread] = []
+        self._closed = False
+
+    def __enter__(self) -> TrackBearClientPool:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def client(self, api_token: str) -> TrackBearClient:
+        """
+        Return the client of a token, creating it if needed.
+
+        A client evicted while held keeps working, but with connections of its own.
+
+        Raises:
+            ValueError: If the token is an empty string or the pool is closed
+        """
+        with self._lock:
+            return self._get_entry(api_token).client
+
+    def rate_limit(self, api_token: str) -> RateLimit | None:
+        """Return the rate limit state of a token, None if it has no open client."""
+        with self._lock:
+            entry = self._entries.get(api_token)
+            return entry.client.bare.rate_limit if entry is not None else None
+
+    def submit(
+        self,
+        api_token: str,
+        func: Callable[[TrackBearClient], T],
+    ) -> concurrent.futures.Future[T]:
+        """
+        Queue work to run with the client of a token.
+
+        Args:
+            api_token (str): Token the work is done for
+            func (Callable): Called with the token's TrackBearClient
+
+        Returns:
+            A Future of the result of `func`
+
+        Raises:
+            ValueError: If the token is an empty string or the pool is closed
+        """
+        future: concurrent.futures.Future[T] = concurrent.futures.Future()
+
+        with self._lock:
+            entry = self._get_entry(api_token)
+            entry.pending += 1
+            self._queues.setdefault(api_token, collections.deque()).append(
+                _Task(func, future, contextvars.copy_context())
+            )
+
+            if len(self._workers) < self._max_workers:
+                worker = threading.Thread(target=self._work, name="trackbear-pool", daemon=True)
+                self._workers.append(worker)
+                worker.start()
+
+            self._lock.notify()
+
+        return future
+
+    def close(self) -> None:
+        """Cancel queued work, wait for running work, and close every client."""
+        with self._lock:
+            self._closed = True
+            for queue in self._queues.values():
+                for task in queue:
+                    task.future.cancel()
+
+            self._queues.clear()
+            self._lock.notify_all()
+            workers = list(self._workers)
+
+        for worker in workers:
+            worker.join()
+
+        with self._lock:
+            for api_token in list(self._entries):
+                self._evict(api_token)
+
+        self._adapter.close()
+
+    def _get_entry(self, api_token: str) -> _Entry:
+        """Return the entry of a token as most recently used. Caller holds the lock."""
+        if self._closed:
+            raise ValueError("TrackBearClientPool is closed")
+
+        if not api_token:
+            raise ValueError("Missing api token.")
+
+        entry = self._entries.get(api_token)
+        if entry is not None:
+            self._entries.move_to_end(api_token)
+            return entry
+
+        client = TrackBearClient(
+            api_token=api_token,
+            api_url=self._api_url,
+            user_agent=self._user_agent,
+            timeout_seconds=self._timeout_seconds,
+            cache_seconds=self._cache_seconds,
+        )
+        client.bare.session.mount("https://", self._adapter)
+        client.bare.session.mount("http://", self._adapter)
+
+        entry = _Entry(client)
+        self._entries[api_token] = entry
+        self._evict_idle(keep=api_token)
+
+        return entry
+
+    def _evict_idle(self, keep: str | None = None) -> None:
+        """Close least recently used idle clients beyond the limit. Caller holds the lock."""
+        excess = len(self._entries) - self._max_clients
+        for api_token in list(self._entries):
+            if excess <= 0:
+                break
+
+            if api_token != keep and self._entries[api_token].pending == 0:
+                self._evict(api_token)
+                excess -= 1
+
+    def _evict(self, api_token: str) -> None:
+        """
+        Close the client of a token without closing the shared adapter.
+
+        A caller may still hold the client, so its session is given adapters of its
+        own in place of the shared one. They open no connection unless it is used again.
+        """
+        import requests.adapters
+
+        entry = self._entries.pop(api_token)
+        session = entry.client.bare.session
+        session.mount("https://", requests.adapters.HTTPAdapter())
+        session.mount("http://", requests.adapters.HTTPAdapter())
+        session.close()
+        self.logger.debug("Closed pooled client for token: ***%s", api_token[-4:])
+
+    def _next_task(self) -> tuple[_Entry, _Task] | None:
+        """
+        Take the next task round-robin, skipping tokens without rate limit budget.
+
+        Blocks until a task is ready. Returns None once the pool is closed.
+        """
+        with self._lock:
+            while not self._closed:
+                wait: float | None = None
+
+                for api_token, queue in self._queues.items():
+                    entry = self._entries[api_token]
+                    rate_limit = entry.client.bare.rate_limit
+                    reset = rate_limit.reset
+                    if rate_limit.remaining == 0 and reset > 0:
+                        wait = reset if wait is None else min(wait, reset)
+                        continue
+
+                    task = queue.popleft()
+                    if queue:
+                        self._queues.move_to_end(api_token)
+                    else:
+                        del self._queues[api_token]
+
+                    return entry, task
+
+                self._lock.wait(wait)
+
+            return None
+
+    def _work(self) -> None:
+        """Run queued tasks until the pool is closed."""
+        while True:
+            next_task = self._next_task()
+            if next_task is None:
+                return
+
+            entry, task = next_task
+            try:
+                if task.future.set_running_or_notify_cancel():
+                    try:
+                        task.future.set_result(task.context.run(task.func, entry.client))
+
+                    except BaseException as err:
+                        task.future.set_exception(err)
+
+            finally:
+                with self._lock:
+                    entry.pending -= 1
+                    self._evict_idle()
@@ -12,6 +12,9 @@ __all__ = [
     "MemberColor",
     "HabitUnit",
     "GoalType",
+    "SaveStatus",
+    "Priority",
+    "CircuitState",
 ]
 
 
@@ -83,3 +86,20 @@ class HabitUnit(str, enum.Enum):
 class GoalType(str, enum.Enum):
     TARGET = "target"
     HABIT = "habit"
+
+
+class SaveStatus(str, enum.Enum):
+    SAVED = "saved"
+    SKIPPED = "skipped"
+    FAILED = "failed"
+
+
+class Priority(str, enum.Enum):
+    INTERACTIVE = "interactive"
+    BACKGROUND = "background"
+
+
+class CircuitState(str, enum.Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
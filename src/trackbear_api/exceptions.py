@@ -8,6 +8,8 @@ __all__ = [
     "ModelBuildError",
     "APIResponseError",
     "APITimeoutError",
+    "DeadlineExceededError",
+    "CircuitOpenError",
 ]
 
 
@@ -75,3 +77,45 @@ class APITimeoutError(Exception):
 
     def __str__(self) -> str:
         return f"HTTP {self.method} timed out after {self.timeout} seconds. '{self.url}' - {self.exception}"
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class DeadlineExceededError(Exception):
+    """
+    Raised when a request cannot complete within the deadline set by the caller.
+
+    Args:
+        method (str): HTTP method
+        url (str): Target URL
+        deadline (float): Overall budget of the deadline in seconds
+    """
+
+    method: str
+    url: str
+    deadline: float
+
+    def __str__(self) -> str:
+        return (
+            f"HTTP {self.method} exceeded the deadline of {self.deadline:g} seconds. '{self.url}'"
+        )
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class CircuitOpenError(Exception):
+    """
+    Raised instead of sending a request while the circuit of its route group is open.
+
+    Args:
+        method (str): HTTP method
+        url (str): Target URL
+        group (str): Route group of the open circuit
+        retry_after (float): Seconds until the circuit lets a probe through
+    """
+
+    method: str
+    url: str
+    group: str
+    retry_after: float
+
+    def __str__(self) -> str:
+        return f"HTTP {self.method} not sent, circuit of '{self.group}' is open for {self.retry_after:.1f} more seconds. '{self.url}'"
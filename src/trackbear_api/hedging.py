@@ -0,0 +1,126 @@
+"""Send a second GET when the first is slower than usual and use the first response."""
+
+from __future__ import annotations
+
+import collections
+import logging
+import math
+import threading
+from collections.abc import Collection
+from typing import TYPE_CHECKING
+
+from . import enums
+
+if TYPE_CHECKING:
+    from ._ratelimit import RateLimit
+
+__all__ = ["HedgePolicy"]
+
+
+class HedgePolicy:
+    """
+    Thread-safe policy deciding when a GET is hedged with a second request.
+
+    The latencies of the last `sample_size` GETs are tracked. Once `min_samples` were
+    seen, a GET still waiting after the `percentile` latency (at least `min_delay`
+    seconds) is sent a second time and whichever response arrives first is used.
+
+    Hedges are capped at `max_share` of the recent hedge-eligible GETs. They are
+    only sent with rate limit budget to spare: a hedge takes its request as a
+    background request, so it never waits for budget and never spends the share of
+    the budget reserved for interactive requests.
+    """
+
+    logger = logging.getLogger("trackbear-api")
+
+    def __init__(
+        self,
+        *,
+        percentile: float = 0.95,
+        min_delay: float = 0.05,
+        max_share: float = 0.1,
+        sample_size: int = 100,
+        min_samples: int = 20,
+        groups: Collection[str] | None = None,
+    ) -> None:
+        """
+        Initialize without latency samples.
+
+        Args:
+            percentile (float): Latency percentile after which a GET is hedged
+                (default: 0.95)
+            min_delay (float): Fewest seconds waited before hedging (default: 0.05)
+            max_share (float): Most share of the recent GETs which may be hedged
+                (default: 0.1)
+            sample_size (int): Number of recent GETs tracked (default: 100)
+            min_samples (int): GETs seen before hedging starts (default: 20)
+            groups (Collection[str]): (Optional) Route groups to hedge, such as
+                `tally` or `leaderboard`. All GETs when not provided.
+
+        Raises:
+            ValueError: If `percentile` or `max_share` are not between 0 and 1
+        """
+        if not 0 < percentile < 1:
+            raise ValueError("percentile must be between 0 and 1")
+
+        if not 0 <= max_share <= 1:
+            raise ValueError("max_share must be between 0 and 1")
+
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_share = max_share
+        self.min_samples = min_samples
+        self.groups = frozenset(groups) if groups is not None else None
+        self._lock = threading.Lock()
+        self._latencies: collections.deque[float] = collections.deque(maxlen=sample_size)
+        self._hedged: collections.deque[bool] = collections.deque(maxlen=sample_size)
+        self._hedge_count = 0
+
+    def applies(self, route: str) -> bool:
+        """Return True if GETs of the route are hedged."""
+        return self.groups is None or route.lstrip("/").split("/", 1)[0] in self.groups
+
+    def delay(self) -> float | None:
+        """Return the seconds to wait before hedging, None until enough samples."""
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+
+            ordered = sorted(self._latencies)
+
+        index = min(len(ordered) - 1, math.ceil(self.percentile * len(ordered)) - 1)
+        return max(self.min_delay, ordered[index])
+
+    def record_latency(self, seconds: float) -> None:
+        """Record the latency of a completed GET."""
+        with self._lock:
+            self._latencies.append(seconds)
+
+    def record_waited(self) -> None:
+        """Record a hedge-eligible GET which answered before the delay."""
+        self._record(False)
+
+    def try_hedge(self, rate_limit: RateLimit) -> bool:
+        """
+        Record a slow GET, returning True if a hedge may be sent for it.
+
+        A True return has taken one request from the rate limit budget.
+        """
+        with self._lock:
+            allowed = self._hedge_count + 1 <= self.max_share * (len(self._hedged) + 1)
+
+        if allowed and not rate_limit.acquire(enums.Priority.BACKGROUND, timeout=0):
+            self.logger.debug("Not hedging, no rate limit budget to spare")
+            allowed = False
+
+        self._record(allowed)
+        return allowed
+
+    def _record(self, hedged: bool) -> None:
+        """Track whether an eligible GET was hedged."""
+        with self._lock:
+            if len(self._hedged) == self._hedged.maxlen:
+                self._hedge_count -= self._hedged[0]
+
+            self._hedged.append(hedged)
+            self._hedge_count += hedged
@@ -0,0 +1,415 @@
+"""Durable write-behind journal replaying writes once the API is reachable."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import contextvars
+import dataclasses
+import inspect
+import json
+import logging
+import os
+import threading
+import uuid
+from collections.abc import Mapping
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+from typing import Any
+
+from . import enums
+from . import exceptions
+
+if TYPE_CHECKING:
+    from .trackbearclient import TrackBearClient
+
+__all__ = [
+    "JournalEntry",
+    "JournalResult",
+    "WriteJournal",
+]
+
+# Journaled calls and the argument naming the resource they write, if existing
+_CALLS = {
+    "tally.save": "tally_id",
+    "tally.delete": "tally_id",
+    "project.save": "project_id",
+    "project.delete": "project_id",
+    "goal.save_target": "goal_id",
+    "goal.save_habit": "goal_id",
+    "goal.delete": "goal_id",
+    "tag.save": "tag_id",
+    "tag.delete": "tag_id",
+    "leaderboard.save": "board_uuid",
+    "leaderboard.delete": "board_uuid",
+}
+
+# Failures worth retrying on a later replay; any other API error drops the entry
+_TRANSIENT_ERRORS = (
+    exceptions.APITimeoutError,
+    exceptions.CircuitOpenError,
+    exceptions.DeadlineExceededError,
+    OSError,
+)
+
+
+def _transient_status(err: exceptions.APIResponseError) -> bool:
+    """Return True if the API may accept the write later."""
+    return err.status_code == 429 or err.status_code >= 500
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class JournalEntry:
+    """A write acknowledged by the journal and waiting to be replayed."""
+
+    entry_id: str
+    call: str
+    kwargs: Mapping[str, Any]
+
+    @property
+    def resource(self) -> str:
+        """
+        Resource written by the call, such as `tally/123`.
+
+        Creates write a new resource and are keyed by their entry id.
+        """
+        resource_id = self.kwargs.get(_CALLS[self.call])
+        if resource_id is None:
+            return f"new/{self.entry_id}"
+
+        return f"{self.call.split('.')[0]}/{resource_id}"
+
+
+def _identity(entry: JournalEntry) -> str:
+    """Key shared by identical writes."""
+    return json.dumps([entry.call, entry.kwargs], sort_keys=True)
+
+
+def _latest_key(entry: JournalEntry) -> str:
+    """
+    Key of the pending write a new identical write may be deduplicated against.
+
+    Writes of an existing resource are only deduplicated against the latest write of
+    that resource, so a repeated write is never moved ahead of a later one. Creates
+    are independent of each other and deduplicated against any identical create.
+    """
+    if entry.kwargs.get(_CALLS[entry.call]) is None:
+        return _identity(entry)
+
+    return entry.resource
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class JournalResult:
+    """Outcome of replaying a single journal entry."""
+
+    entry: JournalEntry
+    status: enums.SaveStatus
+    result: Any = None
+    error: Exception | None = None
+
+
+class WriteJournal:
+    """
+    Append-only journal of writes in front of a TrackBearClient.
+
+    `submit()` acknowledges a write once it is appended, and flushed to disk, as a
+    JSON line. `replay()` sends the pending writes concurrently across resources and
+    in order within each resource. Completed writes are marked in the journal, so a
+    process exiting mid-replay resumes where it left off.
+
+    Pending writes are deduplicated: submitting a write identical to the latest
+    pending write of its resource, or to a pending create, returns the pending
+    entry. A save followed by another write of the same resource is skipped on
+    replay since the later write replaces it.
+
+    Writes failing with a timeout, open circuit, connection error, rate limit, or
+    server error stay pending for the next replay along with the later writes of
+    their resource. Writes rejected by the API, or failing unexpectedly, are logged
+    and dropped.
+    """
+
+    logger = logging.getLogger("trackbear-api")
+
+    def __init__(
+        self,
+        client: TrackBearClient,
+        path: str | os.PathLike[str],
+        *,
+        fsync: bool = True,
+    ) -> None:
+        """
+        Open a journal, loading the writes still pending in it.
+
+        Args:
+            client (TrackBearClient): Client the writes are replayed with
+            path (str | PathLike): File of the journal, created if missing
+            fsync (bool): Force each append to disk before acknowledging it. Without,
+                appends survive a process exit but not a system crash. (default: True)
+        """
+        self._client = client
+        self._path = os.fspath(path)
+        self._fsync = fsync
+        self._lock = threading.RLock()
+        self._replaying = threading.Lock()
+        self._pending, intact = self._load()
+        self._latest = {_latest_key(entry): entry for entry in self._pending.values()}
+        self._file = open(self._path, "a", encoding="utf-8")
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        # Appending after a torn record would tear the next record too
+        if not intact:
+            self.compact()
+
+    def __enter__(self) -> WriteJournal:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def pending(self) -> Sequence[JournalEntry]:
+        """Return the pending writes in the order submitted."""
+        with self._lock:
+            return list(self._pending.values())
+
+    def submit(self, call: str, **kwargs: Any) -> JournalEntry:
+        """
+        Append a write to the journal.
+
+        Example:
+            journal.submit("tally.save", work_id=123, date="2025-01-01", measure="word", count=50)
+
+        Args:
+            call (str): Client method to replay, such as `tally.save`, `tally.delete`,
+                `project.save`, `goal.save_habit`, `tag.save`, or `leaderboard.save`
+            **kwargs: Keyword arguments of the call. Must be JSON serializable.
+
+        Returns:
+            The journal entry, or the identical entry already pending
+
+        Raises:
+            ValueError: If `call` cannot be journaled
+            TypeError: If the arguments do not match the call or are not JSON
+                serializable
+        """
+        if call not in _CALLS:
+            raise ValueError(f"Cannot journal '{call}'. Expected one of {sorted(_CALLS)}")
+
+        # Arguments which could never be replayed are rejected before acknowledging
+        kind, method = call.split(".")
+        inspect.signature(getattr(getattr(self._client, kind), method)).bind(**kwargs)
+
+        # Round trip so the entry holds exactly what a reload would
+        kwargs = json.loads(json.dumps(kwargs))
+
+        entry = JournalEntry(uuid.uuid4().hex, call, kwargs)
+        key = _latest_key(entry)
+
+        with self._lock:
+            latest = self._latest.get(key)
+            if latest is not None and _identity(latest) == _identity(entry):
+                return latest
+
+            self._append({"op": "write", "id": entry.entry_id, "call": call, "kwargs": kwargs})
+            self._pending[entry.entry_id] = entry
+            self._latest[key] = entry
+
+        return entry
+
+    def replay(self, *, max_workers: int = 4, batch_size: int = 100) -> Sequence[JournalResult]:
+        """
+        Send pending writes, `batch_size` resources at a time.
+
+        Resources are written concurrently by `max_workers` threads, each resource's
+        writes in the order submitted. Completions of a batch are forced to disk
+        together. Once nothing is pending the journal file is compacted.
+
+        Args:
+            max_workers (int): Number of concurrent writes (default: 4)
+            batch_size (int): Resources replayed per batch (default: 100)
+
+        Returns:
+            The results of the writes attempted, in completion order
+
+        Raises:
+            ValueError: If `max_workers` is less than 1
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        with self._replaying:
+            return self._replay(max_workers, batch_size)
+
+    def compact(self) -> None:
+        """Rewrite the journal file with only the pending writes."""
+        with self._lock:
+            temp_path = f"{self._path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as temp:
+                for entry in self._pending.values():
+                    record = {
+                        "op": "write",
+                        "id": entry.entry_id,
+                        "call": entry.call,
+                        "kwargs": entry.kwargs,
+                    }
+                    temp.write(json.dumps(record) + "\n")
+                temp.flush()
+                os.fsync(temp.fileno())
+
+            self._file.close()
+            os.replace(temp_path, self._path)
+            self._file = open(self._path, "a", encoding="utf-8")
+
+    def run(self, interval: float = 30.0) -> None:
+        """Replay pending writes every `interval` seconds until `stop()` is called."""
+        self._stop.clear()
+        while not self._stop.is_set():
+            if len(self):
+                try:
+                    self.replay()
+
+                except Exception:
+                    # Writes stay pending; a failing replay must not end the loop
+                    self.logger.exception("Journal replay failed")
+
+            self._stop.wait(interval)
+
+    def start(self, interval: float = 30.0) -> threading.Thread:
+        """Replay pending writes periodically in a daemon thread."""
+        self._thread = threading.Thread(
+            target=self.run,
+            args=(interval,),
+            name="trackbear-journal",
+            daemon=True,
+        )
+        self._thread.start()
+        return self._thread
+
+    def stop(self) -> None:
+        """Stop replaying, waiting for a running replay to finish."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def close(self) -> None:
+        """Stop replaying and close the journal file. Pending writes stay on disk."""
+        self.stop()
+        with self._lock:
+            self._file.close()
+
+    def _replay(self, max_workers: int, batch_size: int) -> Sequence[JournalResult]:
+        """Replay the pending writes. Caller holds the replaying lock."""
+        with self._lock:
+            resources: dict[str, list[JournalEntry]] = {}
+            for entry in self._pending.values():
+                resources.setdefault(entry.resource, []).append(entry)
+
+        groups = list(resources.values())
+        results: list[JournalResult] = []
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for start in range(0, len(groups), batch_size):
+                futures = [
+                    executor.submit(contextvars.copy_context().run, self._replay_resource, group)
+                    for group in groups[start : start + batch_size]
+                ]
+                for future in concurrent.futures.as_completed(futures):
+                    results.extend(future.result())
+
+                self._sync()
+
+        with self._lock:
+            if not self._pending:
+                self.compact()
+
+        return results
+
+    def _replay_resource(self, entries: Sequence[JournalEntry]) -> list[JournalResult]:
+        """Send the writes of a single resource in order, stopping at a transient error."""
+        results = []
+        for position, entry in enumerate(entries):
+            superseded = position + 1 < len(entries) and not entry.call.endswith(".delete")
+            if superseded:
+                self._complete(entry, "skipped")
+                results.append(JournalResult(entry, enums.SaveStatus.SKIPPED))
+                continue
+
+            kind, method = entry.call.split(".")
+            try:
+                result = getattr(getattr(self._client, kind), method)(**entry.kwargs)
+
+            except _TRANSIENT_ERRORS as err:
+                self.logger.warning("Journal replay of %s deferred: %s", entry.call, err)
+                results.append(JournalResult(entry, enums.SaveStatus.FAILED, error=err))
+                break
+
+            except Exception as err:
+                if isinstance(err, exceptions.APIResponseError) and _transient_status(err):
+                    self.logger.warning("Journal replay of %s deferred: %s", entry.call, err)
+                    results.append(JournalResult(entry, enums.SaveStatus.FAILED, error=err))
+                    break
+
+                self.logger.error("Journal replay of %s dropped: %s", entry.call, err)
+                self._complete(entry, "dropped")
+                results.append(JournalResult(entry, enums.SaveStatus.FAILED, error=err))
+                continue
+
+            self._complete(entry, "saved")
+            results.append(JournalResult(entry, enums.SaveStatus.SAVED, result=result))
+
+        return results
+
+    def _complete(self, entry: JournalEntry, outcome: str) -> None:
+        """Mark an entry as no longer pending. Forced to disk with its batch."""
+        with self._lock:
+            self._pending.pop(entry.entry_id, None)
+            key = _latest_key(entry)
+            if self._latest.get(key) is entry:
+                del self._latest[key]
+            self._file.write(json.dumps({"op": outcome, "id": entry.entry_id}) + "\n")
+            self._file.flush()
+
+    def _append(self, record: Mapping[str, Any]) -> None:
+        """Append a record and force it to disk. Caller holds the lock."""
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+        if self._fsync:
+            os.fsync(self._file.fileno())
+
+    def _sync(self) -> None:
+        """Force appended records to disk."""
+        if self._fsync:
+            with self._lock:
+                os.fsync(self._file.fileno())
+
+    def _load(self) -> tuple[dict[str, JournalEntry], bool]:
+        """Read the writes still pending, and whether every record was readable."""
+        pending: dict[str, JournalEntry] = {}
+        intact = True
+        if not os.path.exists(self._path):
+            return pending, intact
+
+        with open(self._path, encoding="utf-8") as journal:
+            for number, line in enumerate(journal, start=1):
+                try:
+                    record = json.loads(line)
+
+                except json.JSONDecodeError:
+                    # A record torn by a crash mid-append was never acknowledged
+                    self.logger.warning("Skipping unreadable journal line %d", number)
+                    intact = False
+                    continue
+
+                if record["op"] == "write":
+                    pending[record["id"]] = JournalEntry(
+                        record["id"], record["call"], record["kwargs"]
+                    )
+                else:
+                    pending.pop(record["id"], None)
+
+        return pending, intact
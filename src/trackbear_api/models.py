@@ -4,10 +4,13 @@ from __future__ import annotations
 
 import dataclasses
 import json
+from collections.abc import Mapping
 from collections.abc import Sequence
 from typing import Any
 from typing import NoReturn
+from typing import TypeVar
 
+from . import _serialize
 from . import enums
 from . import exceptions
 
@@ -28,6 +31,7 @@ __all__ = [
     "Stat",
     "Tag",
     "Tally",
+    "TallySaveResult",
     "TallyStub",
     "TargetParameter",
     "Team",
@@ -35,6 +39,36 @@ __all__ = [
 ]
 
 
+_ModelT = TypeVar("_ModelT", bound="_Serializable")
+
+
+class _Serializable:
+    """Serialization shared by the API models."""
+
+    __slots__ = ()
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Return the model as a dictionary of snake_case keys and JSON safe values.
+
+        Nested models are converted to dictionaries and enums to their values.
+        """
+        return _serialize.serializer(type(self), _serialize.TO_DICT)(self)
+
+    def to_api_dict(self) -> dict[str, Any]:
+        """Return the model as a dictionary of camelCase keys, as sent by the API."""
+        return _serialize.serializer(type(self), _serialize.TO_API_DICT)(self)
+
+    @classmethod
+    def from_dict(cls: type[_ModelT], data: Mapping[str, Any]) -> _ModelT:
+        """
+        Rebuild a model from the output of `to_dict()`.
+
+        The data is trusted and not validated; use `build()` for API response data.
+        """
+        return _serialize.serializer(cls, _serialize.FROM_DICT)(data)
+
+
 def _handle_build_error(exc: Exception, data: dict[str, Any], name: str) -> NoReturn:
     """
     Helpful bug reporting output for model building errors.
@@ -102,7 +136,7 @@ class Error:
 
 
 @dataclasses.dataclass(frozen=True, slots=True)
-class Balance:
+class Balance(_Serializable):
     """Balance values for Project models. These are **optional** values when building."""
 
     word: int
@@ -114,7 +148,7 @@ class Balance:
 
 
 @dataclasses.dataclass(frozen=True, slots=True)
-class Tally:
+class Tally(_Serializable):
     """Tally model."""
 
     id: int
@@ -156,7 +190,7 @@ class Tally:
 
 
 @dataclasses.dataclass(frozen=True, slots=True)
-class Project:
+class Project(_Serializable):
     """Project model."""
 
     id: int
@@ -216,7 +250,7 @@ class Project:
 
 
 @dataclasses.dataclass(frozen=True, slots=True)
-class ProjectStub:
+class ProjectStub(_Serializable):
     """ProjectStub model."""
 
     id: int
@@ -265,7 +299,7 @@ class ProjectStub:
 
 
 @dataclasses.dataclass(frozen=True, slots=True)
-class Threshold:
+class Threshold(_Serializable):
     """Sub-model for TargetParameter and HabitParameter. Defines thresholds for a target goal."""
 
     measure: enums.Measure
@@ -273,7 +307,7 @@ class Threshold:
 
 
 @dataclasses.dataclass(frozen=True, slots=True)
-class Cadence:
+class Cadence(_Serializable):
     """Sub-model for TargetParameter and HabitParameter."""
 
     unit: enums.HabitUnit
@@ -281,14 +315,14 @@ class Cadence:
 
 
 @dataclasses.dataclass(frozen=True, slots=True)
-class TargetParameter:
+class TargetParameter(_Serializable):
     """Defines threshold for a target goal."""
 
     threshold: Threshold
 
 
 @dataclasses.dataclass(frozen=True, slots=True)
-class HabitParameter:
+class HabitParameter(_Serializable):
     """Defines cadence with optional threshold for a habit goal."""
 
     cadence: Cadence
@@ -296,7 +330,7 @@ class HabitParameter:
 
 
 @dataclasses.dataclass(frozen=True, slots=True)
-class Goal:
+class Goal(_Serializable):
     """Goal model."""
 
     id: int
@@ -377,7 +411,7 @@ class Goal:
 
 
 @dataclasses.dataclass(frozen=True, slots=True)
-class Tag:
+class Tag(_Serializable):
     """Tag model."""
 
     id: int
@@ -409,7 +443,7 @@ class Tag:
 
 
 @dataclasses.dataclass(frozen=True, slots=True)
-class Stat:
+class Stat(_Serializable):
     """Stat model."""
 
     date: str
@@ -436,7 +470,7 @@ class Stat:
 
 
 @dataclasses.dataclass(frozen=True, slots=True)
-class Member:
+class Member(_Serializable):
     """Member model."""
 
     id: int
@@ -468,7 +502,7 @@ class Member:
 
 
 @dataclasses.dataclass(frozen=True, slots=True)
-class Team:
+class Team(_Serializable):
     """Team model."""
 
     id: int
@@ -498,7 +532,7 @@ class Team:
 
 
 @dataclasses.dataclass(frozen=True, slots=True)
-class LeaderboardMember:
+class LeaderboardMember(_Serializable):
     """Sub-model for LeaderboardExtended."""
 
     id: int
@@ -510,7 +544,7 @@ class LeaderboardMember:
 
 
 @dataclasses.dataclass(frozen=True, slots=True)
-class LeaderboardExtended:
+class LeaderboardExtended(_Serializable):
     """LeaderboardExtended model."""
 
     id: int
@@ -590,7 +624,7 @@ class LeaderboardExtended:
 
 
 @dataclasses.dataclass(frozen=True, slots=True)
-class Leaderboard:
+class Leaderboard(_Serializable):
     """Leaderboard model."""
 
     id: int
@@ -645,7 +679,7 @@ class Leaderboard:
 
 
 @dataclasses.dataclass(frozen=True, slots=True)
-class TallyStub:
+class TallyStub(_Serializable):
     """Sub-model of Participant."""
 
     uuid: str
@@ -655,7 +689,7 @@ class TallyStub:
 
 
 @dataclasses.dataclass(frozen=True, slots=True)
-class GoalStub:
+class GoalStub(_Serializable):
     """Sub-model of Participant."""
 
     measure: enums.Measure
@@ -663,7 +697,7 @@ class GoalStub:
 
 
 @dataclasses.dataclass(frozen=True, slots=True)
-class Participant:
+class Participant(_Serializable):
     """Participant model."""
 
     id: int
@@ -709,7 +743,7 @@ class Participant:
 
 
 @dataclasses.dataclass(frozen=True, slots=True)
-class Starred:
+class Starred(_Serializable):
     """Starred model."""
 
     starred: bool = False
@@ -722,3 +756,13 @@ class Starred:
 
         except (KeyError, ValueError) as exc:
             _handle_build_error(exc, data, cls.__name__)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class TallySaveResult:
+    """Per-row result of a bulk tally save. Not built from API data."""
+
+    index: int
+    status: enums.SaveStatus
+    tally: Tally | None = None
+    error: Exception | None = None
@@ -0,0 +1,155 @@
+"""Compute progress toward a Goal locally from tallies, without calling the API."""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime
+from collections import defaultdict
+from collections.abc import Iterable
+from collections.abc import Sequence
+
+from . import _goalmath
+from . import enums
+from . import models
+
+__all__ = [
+    "GoalProgress",
+    "PeriodProgress",
+    "goal_progress",
+]
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class PeriodProgress:
+    """
+    Progress within a single period of a goal.
+
+    Target goals are broken down by day and a period is `met` once the running total
+    reaches the threshold. Habit goals are broken down by cadence period and a period
+    is `met` when its total reaches the threshold, or has any tally if the habit has
+    no threshold.
+    """
+
+    start_date: str
+    end_date: str
+    total: int
+    met: bool
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class GoalProgress:
+    """
+    Progress toward a Goal.
+
+    For target goals `progress` and `target` are counts of the threshold measure.
+    For habit goals they are counts of periods met and periods elapsed (through the
+    goal's `end_date` when it has one).
+    """
+
+    goal_id: int
+    type: enums.GoalType
+    progress: int
+    target: int
+    remaining: int
+    complete: bool
+    periods: Sequence[PeriodProgress]
+
+
+def goal_progress(
+    goal: models.Goal,
+    tallies: Iterable[models.Tally],
+    today: str | None = None,
+) -> GoalProgress:
+    """
+    Compute the progress of a goal from a source of tallies.
+
+    Tallies are filtered by the goal's `start_date`, `end_date`, `work_ids`, `tag_ids`
+    and threshold measure, then totaled in a single pass.
+
+    Args:
+        goal (Goal): The goal to measure
+        tallies (Iterable[Tally]): Any iterable of tallies, such as the result of
+            `TallyClient.list()`
+        today (str): (Optional) Date to measure habits through (YYYY-MM-DD).
+            Defaults to the current date.
+
+    Returns:
+        GoalProgress
+    """
+    today = today or datetime.date.today().isoformat()
+    applicable = [tally for tally in tallies if _goalmath.applies(goal, tally)]
+
+    if isinstance(goal.parameters, models.HabitParameter):
+        return _habit_progress(goal, goal.parameters, applicable, today)
+
+    return _target_progress(goal, goal.parameters, applicable)
+
+
+def _target_progress(
+    goal: models.Goal,
+    parameters: models.TargetParameter,
+    tallies: Sequence[models.Tally],
+) -> GoalProgress:
+    """Sum the threshold measure, broken down by day."""
+    by_day: dict[str, int] = defaultdict(int)
+    for tally in tallies:
+        by_day[tally.date] += tally.count
+
+    target = parameters.threshold.count
+    periods = []
+    running = 0
+    for day in sorted(by_day):
+        running += by_day[day]
+        periods.append(PeriodProgress(day, day, by_day[day], running >= target))
+
+    return GoalProgress(
+        goal_id=goal.id,
+        type=enums.GoalType.TARGET,
+        progress=running,
+        target=target,
+        remaining=max(0, target - running),
+        complete=running >= target,
+        periods=periods,
+    )
+
+
+def _habit_progress(
+    goal: models.Goal,
+    parameters: models.HabitParameter,
+    tallies: Sequence[models.Tally],
+    today: str,
+) -> GoalProgress:
+    """Bucket tallies into cadence periods and count the periods met."""
+    unit = parameters.cadence.unit
+    period = parameters.cadence.period
+    threshold = parameters.threshold
+
+    first = goal.start_date or min((tally.date for tally in tallies), default=today)
+    last = goal.end_date or today
+    origin = _goalmath.align(_goalmath.to_date(first), unit)
+    last_index = _goalmath.period_index(origin, _goalmath.to_date(last), unit, period)
+
+    totals: dict[int, int] = defaultdict(int)
+    for tally in tallies:
+        index = _goalmath.period_index(origin, _goalmath.to_date(tally.date), unit, period)
+        totals[index] += tally.count if threshold is not None else 1
+
+    periods = []
+    for index in range(last_index + 1):
+        start, end = _goalmath.period_bounds(origin, index, unit, period)
+        total = totals.get(index, 0)
+        met = total >= max(threshold.count, 1) if threshold is not None else total > 0
+        periods.append(PeriodProgress(start.isoformat(), end.isoformat(), total, met))
+
+    progress = sum(1 for period_progress in periods if period_progress.met)
+    ended = goal.end_date is not None and today >= goal.end_date
+
+    return GoalProgress(
+        goal_id=goal.id,
+        type=enums.GoalType.HABIT,
+        progress=progress,
+        target=len(periods),
+        remaining=len(periods) - progress,
+        complete=ended and progress == len(periods),
+        periods=periods,
+    )
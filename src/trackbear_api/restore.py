@@ -0,0 +1,368 @@
+"""Restore an export snapshot into another account, remapping ids between them."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import contextvars
+import dataclasses
+import json
+import logging
+import os
+import threading
+from collections.abc import Callable
+from collections.abc import Iterator
+from collections.abc import Mapping
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+from typing import Any
+
+from . import enums
+
+if TYPE_CHECKING:
+    from .trackbearclient import TrackBearClient
+
+__all__ = [
+    "MANIFEST_NAME",
+    "RESTORE_LAYERS",
+    "RestoreResult",
+    "SnapshotRestore",
+]
+
+# File of a snapshot describing its format and resources, written by the export subcommand
+MANIFEST_NAME = "manifest.json"
+
+# Resources restored together, each layer only referencing the ids of earlier layers
+RESTORE_LAYERS = (("project", "tag"), ("goal",), ("tally",))
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class RestoreResult:
+    """Outcome of restoring a single snapshot record."""
+
+    resource: str
+    old_id: int
+    status: enums.SaveStatus
+    new_id: int | None = None
+    error: Exception | None = None
+
+
+class SnapshotRestore:
+    """
+    Restore projects, tags, goals, and tallies of an export snapshot.
+
+    The snapshot is the directory written by `trackbear export` in the `ndjson`
+    format. Records are created in the account of the client in dependency order:
+    projects and tags, then goals, then tallies. The ids each record references are
+    translated to the ids of the records created from them. Records of a layer are
+    created concurrently, under the rate limit of the client.
+
+    Every record created is appended to a state file mapping its snapshot id to its
+    new id. Running again with the same state file skips the records already
+    restored, so an interrupted restore resumes where it left off. A record created
+    right before an interruption, but not yet appended, is created again.
+
+    Tags are matched by name: a tag already in the account is reused, not created.
+    Records failing to restore, or referencing a record which failed, are reported
+    and retried on the next run.
+    """
+
+    logger = logging.getLogger("trackbear-api")
+
+    def __init__(
+        self,
+        client: TrackBearClient,
+        directory: str | os.PathLike[str],
+        state_path: str | os.PathLike[str],
+        *,
+        fsync: bool = True,
+    ) -> None:
+        """
+        Open a restore, loading the ids mapped by earlier runs.
+
+        Args:
+            client (TrackBearClient): Client of the account restored into
+            directory (str | PathLike): Directory of the export snapshot
+            state_path (str | PathLike): File of the id mappings, created if missing
+            fsync (bool): Force the mappings of each layer to disk once the layer
+                completes. (default: True)
+
+        Raises:
+            ValueError: If the snapshot was not exported as `ndjson`
+        """
+        self._client = client
+        self._directory = os.fspath(directory)
+        self._state_path = os.fspath(state_path)
+        self._fsync = fsync
+        self._lock = threading.Lock()
+        self._tags_lock = threading.Lock()
+        self._account_tags: dict[str, int] | None = None
+
+        file_format = self._manifest().get("format", "ndjson")
+        if file_format != "ndjson":
+            raise ValueError(f"Cannot restore a '{file_format}' snapshot, export as ndjson")
+
+        self._ids, intact = self._load()
+        self._file = open(self._state_path, "a", encoding="utf-8")
+
+        # Appending after a torn record would tear the next record too
+        if not intact:
+            self._rewrite()
+
+    def __enter__(self) -> SnapshotRestore:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def id_map(self, resource: str) -> Mapping[int, int]:
+        """Return the new id of each restored record of a resource by its snapshot id."""
+        with self._lock:
+            return dict(self._ids.get(resource, {}))
+
+    def run(self, *, max_workers: int = 4) -> Sequence[RestoreResult]:
+        """
+        Restore the records not yet restored, one layer at a time.
+
+        Args:
+            max_workers (int): Number of records created concurrently (default: 4)
+
+        Returns:
+            The results of every record in the snapshot, in completion order
+
+        Raises:
+            ValueError: If `max_workers` is less than 1
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        results: list[RestoreResult] = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for layer in RESTORE_LAYERS:
+                results.extend(self._run_layer(executor, layer, max_workers))
+                self._sync()
+
+        return results
+
+    def close(self) -> None:
+        """Close the state file."""
+        with self._lock:
+            self._file.close()
+
+    def _run_layer(
+        self,
+        executor: concurrent.futures.ThreadPoolExecutor,
+        layer: Sequence[str],
+        max_workers: int,
+    ) -> list[RestoreResult]:
+        """Restore the records of a layer, keeping a bounded number in flight."""
+        restorers: dict[str, Callable[[dict[str, Any]], int]] = {
+            "project": self._restore_project,
+            "tag": self._restore_tag,
+            "goal": self._restore_goal,
+            "tally": self._restore_tally,
+        }
+        results: list[RestoreResult] = []
+        pending: set[concurrent.futures.Future[RestoreResult]] = set()
+
+        for resource in layer:
+            restore = restorers[resource]
+            for record in self._records(resource):
+                if len(pending) >= max_workers * 2:
+                    done, pending = concurrent.futures.wait(
+                        pending, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    results.extend(future.result() for future in done)
+
+                pending.add(
+                    executor.submit(
+                        contextvars.copy_context().run, self._restore, resource, record, restore
+                    )
+                )
+
+        results.extend(future.result() for future in concurrent.futures.as_completed(pending))
+        return results
+
+    def _restore(
+        self,
+        resource: str,
+        record: dict[str, Any],
+        restore: Callable[[dict[str, Any]], int],
+    ) -> RestoreResult:
+        """Restore a single record unless an earlier run did."""
+        old_id = record["id"]
+        with self._lock:
+            new_id = self._ids.get(resource, {}).get(old_id)
+
+        if new_id is not None:
+            return RestoreResult(resource, old_id, enums.SaveStatus.SKIPPED, new_id)
+
+        try:
+            new_id = restore(record)
+
+        except Exception as err:
+            self.logger.error("Failed to restore %s %d: %s", resource, old_id, err)
+            return RestoreResult(resource, old_id, enums.SaveStatus.FAILED, error=err)
+
+        self._record(resource, old_id, new_id)
+        return RestoreResult(resource, old_id, enums.SaveStatus.SAVED, new_id)
+
+    def _restore_project(self, record: dict[str, Any]) -> int:
+        """Create a project from its snapshot record."""
+        project = self._client.project.save(
+            title=record["title"],
+            description=record["description"],
+            phase=record["phase"],
+            starred=record["starred"],
+            display_on_profile=record["displayOnProfile"],
+            **record["startingBalance"],
+        )
+        return project.id
+
+    def _restore_tag(self, record: dict[str, Any]) -> int:
+        """Create a tag from its snapshot record, or reuse the account's tag of its name."""
+        with self._tags_lock:
+            if self._account_tags is None:
+                self._account_tags = {tag.name: tag.id for tag in self._client.tag.list()}
+
+            existing = self._account_tags.get(record["name"])
+
+        if existing is not None:
+            return existing
+
+        return self._client.tag.save(name=record["name"], color=record["color"]).id
+
+    def _restore_goal(self, record: dict[str, Any]) -> int:
+        """Create a goal from its snapshot record with remapped projects and tags."""
+        kwargs: dict[str, Any] = {
+            "title": record["title"],
+            "description": record["description"],
+            "start_date": record["startDate"],
+            "end_date": record["endDate"],
+            "work_ids": self._remap("project", record["workIds"]),
+            "tag_ids": self._remap("tag", record["tagIds"]),
+            "starred": record.get("starred", False),
+            "display_on_profile": record.get("displayOnProfile", False),
+        }
+        threshold = record["parameters"].get("threshold")
+
+        if record["type"] == "habit":
+            cadence = record["parameters"]["cadence"]
+            goal = self._client.goal.save_habit(
+                unit=cadence["unit"],
+                period=cadence["period"],
+                measure=threshold["measure"] if threshold else None,
+                count=threshold["count"] if threshold else None,
+                **kwargs,
+            )
+        else:
+            goal = self._client.goal.save_target(
+                measure=threshold["measure"],
+                count=threshold["count"],
+                **kwargs,
+            )
+
+        return goal.id
+
+    def _restore_tally(self, record: dict[str, Any]) -> int:
+        """Create a tally from its snapshot record in its remapped project."""
+        (work_id,) = self._remap("project", [record["workId"]])
+        tally = self._client.tally.save(
+            work_id=work_id,
+            date=record["date"],
+            measure=record["measure"],
+            count=record["count"],
+            note=record["note"],
+            # Tags are sent by name, resolving to the tags restored or reused
+            tags=[tag["name"] for tag in record["tags"]],
+        )
+        return tally.id
+
+    def _remap(self, resource: str, old_ids: Sequence[int]) -> list[int]:
+        """
+        Translate snapshot ids into the ids of the restored records.
+
+        Raises:
+            ValueError: If a referenced record was not restored
+        """
+        with self._lock:
+            ids = self._ids.get(resource, {})
+            missing = [old_id for old_id in old_ids if old_id not in ids]
+            if missing:
+                raise ValueError(f"{resource} {missing} not restored")
+
+            return [ids[old_id] for old_id in old_ids]
+
+    def _records(self, resource: str) -> Iterator[dict[str, Any]]:
+        """Stream the records of a resource, none if it was not exported."""
+        path = os.path.join(self._directory, f"{resource}.ndjson")
+        if not os.path.exists(path):
+            self.logger.warning("No %s records in snapshot %s", resource, self._directory)
+            return
+
+        with open(path, encoding="utf-8") as file:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+    def _manifest(self) -> dict[str, Any]:
+        """Read the snapshot manifest, empty if missing."""
+        path = os.path.join(self._directory, MANIFEST_NAME)
+        if not os.path.exists(path):
+            return {}
+
+        with open(path, encoding="utf-8") as file:
+            manifest: dict[str, Any] = json.load(file)
+
+        return manifest
+
+    def _record(self, resource: str, old_id: int, new_id: int) -> None:
+        """Map a restored record and append it to the state file."""
+        with self._lock:
+            self._ids.setdefault(resource, {})[old_id] = new_id
+            line = {"resource": resource, "old": old_id, "new": new_id}
+            self._file.write(json.dumps(line) + "\n")
+            self._file.flush()
+
+    def _sync(self) -> None:
+        """Force appended mappings to disk."""
+        if self._fsync:
+            with self._lock:
+                os.fsync(self._file.fileno())
+
+    def _rewrite(self) -> None:
+        """Rewrite the state file with only the readable mappings."""
+        with self._lock:
+            temp_path = f"{self._state_path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as temp:
+                for resource, ids in self._ids.items():
+                    for old_id, new_id in ids.items():
+                        line = {"resource": resource, "old": old_id, "new": new_id}
+                        temp.write(json.dumps(line) + "\n")
+                temp.flush()
+                os.fsync(temp.fileno())
+
+            self._file.close()
+            os.replace(temp_path, self._state_path)
+            self._file = open(self._state_path, "a", encoding="utf-8")
+
+    def _load(self) -> tuple[dict[str, dict[int, int]], bool]:
+        """Read the mapped ids, and whether every mapping was readable."""
+        ids: dict[str, dict[int, int]] = {}
+        intact = True
+        if not os.path.exists(self._state_path):
+            return ids, intact
+
+        with open(self._state_path, encoding="utf-8") as state:
+            for number, line in enumerate(state, start=1):
+                try:
+                    record = json.loads(line)
+
+                except json.JSONDecodeError:
+                    # A mapping torn by a crash mid-append is restored again
+                    self.logger.warning("Skipping unreadable restore state line %d", number)
+                    intact = False
+                    continue
+
+                ids.setdefault(record["resource"], {})[record["old"]] = record["new"]
+
+        return ids, intact
@@ -0,0 +1,229 @@
+"""
+TypedDict views of the TrackBear API response data.
+
+Returned by the `*_raw()` methods of the clients, which skip building models. Keys
+and values are exactly as decoded from the API response (camelCase keys, enum values
+as strings). Treat them as read-only: with caching enabled they are shared between
+callers.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+from typing import TypedDict
+
+from . import exceptions
+
+__all__ = [
+    "BalanceDict",
+    "CadenceDict",
+    "GoalDict",
+    "GoalParametersDict",
+    "GoalStubDict",
+    "LeaderboardDict",
+    "LeaderboardExtendedDict",
+    "LeaderboardMemberDict",
+    "ParticipantDict",
+    "ProjectDict",
+    "ProjectStubDict",
+    "StatDict",
+    "TagDict",
+    "TallyDict",
+    "TallyStubDict",
+    "TeamDict",
+    "ThresholdDict",
+]
+
+
+class BalanceDict(TypedDict, total=False):
+    word: int
+    time: int
+    page: int
+    chapter: int
+    scene: int
+    line: int
+
+
+class _ProjectStubOptional(TypedDict, total=False):
+    starred: bool
+    displayOnProfile: bool
+
+
+class ProjectStubDict(_ProjectStubOptional):
+    id: int
+    uuid: str
+    createdAt: str
+    updatedAt: str
+    state: str
+    ownerId: int
+    title: str
+    description: str
+    phase: str
+    startingBalance: BalanceDict
+    cover: str | None
+
+
+class ProjectDict(ProjectStubDict):
+    totals: BalanceDict
+    lastUpdated: str | None
+
+
+class TagDict(TypedDict):
+    id: int
+    uuid: str
+    createdAt: str
+    updatedAt: str
+    state: str
+    ownerId: int
+    name: str
+    color: str
+
+
+class TallyDict(TypedDict):
+    id: int
+    uuid: str
+    createdAt: str
+    updatedAt: str
+    state: str
+    ownerId: int
+    date: str
+    measure: str
+    count: int
+    note: str
+    workId: int
+    work: ProjectStubDict
+    tags: list[TagDict]
+
+
+class ThresholdDict(TypedDict):
+    measure: str
+    count: int
+
+
+class CadenceDict(TypedDict):
+    unit: str
+    period: int
+
+
+class GoalParametersDict(TypedDict, total=False):
+    threshold: ThresholdDict | None
+    cadence: CadenceDict
+
+
+class _GoalOptional(TypedDict, total=False):
+    starred: bool
+    displayOnProfile: bool
+
+
+class GoalDict(_GoalOptional):
+    id: int
+    uuid: str
+    createdAt: str
+    updatedAt: str
+    state: str
+    ownerId: int
+    title: str
+    description: str
+    type: str
+    parameters: GoalParametersDict
+    startDate: str | None
+    endDate: str | None
+    workIds: list[int]
+    tagIds: list[int]
+
+
+class StatDict(TypedDict):
+    date: str
+    counts: BalanceDict
+
+
+class TeamDict(TypedDict):
+    id: int
+    uuid: str
+    createdAt: str
+    updatedAt: str
+    boardId: int
+    name: str
+    color: str
+
+
+class LeaderboardMemberDict(TypedDict):
+    id: int
+    displayName: str
+    avatar: str
+    isParticipant: bool
+    isOwner: bool
+    userUuid: str
+
+
+class LeaderboardDict(TypedDict):
+    id: int
+    uuid: str
+    createdAt: str
+    updatedAt: str
+    state: str
+    ownerId: int
+    title: str
+    description: str
+    startDate: str | None
+    endDate: str | None
+    individualGoalMode: bool
+    fundraiserMode: bool
+    measures: list[str]
+    goal: BalanceDict
+    isJoinable: bool
+    starred: bool
+
+
+class LeaderboardExtendedDict(LeaderboardDict):
+    teams: list[TeamDict]
+    members: list[LeaderboardMemberDict]
+
+
+class TallyStubDict(TypedDict):
+    uuid: str
+    date: str
+    measure: str
+    count: int
+
+
+class GoalStubDict(TypedDict):
+    measure: str
+    count: int
+
+
+class ParticipantDict(TypedDict):
+    id: int
+    uuid: str
+    displayName: str
+    avatar: str | None
+    color: str | None
+    goal: GoalStubDict | None
+    tallies: list[TallyStubDict]
+
+
+def _check(data: Any, schema: Any, validate: bool) -> Any:
+    """
+    Return the data, checking the required keys of each record if `validate` is True.
+
+    Only the top-level keys are checked; values and nested records are not.
+
+    Raises:
+        exceptions.ModelBuildError: If a record is not a dict or is missing a key
+    """
+    if not validate:
+        return data
+
+    required = schema.__required_keys__
+    for record in data if isinstance(data, list) else [data]:
+        missing = required - record.keys() if isinstance(record, dict) else required
+        if missing:
+            raise exceptions.ModelBuildError(
+                data_string=json.dumps(record, default=str),
+                model_name=schema.__name__,
+                exception_type=str(KeyError),
+                exception_str=f"Missing keys: {', '.join(sorted(missing))}",
+            )
+
+    return data
@@ -0,0 +1,315 @@
+"""Rank leaderboard participants locally, updating incrementally as tallies arrive."""
+
+from __future__ import annotations
+
+import dataclasses
+import heapq
+from collections.abc import Iterable
+from collections.abc import Mapping
+from collections.abc import Sequence
+
+from . import enums
+from . import models
+
+__all__ = [
+    "FundraiserProgress",
+    "LeaderboardStandings",
+    "Standing",
+]
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Standing:
+    """
+    A participant's position on a leaderboard.
+
+    `score` is the total of the ranking measure, or the fraction of the participant's
+    own goal reached when the board is in individual goal mode.
+    """
+
+    rank: int
+    participant_uuid: str
+    display_name: str
+    score: float
+    totals: Mapping[enums.Measure, int]
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class FundraiserProgress:
+    """Collective total of a single measure against the leaderboard goal."""
+
+    measure: enums.Measure
+    total: int
+    goal: int
+    complete: bool
+
+
+class LeaderboardStandings:
+    """
+    Aggregate participant tallies by the leaderboard's measures and rank them.
+
+    Counted tallies are kept by uuid, so the same participant list can be fed on
+    every poll: new tallies are added, edited ones replace their previous count, and
+    removed ones are subtracted. Ranking uses a heap with lazy invalidation: each
+    score change pushes one entry and `top()` only pops the entries needed, instead
+    of sorting every participant on every call.
+    """
+
+    def __init__(
+        self,
+        board: models.Leaderboard | models.LeaderboardExtended,
+        participants: Iterable[models.Participant] = (),
+        *,
+        measure: enums.Measure | str | None = None,
+    ) -> None:
+        """
+        Initialize the standings of a leaderboard.
+
+        Args:
+            board (Leaderboard | LeaderboardExtended): The leaderboard being ranked
+            participants (Iterable[Participant]): (Optional) Initial participants
+            measure (Measure | str): (Optional) Measure to rank by when the board is not
+                in individual goal mode. Defaults to the board's first measure.
+
+        Raises:
+            ValueError: When `measure` is not a valid value
+        """
+        self._board = board
+        self._measures = {enums.Measure(measure) for measure in board.measures}
+
+        if measure is not None:
+            self._rank_measure = enums.Measure(measure)
+        elif board.measures:
+            self._rank_measure = enums.Measure(board.measures[0])
+        else:
+            self._rank_measure = enums.Measure.WORD
+
+        self._participants: dict[str, models.Participant] = {}
+        self._totals: dict[str, dict[enums.Measure, int]] = {}
+        self._collective: dict[enums.Measure, int] = {}
+        self._tallies: dict[str, dict[str, models.TallyStub]] = {}
+        self._scores: dict[str, float] = {}
+        # Versions come from one counter, so a participant who leaves and rejoins
+        # never matches the heap entries of its earlier membership
+        self._version = 0
+        self._versions: dict[str, int] = {}
+        self._heap: list[tuple[float, str, int]] = []
+
+        self.update(participants)
+
+    def __len__(self) -> int:
+        return len(self._participants)
+
+    @property
+    def collective_totals(self) -> Mapping[enums.Measure, int]:
+        """Totals of every participant combined, by measure."""
+        return dict(self._collective)
+
+    def update(self, participants: Iterable[models.Participant]) -> int:
+        """
+        Replace the participants with a full listing of the leaderboard.
+
+        Tallies are matched by uuid against those counted before. Participants
+        missing from `participants` are dropped with their tallies.
+
+        Returns:
+            The number of tallies added, edited, or removed
+        """
+        current = {participant.uuid: participant for participant in participants}
+
+        changed = 0
+        for uuid in [uuid for uuid in self._participants if uuid not in current]:
+            changed += self.remove_participant(uuid)
+
+        for participant in current.values():
+            changed += self._replace(participant)
+
+        return changed
+
+    def replace_participant(self, participant: models.Participant) -> int:
+        """
+        Add a participant, or bring a known one in line with its current tallies.
+
+        Unlike `update()`, other participants are left as they are.
+
+        Returns:
+            The number of tallies added, edited, or removed
+        """
+        return self._replace(participant)
+
+    def remove_participant(self, participant_uuid: str) -> int:
+        """
+        Drop a participant who left the leaderboard, with its tallies.
+
+        Returns:
+            The number of tallies removed, 0 if the participant is not known
+        """
+        if participant_uuid not in self._participants:
+            return 0
+
+        removed = len(self._tallies[participant_uuid])
+        self._drop(participant_uuid)
+        return removed
+
+    def add_tally(self, participant_uuid: str, tally: models.TallyStub) -> bool:
+        """
+        Count a single new or edited tally toward a known participant.
+
+        Returns:
+            True if the totals changed, False if the tally was counted before as is or
+            its measure is not one of the leaderboard's measures.
+
+        Raises:
+            KeyError: If the participant has not been added with `update()`
+        """
+        tallies = self._tallies[participant_uuid]
+        if not self._counts(tally) or tallies.get(tally.uuid) == tally:
+            return False
+
+        self._count(participant_uuid, tally)
+        self._rescore(participant_uuid, self._score(participant_uuid))
+
+        return True
+
+    def top(self, k: int = 10) -> Sequence[Standing]:
+        """
+        Return the `k` highest ranked participants.
+
+        Participants with equal scores share a rank. Ties are ordered by uuid.
+        """
+        valid: list[tuple[float, str, int]] = []
+        while self._heap and len(valid) < k:
+            entry = heapq.heappop(self._heap)
+            if self._versions.get(entry[1]) == entry[2]:
+                valid.append(entry)
+
+        for entry in valid:
+            heapq.heappush(self._heap, entry)
+
+        # Stale entries are dropped as they surface; compact if they pile up below
+        if len(self._heap) > 4 * len(self._versions) + 64:
+            self._compact()
+
+        standings: list[Standing] = []
+        for position, (negative_score, uuid, _) in enumerate(valid, start=1):
+            score = -negative_score
+            if standings and standings[-1].score == score:
+                rank = standings[-1].rank
+            else:
+                rank = position
+
+            standings.append(
+                Standing(
+                    rank=rank,
+                    participant_uuid=uuid,
+                    display_name=self._participants[uuid].display_name,
+                    score=score,
+                    totals=dict(self._totals[uuid]),
+                )
+            )
+
+        return standings
+
+    def fundraiser(self) -> Sequence[FundraiserProgress]:
+        """
+        Return the collective total of each leaderboard measure against the board goal.
+
+        Meaningful for boards in fundraiser mode.
+        """
+        measures = sorted(self._measures or {self._rank_measure}, key=lambda m: m.value)
+        progress = []
+        for measure in measures:
+            goal = getattr(self._board.goal, measure.value)
+            total = self._collective.get(measure, 0)
+            progress.append(FundraiserProgress(measure, total, goal, goal > 0 and total >= goal))
+
+        return progress
+
+    def _counts(self, tally: models.TallyStub) -> bool:
+        """Return True if the tally's measure is one of the leaderboard's measures."""
+        return not self._measures or enums.Measure(tally.measure) in self._measures
+
+    def _replace(self, participant: models.Participant) -> int:
+        """Bring a participant's totals in line with its tallies and rescore it."""
+        uuid = participant.uuid
+        self._participants[uuid] = participant
+        self._totals.setdefault(uuid, {})
+        previous = self._tallies.setdefault(uuid, {})
+        tallies = {tally.uuid: tally for tally in participant.tallies if self._counts(tally)}
+
+        changed = 0
+        for key in [key for key in previous if key not in tallies]:
+            self._uncount(uuid, previous[key])
+            changed += 1
+
+        for key, tally in tallies.items():
+            if previous.get(key) != tally:
+                self._count(uuid, tally)
+                changed += 1
+
+        # Individual goals may have changed even without tally changes
+        self._rescore(uuid, self._score(uuid))
+
+        return changed
+
+    def _count(self, participant_uuid: str, tally: models.TallyStub) -> None:
+        """Add a tally to the totals, replacing its previous count, without rescoring."""
+        tallies = self._tallies[participant_uuid]
+        previous = tallies.get(tally.uuid)
+        if previous is not None:
+            self._uncount(participant_uuid, previous)
+
+        tallies[tally.uuid] = tally
+        self._add(participant_uuid, enums.Measure(tally.measure), tally.count)
+
+    def _uncount(self, participant_uuid: str, tally: models.TallyStub) -> None:
+        """Subtract a counted tally from the totals, without rescoring."""
+        del self._tallies[participant_uuid][tally.uuid]
+        self._add(participant_uuid, enums.Measure(tally.measure), -tally.count)
+
+    def _add(self, participant_uuid: str, measure: enums.Measure, count: int) -> None:
+        """Add `count` to a participant's total and the collective total of `measure`."""
+        for totals in (self._totals[participant_uuid], self._collective):
+            totals[measure] = totals.get(measure, 0) + count
+            if totals[measure] == 0:
+                del totals[measure]
+
+    def _drop(self, participant_uuid: str) -> None:
+        """Remove a participant, its tallies, and its ranking."""
+        for tally in list(self._tallies[participant_uuid].values()):
+            self._uncount(participant_uuid, tally)
+
+        del self._participants[participant_uuid]
+        del self._totals[participant_uuid]
+        del self._tallies[participant_uuid]
+        del self._scores[participant_uuid]
+        # Without a version, the participant's heap entries are skipped as stale
+        del self._versions[participant_uuid]
+
+    def _score(self, participant_uuid: str) -> float:
+        """Score a participant by the board's ranking rules."""
+        totals = self._totals[participant_uuid]
+
+        if not self._board.individual_goal_mode:
+            return float(totals.get(self._rank_measure, 0))
+
+        goal = self._participants[participant_uuid].goal
+        if goal is None or goal.count <= 0:
+            return 0.0
+
+        return totals.get(enums.Measure(goal.measure), 0) / goal.count
+
+    def _rescore(self, participant_uuid: str, score: float) -> None:
+        """Record a new score, invalidating the participant's previous heap entry."""
+        if self._scores.get(participant_uuid) == score:
+            return
+
+        self._version += 1
+        self._versions[participant_uuid] = self._version
+        self._scores[participant_uuid] = score
+        heapq.heappush(self._heap, (-score, participant_uuid, self._version))
+
+    def _compact(self) -> None:
+        """Rebuild the heap from current scores only."""
+        self._heap = [(-score, uuid, self._versions[uuid]) for uuid, score in self._scores.items()]
+        heapq.heapify(self._heap)
@@ -0,0 +1,167 @@
+"""Incrementally track streaks of habit goals as new tallies arrive."""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import logging
+from typing import Any
+
+from . import _goalmath
+from . import models
+
+__all__ = [
+    "HabitStreakTracker",
+    "StreakState",
+]
+
+
+@dataclasses.dataclass(slots=True)
+class StreakState:
+    """
+    Serializable state of a HabitStreakTracker.
+
+    Periods are numbered from zero, starting at `origin`: the goal's start date, or
+    the first tally added, aligned to the start of its cadence unit.
+    """
+
+    goal_id: int
+    origin: str | None = None
+    period_index: int | None = None
+    period_total: int = 0
+    streak: int = 0
+    longest_streak: int = 0
+    last_met_index: int | None = None
+
+
+class HabitStreakTracker:
+    """
+    Track the current streak, longest streak, and current period total of a habit goal.
+
+    Each `add()` is O(1). Only the current period is kept in state, so tallies for a
+    period earlier than the most recent one seen are ignored. Feed tallies in date
+    order and persist the state with `to_dict()` between runs.
+    """
+
+    logger = logging.getLogger("trackbear-api")
+
+    def __init__(self, goal: models.Goal, state: StreakState | None = None) -> None:
+        """
+        Initialize the tracker for a habit goal.
+
+        Args:
+            goal (Goal): A goal with HabitParameter parameters
+            state (StreakState): (Optional) State restored from a previous run
+
+        Raises:
+            ValueError: If the goal is not a habit or the state belongs to another goal
+        """
+        if not isinstance(goal.parameters, models.HabitParameter):
+            raise ValueError(f"Goal {goal.id} is not a habit goal")
+
+        if state is not None and state.goal_id != goal.id:
+            raise ValueError(f"State of goal {state.goal_id} does not belong to goal {goal.id}")
+
+        self._goal = goal
+        self._unit = goal.parameters.cadence.unit
+        self._period = goal.parameters.cadence.period
+        self._threshold = goal.parameters.threshold
+        self._state = state if state is not None else StreakState(goal_id=goal.id)
+        self._origin: datetime.date | None = None
+
+        if self._state.origin is not None:
+            self._origin = _goalmath.to_date(self._state.origin)
+        elif goal.start_date is not None:
+            self._set_origin(goal.start_date)
+
+    @property
+    def state(self) -> StreakState:
+        """The mutable state of the tracker."""
+        return self._state
+
+    @property
+    def longest_streak(self) -> int:
+        """The longest run of consecutive periods met."""
+        return self._state.longest_streak
+
+    @property
+    def period_total(self) -> int:
+        """Total counted toward the threshold in the most recent period."""
+        return self._state.period_total
+
+    def current_streak(self, today: str | None = None) -> int:
+        """
+        Return the current run of consecutive periods met.
+
+        The streak is not broken by the period containing `today` until it has ended.
+
+        Args:
+            today (str): (Optional) YYYY-MM-DD date to evaluate. Defaults to the
+                current date.
+        """
+        if self._origin is None or self._state.last_met_index is None:
+            return 0
+
+        day = _goalmath.to_date(today) if today else datetime.date.today()
+        today_index = _goalmath.period_index(self._origin, day, self._unit, self._period)
+
+        return self._state.streak if self._state.last_met_index >= today_index - 1 else 0
+
+    def add(self, tally: models.Tally) -> bool:
+        """
+        Add a tally to the tracked state.
+
+        Args:
+            tally (Tally): A new tally
+
+        Returns:
+            True if the tally counted toward the goal, False if it does not apply or
+            belongs to a period earlier than the most recent one.
+        """
+        if not _goalmath.applies(self._goal, tally):
+            return False
+
+        origin = self._origin if self._origin is not None else self._set_origin(tally.date)
+        state = self._state
+        day = _goalmath.to_date(tally.date)
+        index = _goalmath.period_index(origin, day, self._unit, self._period)
+
+        if index < 0 or (state.period_index is not None and index < state.period_index):
+            self.logger.debug(
+                "Ignoring tally %s of a closed period for goal %d", tally.id, state.goal_id
+            )
+            return False
+
+        if state.period_index is None or index > state.period_index:
+            state.period_index = index
+            state.period_total = 0
+
+        state.period_total += tally.count if self._threshold is not None else 1
+
+        needed = max(self._threshold.count, 1) if self._threshold is not None else 1
+        if state.last_met_index != index and state.period_total >= needed:
+            state.streak = state.streak + 1 if state.last_met_index == index - 1 else 1
+            state.longest_streak = max(state.longest_streak, state.streak)
+            state.last_met_index = index
+
+        return True
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the state as a JSON serializable dictionary."""
+        return dataclasses.asdict(self._state)
+
+    @classmethod
+    def from_dict(cls, goal: models.Goal, data: dict[str, Any]) -> HabitStreakTracker:
+        """
+        Restore a tracker from the output of `to_dict()`.
+
+        Raises:
+            ValueError: If the goal is not a habit or the state belongs to another goal
+        """
+        return cls(goal, StreakState(**data))
+
+    def _set_origin(self, date: str) -> datetime.date:
+        """Anchor period zero at the start of the cadence unit containing `date`."""
+        self._origin = _goalmath.align(_goalmath.to_date(date), self._unit)
+        self._state.origin = self._origin.isoformat()
+        return self._origin
@@ -0,0 +1,180 @@
+"""Answer tally filters locally with range scans over a tally list fetched once."""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+import re
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Sequence
+
+from . import enums
+from . import models
+
+__all__ = ["TallyIndex"]
+
+_DATE_PATTERN = re.compile(r"[\d]{4}-[\d]{2}-[\d]{2}")
+
+
+class TallyIndex:
+    """
+    Immutable index of tallies answering the filters of `TallyClient.list()`.
+
+    Tallies are held in date order. Each project and measure pair keeps a sorted
+    array of its tally dates, and each tag a posting list of its tallies in date
+    order, so a query is a binary search per matching project and measure, or per
+    tag, instead of a scan of every tally.
+    """
+
+    def __init__(self, tallies: Iterable[models.Tally]) -> None:
+        """
+        Build the index.
+
+        Args:
+            tallies (Iterable[Tally]): Tallies to index, usually a full `tally.list()`
+        """
+        self._tallies = sorted(tallies, key=lambda tally: (tally.date, tally.id))
+        self._dates = [tally.date for tally in self._tallies]
+        self._works: dict[int, list[enums.Measure]] = {}
+        self._buckets: dict[tuple[int, enums.Measure], tuple[list[str], list[int]]] = {}
+        self._postings: dict[int, list[int]] = {}
+        self._tag_ids: dict[str, int] = {}
+
+        for position, tally in enumerate(self._tallies):
+            key = (tally.work_id, tally.measure)
+            if key not in self._buckets:
+                self._buckets[key] = ([], [])
+                self._works.setdefault(tally.work_id, []).append(tally.measure)
+
+            dates, positions = self._buckets[key]
+            dates.append(tally.date)
+            positions.append(position)
+
+            for tag in tally.tags:
+                self._postings.setdefault(tag.id, []).append(position)
+                self._tag_ids[tag.name] = tag.id
+
+    def __len__(self) -> int:
+        return len(self._tallies)
+
+    def __iter__(self) -> Iterator[models.Tally]:
+        return iter(self._tallies)
+
+    def query(
+        self,
+        works: Sequence[int] | None = None,
+        tags: Sequence[int | str] | None = None,
+        measure: enums.Measure | str | None = None,
+        start_date: str | None = None,
+        end_date: str | None = None,
+    ) -> Sequence[models.Tally]:
+        """
+        Return the indexed tallies matching the filters, in date order.
+
+        Filters match as they do for `TallyClient.list()`: a tally matches if it
+        belongs to any of `works` and carries any of `tags`. Empty filters match
+        everything. Tag names are resolved against the tags of the indexed tallies,
+        so a name no indexed tally carries matches nothing.
+
+        Args:
+            works (Sequence[int]): (Optional) List of project ids
+            tags: (Sequence[int | str]): (Optional) List of tag ids or tag names
+            measure (Measure | str): (Optional) Measure enum of the following: `word`,
+                `time`, `page`, `chapter`, `scene`, or `line`.
+            start_date (str): (Optional) Starting date, inclusive (YYYY-MM-DD)
+            end_date (str): (Optional) Ending date, inclusive (YYYY-MM-DD)
+
+        Returns:
+            A sequence of trackbear_api.models.Tally
+
+        Raises:
+            ValueError: When `measure` is not a valid value
+            ValueError: If `start_date` or `end_date` are not "YYYY-MM-DD"
+        """
+        if measure is not None:
+            measure = enums.Measure(measure)
+
+        if start_date is not None and _DATE_PATTERN.match(start_date) is None:
+            raise ValueError(f"Invalid start_date '{start_date}'. Must be YYYY-MM-DD")
+
+        if end_date is not None and _DATE_PATTERN.match(end_date) is None:
+            raise ValueError(f"Invalid end_date '{end_date}'. Must be YYYY-MM-DD")
+
+        if tags:
+            positions = self._tag_positions(tags, works, measure, start_date, end_date)
+
+        elif works or measure is not None:
+            positions = self._bucket_positions(works, measure, start_date, end_date)
+
+        else:
+            positions = range(*_date_range(self._dates, start_date, end_date))
+
+        return [self._tallies[position] for position in positions]
+
+    def _bucket_positions(
+        self,
+        works: Sequence[int] | None,
+        measure: enums.Measure | None,
+        start_date: str | None,
+        end_date: str | None,
+    ) -> Iterable[int]:
+        """Merge the date ranges of each matching project and measure."""
+        ranges = []
+        for work_id in works if works else self._works:
+            for work_measure in self._works.get(work_id, []):
+                if measure is not None and work_measure != measure:
+                    continue
+
+                dates, positions = self._buckets[(work_id, work_measure)]
+                low, high = _date_range(dates, start_date, end_date)
+                ranges.append(positions[low:high])
+
+        # Projects may be repeated in the filter; their ranges are only merged once
+        return _unique(heapq.merge(*ranges)) if works else heapq.merge(*ranges)
+
+    def _tag_positions(
+        self,
+        tags: Sequence[int | str],
+        works: Sequence[int] | None,
+        measure: enums.Measure | None,
+        start_date: str | None,
+        end_date: str | None,
+    ) -> Iterable[int]:
+        """Merge the date ranges of each tag's postings, then filter by project and measure."""
+        low, high = _date_range(self._dates, start_date, end_date)
+        tag_ids = {tag if isinstance(tag, int) else self._tag_ids.get(tag) for tag in tags}
+
+        ranges = []
+        for tag_id in tag_ids:
+            postings = self._postings.get(tag_id, []) if tag_id is not None else []
+            ranges.append(
+                postings[bisect.bisect_left(postings, low) : bisect.bisect_left(postings, high)]
+            )
+
+        work_ids = set(works) if works else None
+        for position in _unique(heapq.merge(*ranges)):
+            tally = self._tallies[position]
+            if work_ids is not None and tally.work_id not in work_ids:
+                continue
+
+            if measure is not None and tally.measure != measure:
+                continue
+
+            yield position
+
+
+def _date_range(dates: list[str], start_date: str | None, end_date: str | None) -> tuple[int, int]:
+    """Return the slice of sorted `dates` between the inclusive dates."""
+    low = bisect.bisect_left(dates, start_date) if start_date is not None else 0
+    high = bisect.bisect_right(dates, end_date) if end_date is not None else len(dates)
+    return low, max(low, high)
+
+
+def _unique(positions: Iterable[int]) -> Iterator[int]:
+    """Drop repeats from sorted positions."""
+    previous = -1
+    for position in positions:
+        if position != previous:
+            yield position
+            previous = position
@@ -1,18 +1,41 @@
 from __future__ import annotations
 
-import importlib.metadata
+import concurrent.futures
+import contextlib
+import contextvars
+import functools
 import logging
 import os
+import threading
+import time
+from collections.abc import Callable
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Generic
+from typing import TypeVar
+from typing import overload
 
-import requests
-
+from . import _deadline
+from . import enums
 from ._apiclient import APIClient
-from ._goalclient import GoalClient
-from ._leaderboardclient import LeaderboardClient
-from ._projectclient import ProjectClient
-from ._statclient import StatClient
-from ._tagclient import TagClient
-from ._tallyclient import TallyClient
+from ._cache import ResponseCache
+from ._ratelimit import prioritized
+from .transport import RequestsTransport
+from .transport import Transport
+from .transport import Urllib3Transport
+
+if TYPE_CHECKING:
+    import requests
+
+    from ._goalclient import GoalClient
+    from ._leaderboardclient import LeaderboardClient
+    from ._projectclient import ProjectClient
+    from ._statclient import StatClient
+    from ._tagclient import TagClient
+    from ._tallyclient import TallyClient
+    from .circuitbreaker import CircuitBreaker
+    from .hedging import HedgePolicy
 
 __all__ = ["TrackBearClient"]
 
@@ -23,9 +46,60 @@ _URL_ENVIRON = "TRACKBEAR_API_URL"
 _TIMEOUT_SECONDS = "TRACKBEAR_API_TIMEOUT_SECONDS"
 
 # Default values, can be overridden by user
-_DEFAULT_USER_AGENT = f"trackbear-api/{importlib.metadata.version('trackbear-api')} (https://github.com/Preocts/trackbear-api) by Preocts"
 _DEFAULT_API_URL = "https://trackbear.app/api/v1"
 _DEFAULT_TIMEOUT_SECONDS = 10
+_DEFAULT_CACHE_SECONDS = 300
+
+# Resources which can be loaded into the cache by `TrackBearClient.warm()`
+_WARMABLE_RESOURCES = ("project", "tag", "goal", "leaderboard")
+
+
+_T = TypeVar("_T")
+
+
+class _sub_client(Generic[_T]):
+    """
+    Like `functools.cached_property`, but built under the client's lock.
+
+    From Python 3.12 `cached_property` no longer locks, so threads racing on first
+    access could each build, and keep using, their own sub-client.
+    """
+
+    def __init__(self, build: Callable[[TrackBearClient], _T]) -> None:
+        self._build = build
+        self._name = build.__name__
+        self.__doc__ = build.__doc__
+
+    @overload
+    def __get__(self, instance: None, owner: type[Any] | None = None) -> _sub_client[_T]: ...
+
+    @overload
+    def __get__(self, instance: TrackBearClient, owner: type[Any] | None = None) -> _T: ...
+
+    def __get__(
+        self,
+        instance: TrackBearClient | None,
+        owner: type[Any] | None = None,
+    ) -> _sub_client[_T] | _T:
+        if instance is None:
+            return self
+
+        # Once stored, the instance attribute is found before this descriptor
+        with instance._sub_client_lock:
+            if self._name not in instance.__dict__:
+                instance.__dict__[self._name] = self._build(instance)
+
+            value: _T = instance.__dict__[self._name]
+            return value
+
+
+@functools.cache
+def _default_user_agent() -> str:
+    """Build the default User-Agent, looking up the installed version on first use."""
+    import importlib.metadata
+
+    version = importlib.metadata.version("trackbear-api")
+    return f"trackbear-api/{version} (https://github.com/Preocts/trackbear-api) by Preocts"
 
 
 class TrackBearClient:
@@ -40,6 +114,11 @@ class TrackBearClient:
         api_url: str | None = None,
         user_agent: str | None = None,
         timeout_seconds: int | None = None,
+        cache_seconds: int | None = None,
+        preload: Sequence[str] | None = None,
+        transport: str | Transport | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        hedging: HedgePolicy | None = None,
     ) -> None:
         """
         Initialize the client.
@@ -58,9 +137,24 @@ class TrackBearClient:
                 https://help.trackbear.app/api/authentication#identifying-your-app
             timeout_seconds (int): (Optional) Number of seconds to wait for a response
                 from the API before raising an exception.
+            cache_seconds (int): (Optional) Cache successful GET responses for this
+                many seconds. Any write through the client clears the cache. Disabled
+                by default unless `preload` is provided.
+            preload (Sequence[str]): (Optional) Resources to load into the cache when
+                the client is created. Any of `project`, `tag`, `goal`, and
+                `leaderboard`. Enables a 300 second cache if `cache_seconds` is unset.
+            transport (str | Transport): (Optional) Sends the HTTP requests. Either
+                `requests` (default), `urllib3`, or a Transport instance whose headers
+                are updated with the Authorization and User-Agent headers.
+            circuit_breaker (CircuitBreaker): (Optional) Fail requests fast while their
+                route group keeps failing. Disabled by default.
+            hedging (HedgePolicy): (Optional) Send a second request for GETs slower
+                than usual and use the first response. Disabled by default.
 
         Raises:
             ValueError: If API token is not provided or an empty string.
+            ValueError: If `preload` contains an unknown resource.
+            ValueError: If `transport` is an unknown transport name.
         """
 
         api_token = self._pick_config_value(api_token, _TOKEN_ENVIRON, "")
@@ -69,7 +163,8 @@ class TrackBearClient:
             self.logger.error("%s", msg)
             raise ValueError(msg)
 
-        user_agent = self._pick_config_value(user_agent, _USER_AGENT_ENVIRON, _DEFAULT_USER_AGENT)
+        user_agent = self._pick_config_value(user_agent, _USER_AGENT_ENVIRON, "")
+        user_agent = user_agent or _default_user_agent()
 
         api_url = self._pick_config_value(api_url, _URL_ENVIRON, _DEFAULT_API_URL)
         api_url = api_url.rstrip("/") if api_url.endswith("/") else api_url
@@ -85,17 +180,178 @@ class TrackBearClient:
         self.logger.debug("Initialized TrackBearClient with url: %s", api_url)
         self.logger.debug("Initialized TrackBearClient with timeout: %s seconds", timeout)
 
-        session = self._get_request_session(api_token, user_agent)
-        self._api_client = APIClient(session, api_url, int(timeout))
+        self._api_client = APIClient(
+            self._get_transport(transport, api_token, user_agent),
+            api_url,
+            int(timeout),
+        )
+
+        if preload and cache_seconds is None:
+            cache_seconds = _DEFAULT_CACHE_SECONDS
 
-        # Define all client provider references
+        if cache_seconds:
+            self.logger.debug("Initialized TrackBearClient with cache: %s seconds", cache_seconds)
+            self._api_client.cache = ResponseCache(cache_seconds)
+
+        self._api_client.circuit_breaker = circuit_breaker
+        self._api_client.hedging = hedging
+
+        # Client providers are built on first access, under this (re-entrant) lock
+        self._sub_client_lock = threading.RLock()
         self.bare = self._api_client
-        self.project = ProjectClient(self._api_client)
-        self.goal = GoalClient(self._api_client)
-        self.tag = TagClient(self._api_client)
-        self.stat = StatClient(self._api_client)
-        self.tally = TallyClient(self._api_client)
-        self.leaderboard = LeaderboardClient(self._api_client)
+
+        if preload:
+            self.warm(preload)
+
+    @_sub_client
+    def project(self) -> ProjectClient:
+        """Project routes of the API."""
+        from ._projectclient import ProjectClient
+
+        return ProjectClient(self._api_client)
+
+    @_sub_client
+    def tag(self) -> TagClient:
+        """Tag routes of the API."""
+        from ._tagclient import TagClient
+
+        return TagClient(self._api_client)
+
+    @_sub_client
+    def goal(self) -> GoalClient:
+        """Goal routes of the API."""
+        from ._goalclient import GoalClient
+
+        return GoalClient(self._api_client, self.tag)
+
+    @_sub_client
+    def stat(self) -> StatClient:
+        """Stat routes of the API."""
+        from ._statclient import StatClient
+
+        return StatClient(self._api_client)
+
+    @_sub_client
+    def tally(self) -> TallyClient:
+        """Tally routes of the API."""
+        from ._tallyclient import TallyClient
+
+        return TallyClient(self._api_client, self.tag)
+
+    @_sub_client
+    def leaderboard(self) -> LeaderboardClient:
+        """Leaderboard routes of the API."""
+        from ._leaderboardclient import LeaderboardClient
+
+        return LeaderboardClient(self._api_client)
+
+    def priority(self, priority: enums.Priority | str) -> contextlib.AbstractContextManager[None]:
+        """
+        Context manager setting the priority of requests made within it.
+
+        Background requests leave a share of the rate limit budget to interactive
+        requests and wait while the budget is low. Requests are interactive by default.
+        The priority follows the current thread or asyncio task.
+
+        Args:
+            priority (Priority | str): `interactive` or `background`
+
+        Raises:
+            ValueError: If `priority` is not a valid value
+        """
+        return prioritized(priority)
+
+    def deadline(self, seconds: float) -> contextlib.AbstractContextManager[None]:
+        """
+        Context manager setting an overall budget of seconds for the requests within it.
+
+        Each request's timeout shrinks to the time left, and requests fail fast with
+        `DeadlineExceededError` once the budget is spent, including while waiting for
+        rate limit budget. Nested deadlines never extend the enclosing one. The
+        deadline follows the current thread or asyncio task.
+
+        Args:
+            seconds (float): Overall budget of the requests in seconds
+
+        Raises:
+            ValueError: If `seconds` is not greater than 0
+        """
+        return _deadline.deadline(seconds)
+
+    def warm(
+        self,
+        resources: Sequence[str] = _WARMABLE_RESOURCES,
+        *,
+        max_workers: int = 4,
+        deadline_seconds: float | None = None,
+    ) -> dict[str, float]:
+        """
+        Concurrently load resources into the client's cache.
+
+        Progress and timings are logged at INFO level. Failures are logged and do not
+        stop the remaining resources from loading.
+
+        Args:
+            resources (Sequence[str]): Any of `project`, `tag`, `goal`, and
+                `leaderboard`. (default: all)
+            max_workers (int): Number of concurrent requests (default: 4)
+            deadline_seconds (float): (Optional) Overall budget of the warmup in
+                seconds. Resources not loaded in time are logged as failures.
+
+        Returns:
+            Mapping of each loaded resource to the seconds it took to load
+
+        Raises:
+            ValueError: If `resources` contains an unknown resource
+        """
+        unknown = [resource for resource in resources if resource not in _WARMABLE_RESOURCES]
+        if unknown:
+            raise ValueError(f"Unknown resources {unknown}. Expected any of {_WARMABLE_RESOURCES}")
+
+        if self._api_client.cache is None:
+            self.logger.warning("Warming resources without a cache enabled has no effect")
+
+        def load(resource: str) -> float:
+            started = time.perf_counter()
+            getattr(self, resource).list()
+            return time.perf_counter() - started
+
+        self.logger.info("Warming %d resources: %s", len(resources), ", ".join(resources))
+        started = time.perf_counter()
+        timings: dict[str, float] = {}
+
+        # Workers run in copies of the caller's context, within the deadline if given
+        with contextlib.ExitStack() as stack:
+            if deadline_seconds is not None:
+                stack.enter_context(_deadline.deadline(deadline_seconds))
+            context = contextvars.copy_context()
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(context.copy().run, load, resource): resource
+                for resource in resources
+            }
+
+            for future in concurrent.futures.as_completed(futures):
+                resource = futures[future]
+                try:
+                    timings[resource] = future.result()
+
+                except Exception as err:
+                    self.logger.error("Failed to warm %s: %s", resource, err)
+                    continue
+
+                self.logger.info(
+                    "Warmed %s in %.3f seconds (%d/%d)",
+                    resource,
+                    timings[resource],
+                    len(timings),
+                    len(resources),
+                )
+
+        self.logger.info("Warmup finished in %.3f seconds", time.perf_counter() - started)
+
+        return timings
 
     def _pick_config_value(
         self,
@@ -119,8 +375,35 @@ class TrackBearClient:
         self.logger.debug("Using default value for %s", environ_key)
         return str(default)
 
+    def _get_transport(
+        self,
+        transport: str | Transport | None,
+        api_token: str,
+        user_agent: str,
+    ) -> Transport:
+        """Build or configure the transport with the required headers for API calls."""
+        if transport is None or transport == "requests":
+            return RequestsTransport(session=self._get_request_session(api_token, user_agent))
+
+        headers = {
+            "User-Agent": user_agent,
+            "Authorization": f"Bearer {api_token}",
+        }
+
+        if transport == "urllib3":
+            return Urllib3Transport(headers)
+
+        if isinstance(transport, str):
+            raise ValueError(f"Unknown transport {transport!r}. Expected 'requests' or 'urllib3'")
+
+        self.logger.debug("Initialized TrackBearClient with transport: %s", type(transport))
+        transport.headers.update(headers)
+        return transport
+
     def _get_request_session(self, api_token: str, user_agent: str) -> requests.sessions.Session:
         """Build a Session with required headers for API calls."""
+        import requests
+
         session = requests.sessions.Session()
 
         session.headers = {
@@ -0,0 +1,341 @@
+"""HTTP transports used by the TrackBearClient to send requests."""
+
+from __future__ import annotations
+
+import collections
+import dataclasses
+import json
+import urllib.parse
+from collections.abc import Mapping
+from collections.abc import MutableMapping
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Protocol
+
+if TYPE_CHECKING:
+    import requests
+    import urllib3
+
+__all__ = [
+    "InMemoryTransport",
+    "RecordedRequest",
+    "RequestsTransport",
+    "Transport",
+    "TransportResponse",
+    "Urllib3Transport",
+]
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class TransportResponse:
+    """
+    Raw HTTP response returned by a Transport.
+
+    The APIClient reads the rate limit state from the `RateLimit` and
+    `RateLimit-Policy` headers.
+    """
+
+    status_code: int
+    headers: Mapping[str, str]
+    body: bytes
+
+    @property
+    def ok(self) -> bool:
+        """True if the status code is less than 400."""
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        """The body decoded as UTF-8."""
+        return self.body.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        """The body decoded as JSON."""
+        return json.loads(self.body)
+
+
+class Transport(Protocol):
+    """
+    Sends the HTTP requests of an APIClient.
+
+    `headers` are sent with every request and hold the Authorization and User-Agent
+    headers set by the TrackBearClient. Implementations raise TimeoutError when a
+    request times out. Other failures to reach the server raise the
+    `requests.exceptions.ConnectionError` the default transport raises.
+    """
+
+    @property
+    def headers(self) -> MutableMapping[str, str]:
+        """Headers sent with every request."""
+        ...
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        payload: Mapping[str, Any] | None = None,
+        timeout: float,
+    ) -> TransportResponse:
+        """
+        Send a request.
+
+        Args:
+            method (str): HTTP method
+            url (str): Full url of the request
+            params (Mapping): (Optional) URL query parameters
+            payload (Mapping): (Optional) Body of the request, sent as JSON
+            timeout (float): Seconds to wait for the server
+
+        Raises:
+            TimeoutError: If the request times out
+            requests.exceptions.ConnectionError: If the server cannot be reached
+        """
+        ...
+
+    def close(self) -> None:
+        """Release the connections held by the transport."""
+        ...
+
+
+class RequestsTransport:
+    """Transport backed by a `requests` Session. The default transport."""
+
+    def __init__(
+        self,
+        headers: Mapping[str, str] | None = None,
+        *,
+        session: requests.Session | None = None,
+    ) -> None:
+        """
+        Initialize the transport.
+
+        Args:
+            headers (Mapping): (Optional) Headers sent with every request
+            session (Session): (Optional) Session to send requests with
+        """
+        import requests
+
+        self._timeout_error = requests.exceptions.Timeout
+        self.session = session if session is not None else requests.Session()
+        self.session.headers.update(headers or {})
+
+    @property
+    def headers(self) -> MutableMapping[str, str]:
+        """The headers of the session."""
+        # Session headers also accept bytes values, which are never set here
+        return self.session.headers  # type: ignore[return-value]
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        payload: Mapping[str, Any] | None = None,
+        timeout: float,
+    ) -> TransportResponse:
+        """Send a request through the session."""
+        try:
+            response = self.session.request(
+                method,
+                url,
+                params=params,
+                json=payload,
+                timeout=timeout,
+            )
+
+        except self._timeout_error as err:
+            raise TimeoutError(str(err)) from err
+
+        return TransportResponse(response.status_code, response.headers, response.content)
+
+    def close(self) -> None:
+        """Close the session."""
+        self.session.close()
+
+
+class Urllib3Transport:
+    """
+    Transport sending requests directly through a urllib3 PoolManager.
+
+    Skips the per-request work of a requests Session (hooks, cookies, adapter lookup,
+    and settings merging). urllib3 is installed as a dependency of requests.
+    """
+
+    def __init__(
+        self,
+        headers: Mapping[str, str] | None = None,
+        *,
+        pool_manager: urllib3.PoolManager | None = None,
+        maxsize: int = 10,
+    ) -> None:
+        """
+        Initialize the transport.
+
+        Args:
+            headers (Mapping): (Optional) Headers sent with every request
+            pool_manager (PoolManager): (Optional) PoolManager to send requests with
+            maxsize (int): Connections kept per host when creating a PoolManager
+                (default: 10)
+        """
+        import urllib3
+
+        self._urllib3 = urllib3
+        self.headers: MutableMapping[str, str] = dict(headers or {})
+        self.pool_manager = pool_manager or urllib3.PoolManager(maxsize=maxsize, retries=False)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        payload: Mapping[str, Any] | None = None,
+        timeout: float,
+    ) -> TransportResponse:
+        """Send a request through the pool manager."""
+        headers = dict(self.headers)
+        body = None
+
+        if params:
+            url = f"{url}?{urllib.parse.urlencode(params, doseq=True)}"
+
+        if payload is not None:
+            body = json.dumps(payload).encode()
+            headers["Content-Type"] = "application/json"
+
+        try:
+            response = self.pool_manager.request(
+                method,
+                url,
+                body=body,
+                headers=headers,
+                timeout=self._urllib3.Timeout(connect=timeout, read=timeout),
+                retries=False,
+            )
+
+        # urllib3 counts a refused connection as a timeout; requests does not
+        except self._urllib3.exceptions.NewConnectionError as err:
+            raise _connection_error(err) from err
+
+        except self._urllib3.exceptions.TimeoutError as err:
+            raise TimeoutError(str(err)) from err
+
+        except self._urllib3.exceptions.HTTPError as err:
+            raise _connection_error(err) from err
+
+        return TransportResponse(response.status, response.headers, response.data)
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self.pool_manager.clear()
+
+
+def _connection_error(err: Exception) -> Exception:
+    """Wrap a urllib3 error as the ConnectionError the requests transport raises."""
+    # Deferred as requests is only needed when a request fails
+    import requests
+
+    return requests.exceptions.ConnectionError(err)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class RecordedRequest:
+    """A request received by an InMemoryTransport."""
+
+    method: str
+    url: str
+    params: Mapping[str, Any] | None
+    payload: Mapping[str, Any] | None
+    headers: Mapping[str, str]
+
+
+class InMemoryTransport:
+    """
+    Transport answering requests with registered responses, without any network.
+
+    Responses are registered per method and url (without query parameters) and
+    returned in the order added; the last one repeats. Every request is recorded in
+    `requests`.
+
+    Example:
+        transport = InMemoryTransport()
+        transport.add("GET", "https://trackbear.app/api/v1/project", data=[])
+        client = TrackBearClient(api_token="token", transport=transport)
+    """
+
+    def __init__(self) -> None:
+        self.headers: MutableMapping[str, str] = {}
+        self.requests: list[RecordedRequest] = []
+        self._responses: dict[tuple[str, str], collections.deque[TransportResponse | Exception]]
+        self._responses = {}
+
+    def add(
+        self,
+        method: str,
+        url: str,
+        *,
+        data: Any = None,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        body: bytes | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        """
+        Register a response.
+
+        Args:
+            method (str): HTTP method to answer
+            url (str): Url to answer, without query parameters
+            data (Any): (Optional) `data` of a successful TrackBear API response body
+            status_code (int): Status code of the response (default: 200)
+            headers (Mapping): (Optional) Response headers. Defaults to a RateLimit
+                header with budget to spare.
+            body (bytes): (Optional) Raw body, replacing the one built from `data`
+            error (Exception): (Optional) Raise this instead of responding
+        """
+        key = (method.upper(), url)
+        if error is not None:
+            self._responses.setdefault(key, collections.deque()).append(error)
+            return
+
+        if body is None:
+            body = json.dumps({"success": True, "data": data}).encode()
+
+        if headers is None:
+            headers = {"RateLimit": '"100-in-1min"; r=100; t=60'}
+
+        response = TransportResponse(status_code, dict(headers), body)
+        self._responses.setdefault(key, collections.deque()).append(response)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        payload: Mapping[str, Any] | None = None,
+        timeout: float,
+    ) -> TransportResponse:
+        """
+        Answer a request with its next registered response.
+
+        Raises:
+            LookupError: If no response is registered for the method and url
+        """
+        self.requests.append(RecordedRequest(method, url, params, payload, dict(self.headers)))
+
+        queue = self._responses.get((method.upper(), url))
+        if not queue:
+            raise LookupError(f"No response registered for {method} {url}")
+
+        response = queue.popleft() if len(queue) > 1 else queue[0]
+        if isinstance(response, Exception):
+            raise response
+
+        return response
+
+    def close(self) -> None:
+        """Nothing to release."""
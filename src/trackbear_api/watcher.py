@@ -0,0 +1,247 @@
+"""Poll leaderboards and emit only what changed between polls to subscribers."""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import logging
+import threading
+from collections.abc import Callable
+from collections.abc import Mapping
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+from . import models
+from .standings import LeaderboardStandings
+
+if TYPE_CHECKING:
+    from .trackbearclient import TrackBearClient
+
+__all__ = [
+    "LeaderboardDelta",
+    "LeaderboardWatcher",
+]
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class LeaderboardDelta:
+    """
+    Changes to a leaderboard since the previous poll.
+
+    `new_tallies` holds tallies added or edited, by participant uuid. `rank_changes`
+    holds (previous rank, new rank) of participants entering, leaving, or moving
+    within the watched top ranks, None meaning outside of them.
+    """
+
+    board_uuid: str
+    joined: Sequence[str]
+    left: Sequence[str]
+    new_tallies: Mapping[str, Sequence[models.TallyStub]]
+    rank_changes: Mapping[str, tuple[int | None, int | None]]
+
+    def __bool__(self) -> bool:
+        return bool(self.joined or self.left or self.new_tallies or self.rank_changes)
+
+
+@dataclasses.dataclass(slots=True)
+class _BoardState:
+    """What the watcher knows about a single board."""
+
+    standings: LeaderboardStandings
+    hashes: dict[str, bytes]
+    tallies: dict[str, dict[str, models.TallyStub]]
+    ranks: dict[str, int]
+
+
+def _participant_hash(participant: models.Participant) -> bytes:
+    """Hash a participant's goal and tally set, independent of tally order."""
+    digest = hashlib.blake2b(digest_size=16)
+    goal = participant.goal
+    digest.update(f"{goal.measure}|{goal.count}\n".encode() if goal is not None else b"-\n")
+    for tally in sorted(participant.tallies, key=lambda tally: tally.uuid):
+        digest.update(f"{tally.uuid}|{tally.date}|{tally.measure}|{tally.count}\n".encode())
+    return digest.digest()
+
+
+class LeaderboardWatcher:
+    """
+    Poll one or more leaderboards and publish deltas to subscribers.
+
+    Each participant's goal and tally set are hashed, so unchanged participants are
+    skipped without comparing tallies. Deltas are only published when something changed.
+    The polling interval adapts to the rate limit budget left on the client.
+
+    Polls read through the client's response cache when one is enabled; use a cache
+    shorter than `min_interval`, or none, on a client used for watching.
+    """
+
+    logger = logging.getLogger("trackbear-api")
+
+    def __init__(
+        self,
+        client: TrackBearClient,
+        board_uuids: Sequence[str],
+        *,
+        top_k: int = 10,
+        min_interval: float = 15.0,
+        max_interval: float = 300.0,
+        budget_share: float = 0.5,
+    ) -> None:
+        """
+        Initialize the watcher.
+
+        Args:
+            client (TrackBearClient): Client used to poll the leaderboards
+            board_uuids (Sequence[str]): Leaderboards to watch
+            top_k (int): Number of top ranks watched for rank changes (default: 10)
+            min_interval (float): Fewest seconds between polls (default: 15.0)
+            max_interval (float): Most seconds between polls (default: 300.0)
+            budget_share (float): Share of the remaining rate limit budget the watcher
+                may spend before the window resets (default: 0.5)
+        """
+        if not 0 < budget_share <= 1:
+            raise ValueError("budget_share must be greater than 0 and at most 1")
+
+        self._client = client
+        self._board_uuids = list(board_uuids)
+        self._top_k = top_k
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._budget_share = budget_share
+        self._boards: dict[str, _BoardState] = {}
+        self._subscribers: list[Callable[[LeaderboardDelta], None]] = []
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def subscribe(self, callback: Callable[[LeaderboardDelta], None]) -> Callable[[], None]:
+        """
+        Call `callback` with every non-empty delta.
+
+        Returns:
+            A function which removes the subscription
+        """
+        self._subscribers.append(callback)
+        return lambda: self._subscribers.remove(callback)
+
+    def standings(self, board_uuid: str) -> LeaderboardStandings | None:
+        """Return the current standings of a watched board, None before its first poll."""
+        board = self._boards.get(board_uuid)
+        return board.standings if board is not None else None
+
+    def poll(self) -> Sequence[LeaderboardDelta]:
+        """
+        Poll every board once, publishing and returning the non-empty deltas.
+
+        Boards which fail to load are logged and skipped until the next poll.
+        """
+        deltas = []
+        for board_uuid in self._board_uuids:
+            try:
+                delta = self._poll_board(board_uuid)
+
+            # Includes lost connections, open circuits, and spent deadlines, which
+            # must not end a running watcher
+            except Exception as err:
+                self.logger.error("Failed to poll leaderboard %s: %s", board_uuid, err)
+                continue
+
+            if delta:
+                deltas.append(delta)
+                self._publish(delta)
+
+        return deltas
+
+    def next_interval(self) -> float:
+        """
+        Seconds to wait before the next poll.
+
+        Spreads `budget_share` of the remaining requests across the time left in the
+        rate limit window, bounded by `min_interval` and `max_interval`.
+        """
+        remaining = self._client.bare.rate_limit.remaining
+        if remaining is None:
+            return self._min_interval
+
+        reset = self._client.bare.rate_limit.reset
+        polls = remaining * self._budget_share / max(len(self._board_uuids), 1)
+        interval = reset / polls if polls >= 1 else max(reset, self._max_interval)
+
+        return min(max(interval, self._min_interval), self._max_interval)
+
+    def run(self) -> None:
+        """Poll until `stop()` is called. Blocks the calling thread."""
+        self._stop.clear()
+        while not self._stop.is_set():
+            self.poll()
+            self._stop.wait(self.next_interval())
+
+    def start(self) -> threading.Thread:
+        """Run the watcher in a daemon thread."""
+        self._thread = threading.Thread(target=self.run, name="leaderboard-watcher", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self) -> None:
+        """Stop polling, waiting for a running poll to finish."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _publish(self, delta: LeaderboardDelta) -> None:
+        """Deliver a delta to every subscriber, logging their failures."""
+        for callback in list(self._subscribers):
+            try:
+                callback(delta)
+
+            except Exception:
+                self.logger.exception("Leaderboard watcher subscriber failed")
+
+    def _poll_board(self, board_uuid: str) -> LeaderboardDelta:
+        """Fetch the participants of a board and diff them against the last poll."""
+        participants = self._client.leaderboard.list_participants(board_uuid)
+
+        state = self._boards.get(board_uuid)
+        if state is None:
+            board = self._client.leaderboard.get(board_uuid)
+            state = _BoardState(LeaderboardStandings(board), {}, {}, {})
+            self._boards[board_uuid] = state
+
+        current = {participant.uuid: participant for participant in participants}
+        joined = [uuid for uuid in current if uuid not in state.hashes]
+        left = [uuid for uuid in state.hashes if uuid not in current]
+        new_tallies: dict[str, list[models.TallyStub]] = {}
+
+        for uuid, participant in current.items():
+            digest = _participant_hash(participant)
+            if state.hashes.get(uuid) == digest:
+                continue
+
+            # Only participants whose hash changed are diffed against the standings
+            state.standings.replace_participant(participant)
+            state.hashes[uuid] = digest
+            previous = state.tallies.get(uuid, {})
+            tallies = {tally.uuid: tally for tally in participant.tallies}
+            state.tallies[uuid] = tallies
+
+            added = [tally for key, tally in tallies.items() if previous.get(key) != tally]
+            if added:
+                new_tallies[uuid] = added
+
+        for uuid in left:
+            del state.hashes[uuid]
+            del state.tallies[uuid]
+            state.standings.remove_participant(uuid)
+
+        ranks = {
+            standing.participant_uuid: standing.rank
+            for standing in state.standings.top(self._top_k)
+        }
+        rank_changes = {
+            uuid: (state.ranks.get(uuid), ranks.get(uuid))
+            for uuid in ranks.keys() | state.ranks.keys()
+            if state.ranks.get(uuid) != ranks.get(uuid)
+        }
+        state.ranks = ranks
+
+        return LeaderboardDelta(board_uuid, joined, left, new_tallies, rank_changes)
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import pytest
+
+from trackbear_api import TrackBearClient
+from trackbear_api import enums
+from trackbear_api import exceptions
+from trackbear_api._cache import ResponseCache
+from trackbear_api.circuitbreaker import CircuitBreaker
+from trackbear_api.transport import InMemoryTransport
+
+from . import test_parameters
+
+BASE_URL = "https://trackbear.app/api/v1"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock: FakeClock) -> CircuitBreaker:
+    return CircuitBreaker(min_requests=4, failure_rate=0.5, open_seconds=30, clock=clock)
+
+
+def test_circuit_opens_at_failure_rate(breaker: CircuitBreaker) -> None:
+    for failed in (False, True, False):
+        assert breaker.allow("project")
+        breaker.record("project", failed=failed)
+
+    assert breaker.state("project") is enums.CircuitState.CLOSED
+
+    breaker.record("project", failed=True)
+
+    assert breaker.state("project") is enums.CircuitState.OPEN
+    assert not breaker.allow("project")
+    assert breaker.retry_after("project") == 30
+    # Other route groups are unaffected
+    assert breaker.allow("tag")
+
+
+def test_outcomes_outside_window_are_forgotten(breaker: CircuitBreaker, clock: FakeClock) -> None:
+    for _ in range(3):
+        breaker.record("project", failed=True)
+
+    clock.now = 61
+    breaker.record("project", failed=True)
+
+    assert breaker.state("project") is enums.CircuitState.CLOSED
+
+
+def test_half_open_probe_closes_or_reopens(breaker: CircuitBreaker, clock: FakeClock) -> None:
+    for _ in range(4):
+        breaker.record("goal", failed=True)
+
+    clock.now = 30
+    assert breaker.state("goal") is enums.CircuitState.HALF_OPEN
+    assert breaker.allow("goal")
+    # Only a single probe is let through
+    assert not breaker.allow("goal")
+
+    breaker.record("goal", failed=True)
+    assert breaker.state("goal") is enums.CircuitState.OPEN
+    assert not breaker.allow("goal")
+
+    clock.now = 60
+    assert breaker.allow("goal")
+    breaker.record("goal", failed=False)
+
+    assert breaker.state("goal") is enums.CircuitState.CLOSED
+    assert breaker.allow("goal")
+
+
+def test_lost_probe_is_replaced(breaker: CircuitBreaker, clock: FakeClock) -> None:
+    for _ in range(4):
+        breaker.record("goal", failed=True)
+
+    clock.now = 30
+    assert breaker.allow("goal")
+
+    clock.now = 59
+    assert not breaker.allow("goal")
+
+    clock.now = 60
+    assert breaker.allow("goal")
+
+
+def test_reset_closes_every_circuit(breaker: CircuitBreaker) -> None:
+    for _ in range(4):
+        breaker.record("goal", failed=True)
+
+    breaker.reset()
+
+    assert breaker.state("goal") is enums.CircuitState.CLOSED
+
+
+@pytest.mark.parametrize("failure_rate", (0, 1.5))
+def test_failure_rate_must_be_a_share(failure_rate: float) -> None:
+    with pytest.raises(ValueError):
+        CircuitBreaker(failure_rate=failure_rate)
+
+
+def test_client_fails_fast_once_open(breaker: CircuitBreaker) -> None:
+    transport = InMemoryTransport()
+    transport.add("GET", f"{BASE_URL}/project", error=TimeoutError("read timed out"))
+    transport.add("GET", f"{BASE_URL}/tag", data=[])
+    client = TrackBearClient(api_token="token", transport=transport, circuit_breaker=breaker)
+
+    for _ in range(4):
+        with pytest.raises(exceptions.APITimeoutError):
+            client.project.list()
+
+    with pytest.raises(exceptions.CircuitOpenError, match="circuit of 'project' is open"):
+        client.project.get(123)
+
+    assert len(transport.requests) == 4
+    assert client.tag.list() == []
+
+
+def test_client_counts_server_errors_as_failures(breaker: CircuitBreaker) -> None:
+    transport = InMemoryTransport()
+    body = b'{"success": false, "error": {"code": "SERVER_ERROR", "message": "Oops"}}'
+    transport.add("GET", f"{BASE_URL}/goal", status_code=503, body=body)
+    transport.add("GET", f"{BASE_URL}/tag", status_code=404, body=body)
+    client = TrackBearClient(api_token="token", transport=transport, circuit_breaker=breaker)
+
+    for _ in range(4):
+        with pytest.raises(exceptions.APIResponseError):
+            client.tag.list()
+        with pytest.raises(exceptions.APIResponseError):
+            client.goal.list()
+
+    assert breaker.state("tag") is enums.CircuitState.CLOSED
+    assert breaker.state("goal") is enums.CircuitState.OPEN
+
+
+def test_client_serves_stale_cache_while_open(clock: FakeClock) -> None:
+    breaker = CircuitBreaker(min_requests=1, serve_stale=True, clock=clock)
+    transport = InMemoryTransport()
+    url = f"{BASE_URL}/project"
+    transport.add("GET", url, data=[test_parameters.PROJECT_RESPONSE])
+    transport.add("GET", url, error=TimeoutError("read timed out"))
+    client = TrackBearClient(api_token="token", transport=transport, circuit_breaker=breaker)
+    client.bare.cache = ResponseCache(1, clock=clock)
+
+    projects = client.project.list()
+    clock.now = 5
+
+    with pytest.raises(exceptions.APITimeoutError):
+        client.project.list()
+
+    assert client.project.list() == projects
+    assert len(transport.requests) == 2
+
+    # Nothing cached to serve
+    with pytest.raises(exceptions.CircuitOpenError):
+        client.project.get(123)
+
+
+@pytest.mark.parametrize(
+    "error,raised",
+    (
+        (TimeoutError("read timed out"), exceptions.DeadlineExceededError),
+        (ConnectionError("connection refused"), ConnectionError),
+    ),
+)
+def test_client_counts_deadline_and_connection_failures(
+    breaker: CircuitBreaker,
+    error: Exception,
+    raised: type[Exception],
+) -> None:
+    transport = InMemoryTransport()
+    transport.add("GET", f"{BASE_URL}/project", error=error)
+    client = TrackBearClient(api_token="token", transport=transport, circuit_breaker=breaker)
+
+    for _ in range(4):
+        with client.deadline(5):
+            with pytest.raises(raised):
+                client.project.list()
+
+    assert breaker.state("project") is enums.CircuitState.OPEN
+
+
+def test_client_without_breaker_raises_connection_failures() -> None:
+    transport = InMemoryTransport()
+    transport.add("GET", f"{BASE_URL}/project", error=ConnectionError("refused"))
+    client = TrackBearClient(api_token="token", transport=transport)
+
+    with pytest.raises(ConnectionError, match="refused"):
+        client.project.list()
+
+
+def test_late_outcomes_leave_open_circuit(breaker: CircuitBreaker) -> None:
+    assert breaker.retry_after("project") == 0
+    breaker.record("project", failed=True)
+    assert breaker.retry_after("project") == 0
+
+    for _ in range(3):
+        breaker.record("project", failed=True)
+    breaker.record("project", failed=False)
+
+    assert breaker.state("project") is enums.CircuitState.OPEN
+    assert breaker.retry_after("project") == 30
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import csv
+import json
+import pathlib
+
+import pytest
+import responses
+import responses.matchers
+
+from trackbear_api import TrackBearClient
+from trackbear_api import cli
+from trackbear_api import restore
+
+from . import test_parameters
+
+BASE_URL = "https://trackbear.app/api/v1"
+
+ROUTES = {
+    "project": [test_parameters.PROJECT_RESPONSE],
+    "tag": [test_parameters.TAG_RESPONSE],
+    "goal": [test_parameters.GOAL_RESPONSE_THRESHOLD],
+    "tally": [test_parameters.TALLY_RESPONSE],
+    "stats/days": [test_parameters.STAT_RESPONSE],
+    "leaderboard": [test_parameters.LEADERBOARD_EXTENDED_RESPONSE],
+}
+
+
+def add_routes(**overrides: list[dict[str, object]]) -> None:
+    for route, data in ROUTES.items():
+        responses.add(
+            method="GET",
+            url=f"{BASE_URL}/{route}",
+            json={"success": True, "data": overrides.get(route.split("/")[0], data)},
+        )
+
+
+@responses.activate()
+def test_export_writes_ndjson_per_resource(tmp_path: pathlib.Path) -> None:
+    add_routes()
+
+    assert cli.main(["--token", "token", "export", str(tmp_path)]) == 0
+
+    for resource, route in zip(cli.EXPORT_RESOURCES, ROUTES):
+        lines = (tmp_path / f"{resource}.ndjson").read_text().splitlines()
+        assert [json.loads(line) for line in lines] == ROUTES[route]
+
+    manifest = json.loads((tmp_path / restore.MANIFEST_NAME).read_text())
+    assert manifest["counts"] == {resource: 1 for resource in cli.EXPORT_RESOURCES}
+    assert manifest["since"] is None
+    assert not list(tmp_path.glob("*.part"))
+
+
+@responses.activate()
+def test_export_writes_csv_with_nested_json(tmp_path: pathlib.Path) -> None:
+    add_routes()
+
+    args = ["--token", "token", "export", str(tmp_path), "--format", "csv"]
+    assert cli.main(args + ["--resources", "project"]) == 0
+
+    with open(tmp_path / "project.csv", newline="") as file:
+        (row,) = list(csv.DictReader(file))
+
+    assert row["title"] == test_parameters.PROJECT_RESPONSE["title"]
+    assert json.loads(row["totals"]) == test_parameters.PROJECT_RESPONSE["totals"]
+    assert list(row)[0] == "id"
+
+
+@responses.activate()
+def test_export_since_filters_incrementally(tmp_path: pathlib.Path) -> None:
+    old = test_parameters.PROJECT_RESPONSE | {"id": 1, "updatedAt": "2024-12-31T23:59:59Z"}
+    new = test_parameters.PROJECT_RESPONSE | {"id": 2, "updatedAt": "2025-03-01T00:00:00Z"}
+    responses.add(
+        method="GET",
+        url=f"{BASE_URL}/project",
+        json={"success": True, "data": [old, new]},
+    )
+    # A backdated tally is matched on when it was saved, not on its date
+    stale = test_parameters.TALLY_RESPONSE | {"id": 3, "updatedAt": "2024-06-01T00:00:00Z"}
+    backdated = test_parameters.TALLY_RESPONSE | {"id": 4, "updatedAt": "2025-02-02T00:00:00Z"}
+    responses.add(
+        method="GET",
+        url=f"{BASE_URL}/tally",
+        json={"success": True, "data": [stale, backdated]},
+        match=[responses.matchers.query_param_matcher({})],
+    )
+    # Stats have no update time, so every day is exported
+    responses.add(
+        method="GET",
+        url=f"{BASE_URL}/stats/days",
+        json={"success": True, "data": [test_parameters.STAT_RESPONSE]},
+        match=[responses.matchers.query_param_matcher({})],
+    )
+
+    args = ["--token", "token", "export", str(tmp_path), "--since", "2025-01-01"]
+    assert cli.main(args + ["--resources", "project", "tally", "stat"]) == 0
+
+    lines = (tmp_path / "project.ndjson").read_text().splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [2]
+    lines = (tmp_path / "tally.ndjson").read_text().splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [4]
+    lines = (tmp_path / "stat.ndjson").read_text().splitlines()
+    assert [json.loads(line) for line in lines] == [test_parameters.STAT_RESPONSE]
+
+
+@responses.activate()
+def test_export_reports_failed_resources(
+    tmp_path: pathlib.Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    responses.add(
+        method="GET",
+        url=f"{BASE_URL}/tag",
+        status=500,
+        json={"success": False, "error": {"code": "SERVER_ERROR", "message": "Oops"}},
+    )
+    responses.add(method="GET", url=f"{BASE_URL}/goal", json={"success": True, "data": []})
+
+    args = ["--token", "token", "export", str(tmp_path), "--resources", "tag", "goal"]
+    assert cli.main(args) == 1
+
+    assert "failed to export tag" in capsys.readouterr().err
+    assert (tmp_path / "goal.ndjson").exists()
+    assert not (tmp_path / "tag.ndjson").exists()
+
+
+@responses.activate()
+def test_export_failing_midway_removes_partial_file(tmp_path: pathlib.Path) -> None:
+    record = test_parameters.PROJECT_RESPONSE | {"updatedAt": "2025-03-01T00:00:00Z"}
+    broken = {key: value for key, value in record.items() if key != "updatedAt"}
+    responses.add(
+        method="GET",
+        url=f"{BASE_URL}/project",
+        json={"success": True, "data": [record, broken]},
+    )
+    client = TrackBearClient(api_token="token")
+
+    with pytest.raises(KeyError, match="updatedAt"):
+        cli.export_resource(client, "project", str(tmp_path), "ndjson", since="2025-01-01")
+
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize(
+    "resource,file_format,match",
+    (("projects", "ndjson", "Unknown resource"), ("project", "xml", "Unknown format")),
+)
+def test_export_resource_rejects_unknown_names(
+    tmp_path: pathlib.Path,
+    resource: str,
+    file_format: str,
+    match: str,
+) -> None:
+    client = TrackBearClient(api_token="token")
+
+    with pytest.raises(ValueError, match=match):
+        cli.export_resource(client, resource, str(tmp_path), file_format)
+
+
+def test_export_rejects_invalid_since(tmp_path: pathlib.Path) -> None:
+    with pytest.raises(SystemExit) as exc:
+        cli.main(["--token", "token", "export", str(tmp_path), "--since", "yesterday"])
+
+    assert exc.value.code == 2
+
+
+def test_missing_token_is_a_usage_error(
+    tmp_path: pathlib.Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    assert cli.main(["export", str(tmp_path)]) == 2
+    assert "Missing api token" in capsys.readouterr().err
+
+
+def test_no_command_prints_help(capsys: pytest.CaptureFixture[str]) -> None:
+    assert cli.main([]) == 2
+    assert "export" in capsys.readouterr().out
+
+
+def test_cli_import_defers_client() -> None:
+    from .import_test import _loaded_modules
+
+    modules = _loaded_modules("import trackbear_api.cli")
+
+    assert "requests" not in modules
+    assert "trackbear_api.trackbearclient" not in modules
+
+
+@responses.activate()
+def test_restore_reports_counts(tmp_path: pathlib.Path, capsys: pytest.CaptureFixture[str]) -> None:
+    (tmp_path / "tag.ndjson").write_text(json.dumps(test_parameters.TAG_RESPONSE) + "\n")
+    responses.add(method="GET", url=f"{BASE_URL}/tag", json={"success": True, "data": []})
+    responses.add(
+        method="POST",
+        url=f"{BASE_URL}/tag",
+        json={"success": True, "data": test_parameters.TAG_RESPONSE},
+    )
+
+    assert cli.main(["--token", "token", "restore", str(tmp_path)]) == 0
+    assert cli.main(["--token", "token", "restore", str(tmp_path)]) == 0
+
+    err = capsys.readouterr().err
+    assert "Restored 1 tag records (0 skipped, 0 failed)" in err
+    assert "Restored 0 tag records (1 skipped, 0 failed)" in err
+    assert (tmp_path / cli.RESTORE_STATE_NAME).exists()
+
+
+def test_restore_rejects_csv_snapshot(tmp_path: pathlib.Path) -> None:
+    (tmp_path / restore.MANIFEST_NAME).write_text(json.dumps({"format": "csv"}))
+
+    assert cli.main(["--token", "token", "restore", str(tmp_path)]) == 2
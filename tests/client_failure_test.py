@@ -19,6 +19,7 @@ import responses
 
 from trackbear_api import TrackBearClient
 from trackbear_api import exceptions
+from trackbear_api import models
 
 from . import test_parameters
 
@@ -157,6 +158,89 @@ FAILURE_RESPONSE = {
             {"board_uuid": "uuid1234"},
             "https://trackbear.app/api/v1/leaderboard/uuid1234",
         ),
+        (
+            "project.list_raw",
+            {},
+            "https://trackbear.app/api/v1/project",
+        ),
+        (
+            "project.get_raw",
+            {"project_id": 123},
+            "https://trackbear.app/api/v1/project/123",
+        ),
+        (
+            "goal.list_raw",
+            {},
+            "https://trackbear.app/api/v1/goal",
+        ),
+        (
+            "goal.get_raw",
+            {"goal_id": 123},
+            "https://trackbear.app/api/v1/goal/123",
+        ),
+        (
+            "tag.list_raw",
+            {},
+            "https://trackbear.app/api/v1/tag",
+        ),
+        (
+            "tag.get_raw",
+            {"tag_id": 123},
+            "https://trackbear.app/api/v1/tag/123",
+        ),
+        (
+            "tally.list_raw",
+            {},
+            "https://trackbear.app/api/v1/tally",
+        ),
+        (
+            "tally.get_raw",
+            {"tally_id": 123},
+            "https://trackbear.app/api/v1/tally/123",
+        ),
+        (
+            "leaderboard.list_raw",
+            {},
+            "https://trackbear.app/api/v1/leaderboard",
+        ),
+        (
+            "leaderboard.get_raw",
+            {"board_uuid": "uuid1234"},
+            "https://trackbear.app/api/v1/leaderboard/uuid1234",
+        ),
+        (
+            "stat.list_raw",
+            {},
+            "https://trackbear.app/api/v1/stats/days",
+        ),
+        (
+            "leaderboard.list_participants_raw",
+            {"board_uuid": "uuid1234"},
+            "https://trackbear.app/api/v1/leaderboard/uuid1234/participants",
+        ),
+        (
+            "project.update",
+            {"project": models.Project.build(test_parameters.PROJECT_RESPONSE), "title": "new"},
+            "https://trackbear.app/api/v1/project/123",
+        ),
+        (
+            "goal.update",
+            {"goal": models.Goal.build(test_parameters.GOAL_RESPONSE_THRESHOLD), "title": "new"},
+            "https://trackbear.app/api/v1/goal/123",
+        ),
+        (
+            "tag.update",
+            {"tag": models.Tag.build(test_parameters.TAG_RESPONSE), "name": "new"},
+            "https://trackbear.app/api/v1/tag/123",
+        ),
+        (
+            "leaderboard.update",
+            {
+                "board": models.Leaderboard.build(test_parameters.LEADERBOARD_RESPONSE),
+                "title": "new",
+            },
+            f"https://trackbear.app/api/v1/leaderboard/{test_parameters.LEADERBOARD_RESPONSE['uuid']}",
+        ),
     ),
 )
 @responses.activate()
@@ -172,7 +256,7 @@ def test_api_response_error(
     route = fragments[1]
     pattern = r"TrackBear API Failure \(409\) SOME_ERROR_CODE - A human-readable error message"
 
-    methods = {"list": "GET", "get": "GET", "save": "POST", "delete": "DELETE"}
+    methods = {"list": "GET", "get": "GET", "save": "POST", "delete": "DELETE", "update": "PATCH"}
     http_method = methods[route.split("_", 1)[0]]
     if http_method == "POST" and "123" in url:
         http_method = "PATCH"
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+
+import pytest
+import responses
+
+from trackbear_api import TrackBearClient
+from trackbear_api import TrackBearClientPool
+
+
+def test_client_is_reused_per_token() -> None:
+    with TrackBearClientPool() as pool:
+        client = pool.client("token-a")
+
+        assert pool.client("token-a") is client
+        assert pool.client("token-b") is not client
+        assert client.bare.session.headers["Authorization"] == "Bearer token-a"
+        assert len(pool) == 2
+
+
+def test_clients_share_connection_pool_and_keep_own_rate_limit() -> None:
+    """Sessions mount the same adapter while rate limits stay per token."""
+    with TrackBearClientPool() as pool:
+        first = pool.client("token-a")
+        second = pool.client("token-b")
+        first.bare.rate_limit.update(0, 60)
+
+        url = "https://trackbear.app/api/v1/project"
+        assert first.bare.session.get_adapter(url) is second.bare.session.get_adapter(url)
+        assert pool.rate_limit("token-a") is first.bare.rate_limit
+        assert second.bare.rate_limit.remaining is None
+        assert pool.rate_limit("missing") is None
+
+
+def test_least_recently_used_client_is_evicted() -> None:
+    """Idle clients beyond the limit are closed without closing the shared adapter."""
+    with TrackBearClientPool(max_clients=2) as pool:
+        first = pool.client("token-a")
+        pool.client("token-b")
+        pool.client("token-a")
+        pool.client("token-c")
+
+        assert len(pool) == 2
+        assert pool.rate_limit("token-b") is None
+        assert pool.client("token-a") is first
+        assert first.bare.session.adapters
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_client_held_across_eviction_keeps_working() -> None:
+    """An evicted client still held by a caller sends requests outside the shared pool."""
+    url = "https://trackbear.app/api/v1/tag"
+    responses.add(method="GET", url=url, json={"success": True, "data": []})
+
+    with TrackBearClientPool(max_clients=1) as pool:
+        held = pool.client("token-a")
+        shared = held.bare.session.get_adapter(url)
+        pool.client("token-b")
+
+        assert pool.rate_limit("token-a") is None
+        assert held.bare.session.get_adapter(url) is not shared
+        assert held.tag.list() == []
+        assert pool.client("token-b").bare.session.get_adapter(url) is shared
+
+
+def test_busy_client_is_evicted_once_idle() -> None:
+    """Clients with queued or running work stay open beyond the limit until idle."""
+    started = threading.Event()
+    release = threading.Event()
+
+    def hold(client: TrackBearClient) -> None:
+        started.set()
+        release.wait(5)
+
+    with TrackBearClientPool(max_clients=1, max_workers=1) as pool:
+        future = pool.submit("token-a", hold)
+        started.wait(5)
+        pool.client("token-b")
+
+        assert len(pool) == 2
+
+        # The single worker evicts the idle client before it runs the next task
+        after = pool.submit("token-b", lambda _: None)
+        release.set()
+        future.result(timeout=5)
+        after.result(timeout=5)
+
+        assert pool.rate_limit("token-a") is None
+        assert len(pool) == 1
+
+
+def test_cancelled_work_is_skipped() -> None:
+    """Work cancelled while queued is never run."""
+    ran: list[str] = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def hold(client: TrackBearClient) -> None:
+        started.set()
+        release.wait(5)
+
+    with TrackBearClientPool(max_workers=1) as pool:
+        pool.submit("token-a", hold)
+        started.wait(5)
+        cancelled = pool.submit("token-a", lambda _: ran.append("cancelled"))
+        assert cancelled.cancel()
+        after = pool.submit("token-a", lambda _: ran.append("after"))
+        release.set()
+
+        after.result(timeout=5)
+
+    assert ran == ["after"]
+
+
+def test_submit_runs_with_token_client() -> None:
+    with TrackBearClientPool() as pool:
+        future = pool.submit("token-a", lambda client: client.bare.session.headers["Authorization"])
+
+        assert future.result(timeout=5) == "Bearer token-a"
+
+
+def test_submit_propagates_exceptions() -> None:
+    def fail(client: TrackBearClient) -> None:
+        raise RuntimeError("failed")
+
+    with TrackBearClientPool() as pool:
+        with pytest.raises(RuntimeError, match="failed"):
+            pool.submit("token-a", fail).result(timeout=5)
+
+
+def test_queued_work_is_scheduled_fairly() -> None:
+    """A token with a long queue does not hold back the work of other tokens."""
+    order: list[str] = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def hold(client: TrackBearClient) -> None:
+        started.set()
+        release.wait(5)
+
+    def record(name: str) -> Callable[[TrackBearClient], None]:
+        return lambda client: order.append(name)
+
+    with TrackBearClientPool(max_workers=1) as pool:
+        pool.submit("holder", hold)
+        started.wait(5)
+        futures = [pool.submit("noisy", record(f"noisy{n}")) for n in range(4)]
+        futures.append(pool.submit("quiet", record("quiet")))
+        release.set()
+
+        for future in futures:
+            future.result(timeout=5)
+
+    assert order == ["noisy0", "quiet", "noisy1", "noisy2", "noisy3"]
+
+
+def test_token_without_budget_does_not_block_others() -> None:
+    """Work of a token which spent its rate limit waits while other tokens proceed."""
+    pool = TrackBearClientPool(max_workers=1)
+    pool.client("spent").bare.rate_limit.update(0, 60)
+
+    blocked = pool.submit("spent", lambda _: "spent")
+    ready = pool.submit("fresh", lambda _: "fresh")
+
+    assert ready.result(timeout=5) == "fresh"
+    assert not blocked.done()
+
+    pool.close()
+
+    assert blocked.cancelled()
+
+
+def test_closed_pool_rejects_work() -> None:
+    pool = TrackBearClientPool()
+    pool.close()
+
+    with pytest.raises(ValueError):
+        pool.submit("token-a", lambda _: None)
+
+
+def test_empty_token_is_rejected() -> None:
+    with TrackBearClientPool() as pool:
+        with pytest.raises(ValueError):
+            pool.client("")
@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Mapping
+from typing import Any
+
+import pytest
+
+from trackbear_api import TrackBearClient
+from trackbear_api import enums
+from trackbear_api import exceptions
+from trackbear_api._deadline import current_deadline
+from trackbear_api._deadline import deadline
+from trackbear_api._ratelimit import RateLimit
+from trackbear_api._singleflight import SingleFlight
+from trackbear_api.transport import InMemoryTransport
+from trackbear_api.transport import TransportResponse
+
+from . import test_parameters
+
+BASE_URL = "https://trackbear.app/api/v1"
+
+
+class TimeoutRecordingTransport(InMemoryTransport):
+    """Records the timeout of every request."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.timeouts: list[float] = []
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        payload: Mapping[str, Any] | None = None,
+        timeout: float,
+    ) -> TransportResponse:
+        self.timeouts.append(timeout)
+        return super().request(method, url, params=params, payload=payload, timeout=timeout)
+
+
+@pytest.fixture
+def transport() -> TimeoutRecordingTransport:
+    transport = TimeoutRecordingTransport()
+    for resource in ("project", "tag", "goal", "leaderboard"):
+        transport.add("GET", f"{BASE_URL}/{resource}", data=[])
+    return transport
+
+
+@pytest.fixture
+def deadline_client(transport: TimeoutRecordingTransport) -> TrackBearClient:
+    return TrackBearClient(api_token="token", timeout_seconds=10, transport=transport)
+
+
+def test_deadline_shrinks_request_timeout(
+    deadline_client: TrackBearClient,
+    transport: TimeoutRecordingTransport,
+) -> None:
+    deadline_client.project.list()
+
+    with deadline_client.deadline(2):
+        deadline_client.project.list()
+        deadline_client.tag.list()
+
+    assert transport.timeouts[0] == 10
+    assert all(0 < timeout <= 2 for timeout in transport.timeouts[1:])
+    assert transport.timeouts[2] <= transport.timeouts[1]
+
+
+def test_spent_deadline_fails_without_sending(
+    deadline_client: TrackBearClient,
+    transport: TimeoutRecordingTransport,
+) -> None:
+    with deadline_client.deadline(0.01):
+        time.sleep(0.02)
+
+        with pytest.raises(exceptions.DeadlineExceededError, match="deadline of 0.01 seconds"):
+            deadline_client.project.list()
+
+    assert transport.requests == []
+
+
+def test_timeout_within_deadline_raises_deadline_exceeded(
+    deadline_client: TrackBearClient,
+    transport: TimeoutRecordingTransport,
+) -> None:
+    transport.add("GET", f"{BASE_URL}/goal/1", error=TimeoutError("read timed out"))
+
+    with pytest.raises(exceptions.DeadlineExceededError):
+        with deadline_client.deadline(5):
+            deadline_client.bare.get("/goal/1")
+
+    # The client's own timeout is still reported as a timeout
+    with pytest.raises(exceptions.APITimeoutError):
+        with deadline_client.deadline(60):
+            deadline_client.bare.get("/goal/1")
+
+
+def test_single_flight_waiter_is_bound_by_deadline(
+    deadline_client: TrackBearClient,
+    transport: TimeoutRecordingTransport,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    release = threading.Event()
+    request = transport.request
+
+    def slow_request(*args: Any, **kwargs: Any) -> TransportResponse:
+        release.wait(5)
+        return request(*args, **kwargs)
+
+    monkeypatch.setattr(transport, "request", slow_request)
+    leader = threading.Thread(target=deadline_client.project.list)
+    leader.start()
+    test_parameters.wait_until(lambda: bool(deadline_client.bare._flights._calls))
+
+    with pytest.raises(exceptions.DeadlineExceededError):
+        with deadline_client.deadline(0.01):
+            deadline_client.project.list()
+
+    release.set()
+    leader.join(timeout=5)
+
+    assert len(transport.timeouts) == 1
+
+
+def test_deadline_fails_fast_instead_of_waiting_for_rate_limit(
+    deadline_client: TrackBearClient,
+    transport: TimeoutRecordingTransport,
+) -> None:
+    deadline_client.bare.rate_limit.update(remaining=0, reset=60)
+    started = time.monotonic()
+
+    with pytest.raises(exceptions.DeadlineExceededError):
+        with deadline_client.deadline(5):
+            deadline_client.project.list()
+
+    assert time.monotonic() - started < 1
+    assert transport.requests == []
+
+
+def test_nested_deadline_never_extends_enclosing() -> None:
+    assert current_deadline() is None
+
+    with deadline(1):
+        with deadline(30):
+            limit = current_deadline()
+            assert limit is not None
+            assert limit[0] <= 1
+            assert limit[1] == 1
+
+        with deadline(0.5):
+            limit = current_deadline()
+            assert limit is not None
+            assert limit[1] == 0.5
+
+    assert current_deadline() is None
+
+
+def test_deadline_expiring_after_acquire_returns_the_slot(
+    deadline_client: TrackBearClient,
+    transport: TimeoutRecordingTransport,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    rate_limit = deadline_client.bare.rate_limit
+    rate_limit.update(remaining=5, reset=60, limit=10)
+    acquire = rate_limit.acquire
+
+    def slow_acquire(*args: Any, **kwargs: Any) -> bool:
+        acquired = acquire(*args, **kwargs)
+        time.sleep(0.05)
+        return acquired
+
+    monkeypatch.setattr(rate_limit, "acquire", slow_acquire)
+
+    with pytest.raises(exceptions.DeadlineExceededError):
+        with deadline_client.deadline(0.01):
+            deadline_client.project.list()
+
+    assert rate_limit.remaining == 5
+    assert transport.requests == []
+
+
+def test_release_is_capped_at_limit() -> None:
+    rate_limit = RateLimit()
+    rate_limit.release()
+    rate_limit.update(remaining=10, reset=60, limit=10)
+
+    rate_limit.release()
+
+    assert rate_limit.remaining == 10
+
+
+@pytest.mark.parametrize("seconds", (0, -1))
+def test_deadline_requires_positive_seconds(seconds: float) -> None:
+    with pytest.raises(ValueError):
+        deadline(seconds)
+
+
+def test_deadline_follows_warm_workers(
+    deadline_client: TrackBearClient,
+    transport: TimeoutRecordingTransport,
+) -> None:
+    deadline_client.warm(deadline_seconds=3)
+
+    assert len(transport.timeouts) == 4
+    assert all(timeout <= 3 for timeout in transport.timeouts)
+    assert current_deadline() is None
+
+
+def test_rate_limit_acquire_gives_up_after_timeout() -> None:
+    now = [0.0]
+    rate_limit = RateLimit(clock=lambda: now[0])
+    rate_limit.update(remaining=0, reset=30)
+
+    assert rate_limit.acquire(timeout=10) is False
+
+    now[0] = 31
+    assert rate_limit.acquire(timeout=10) is True
+
+
+def test_background_acquire_gives_up_behind_waiting_interactive() -> None:
+    rate_limit = RateLimit()
+    rate_limit.update(remaining=0, reset=60)
+    interactive = threading.Thread(target=rate_limit.acquire, args=(enums.Priority.INTERACTIVE,))
+    interactive.start()
+    test_parameters.wait_until(lambda: rate_limit._interactive_waiting > 0)
+
+    assert rate_limit.acquire(enums.Priority.BACKGROUND, timeout=0.01) is False
+
+    rate_limit.update(remaining=1, reset=60)
+    interactive.join(timeout=5)
+
+    assert not interactive.is_alive()
+
+
+def test_single_flight_waiter_stops_waiting_after_timeout() -> None:
+    flights: SingleFlight[int] = SingleFlight()
+    release = threading.Event()
+    started = threading.Event()
+
+    def slow() -> int:
+        started.set()
+        release.wait()
+        return 1
+
+    leader = threading.Thread(target=flights.do, args=("key", slow))
+    leader.start()
+    started.wait()
+
+    with pytest.raises(TimeoutError):
+        flights.do("key", slow, timeout=0.01)
+
+    release.set()
+    leader.join()
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import concurrent.futures
+import copy
+import json
+from typing import Any
+
+import pytest
+import responses
+
+from trackbear_api import TrackBearClient
+from trackbear_api import exceptions
+from trackbear_api._getbatcher import CoalescedGets
+
+from . import test_parameters
+
+
+def _with_id(response: dict[str, Any], model_id: int) -> dict[str, Any]:
+    data = copy.deepcopy(response)
+    data["id"] = model_id
+    return data
+
+
+@pytest.mark.parametrize(
+    "provider,api_response",
+    (
+        ("project", test_parameters.PROJECT_RESPONSE),
+        ("tag", test_parameters.TAG_RESPONSE),
+        ("goal", test_parameters.GOAL_RESPONSE_THRESHOLD),
+    ),
+)
+@responses.activate(assert_all_requests_are_fired=True)
+def test_burst_of_gets_uses_one_list_request(
+    client: TrackBearClient,
+    provider: str,
+    api_response: dict[str, Any],
+) -> None:
+    """Concurrent gets reaching the threshold are answered by a single list request."""
+    ids = [1, 2, 3]
+    data = [_with_id(api_response, model_id) for model_id in ids]
+    responses.add(
+        method="GET",
+        url=f"https://trackbear.app/api/v1/{provider}",
+        body=json.dumps({"success": True, "data": data}),
+    )
+    sub_client = getattr(client, provider)
+    sub_client.coalesce_gets(window_seconds=5, threshold=3)
+
+    with concurrent.futures.ThreadPoolExecutor(len(ids)) as executor:
+        results = list(executor.map(sub_client.get, ids))
+
+    assert [result.id for result in results] == ids
+    assert len(responses.calls) == 1
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_get_below_threshold_requests_by_id(client: TrackBearClient) -> None:
+    """A lone get waits out the window and then requests the id directly."""
+    responses.add(
+        method="GET",
+        url="https://trackbear.app/api/v1/tag/123",
+        body=json.dumps({"success": True, "data": test_parameters.TAG_RESPONSE}),
+    )
+    client.tag.coalesce_gets(window_seconds=0.01, threshold=3)
+
+    result = client.tag.get(123)
+
+    assert result.id == 123
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_id_missing_from_list_falls_back_to_get(client: TrackBearClient) -> None:
+    """Ids absent from the list response are requested directly, raising API errors."""
+    data = [_with_id(test_parameters.TAG_RESPONSE, model_id) for model_id in (1, 2)]
+    failure = {"success": False, "error": {"code": "NOT_FOUND", "message": "missing"}}
+    responses.add(
+        method="GET",
+        url="https://trackbear.app/api/v1/tag",
+        body=json.dumps({"success": True, "data": data}),
+    )
+    responses.add(
+        method="GET",
+        url="https://trackbear.app/api/v1/tag/3",
+        status=404,
+        body=json.dumps(failure),
+    )
+    client.tag.coalesce_gets(window_seconds=5, threshold=3)
+
+    with concurrent.futures.ThreadPoolExecutor(3) as executor:
+        futures = [executor.submit(client.tag.get, model_id) for model_id in (1, 2, 3)]
+
+    assert futures[0].result().id == 1
+    assert futures[1].result().id == 2
+    with pytest.raises(exceptions.APIResponseError, match="NOT_FOUND"):
+        futures[2].result()
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_failed_list_request_raises_for_every_caller(client: TrackBearClient) -> None:
+    """An error from the shared list request is raised to every caller in the batch."""
+    failure = {"success": False, "error": {"code": "SERVER_ERROR", "message": "down"}}
+    responses.add(
+        method="GET",
+        url="https://trackbear.app/api/v1/tag",
+        status=500,
+        body=json.dumps(failure),
+    )
+    client.tag.coalesce_gets(window_seconds=5, threshold=3)
+
+    with concurrent.futures.ThreadPoolExecutor(3) as executor:
+        futures = [executor.submit(client.tag.get, model_id) for model_id in (1, 2, 3)]
+
+    for future in futures:
+        with pytest.raises(exceptions.APIResponseError, match="SERVER_ERROR"):
+            future.result()
+
+    assert len(responses.calls) == 1
+
+
+@pytest.mark.parametrize("sub_client_name", ("project", "tag", "goal"))
+def test_coalesce_gets_disable(client: TrackBearClient, sub_client_name: str) -> None:
+    """A window of zero disables coalescing."""
+    sub_client = getattr(client, sub_client_name)
+    sub_client.coalesce_gets()
+    sub_client.coalesce_gets(window_seconds=0)
+
+    assert sub_client._get_batcher is None
+
+
+@pytest.mark.parametrize(
+    "kwargs,pattern",
+    (
+        ({"window_seconds": -1}, "window_seconds must be greater than 0"),
+        ({"threshold": 1}, "threshold must be at least 2"),
+    ),
+)
+def test_coalesce_gets_invalid_arguments(
+    client: TrackBearClient,
+    kwargs: dict[str, Any],
+    pattern: str,
+) -> None:
+    """Invalid settings are rejected."""
+    with pytest.raises(ValueError, match=pattern):
+        client.project.coalesce_gets(**kwargs)
+
+
+def test_coalesced_gets_requires_list_and_get() -> None:
+    """Sub-clients must provide `list()` and `_get()` to use the mixin."""
+
+    class Incomplete(CoalescedGets[Any]):
+        pass
+
+    with pytest.raises(TypeError, match="abstract methods '?_get'?, '?list"):
+        Incomplete()  # type: ignore[abstract]
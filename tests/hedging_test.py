@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Mapping
+from typing import Any
+
+import pytest
+
+from trackbear_api import TrackBearClient
+from trackbear_api import exceptions
+from trackbear_api._ratelimit import RateLimit
+from trackbear_api.hedging import HedgePolicy
+from trackbear_api.transport import InMemoryTransport
+from trackbear_api.transport import TransportResponse
+
+from . import test_parameters
+
+PROJECT_URL = "https://trackbear.app/api/v1/project"
+
+
+class SlowFirstTransport(InMemoryTransport):
+    """Holds the first request until released, answering the others right away."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.release = threading.Event()
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Mapping[str, Any] | None = None,
+        payload: Mapping[str, Any] | None = None,
+        timeout: float,
+    ) -> TransportResponse:
+        with self._lock:
+            self.calls += 1
+            first = self.calls == 1
+
+        if first:
+            self.release.wait(5)
+
+        return super().request(method, url, params=params, payload=payload, timeout=timeout)
+
+
+def make_policy(**kwargs: Any) -> HedgePolicy:
+    policy = HedgePolicy(**{"min_samples": 1, "min_delay": 0.01, "max_share": 1.0} | kwargs)
+    policy.record_latency(0.001)
+    return policy
+
+
+def test_delay_waits_for_samples_and_uses_percentile() -> None:
+    policy = HedgePolicy(percentile=0.9, min_samples=10, min_delay=0.05)
+
+    for latency in range(1, 10):
+        policy.record_latency(latency / 10)
+    assert policy.delay() is None
+
+    policy.record_latency(1.0)
+    assert policy.delay() == 0.9
+
+    floor = HedgePolicy(min_samples=1, min_delay=0.05)
+    floor.record_latency(0.001)
+    assert floor.delay() == 0.05
+
+
+def test_hedges_are_capped_at_max_share() -> None:
+    policy = HedgePolicy(max_share=0.25, sample_size=8)
+    rate_limit = RateLimit()
+
+    for _ in range(3):
+        policy.record_waited()
+
+    assert policy.try_hedge(rate_limit) is True
+    assert policy.try_hedge(rate_limit) is False
+
+    for _ in range(3):
+        policy.record_waited()
+
+    assert policy.try_hedge(rate_limit) is True
+
+
+def test_hedges_never_spend_the_reserved_budget() -> None:
+    policy = HedgePolicy(max_share=1.0)
+    rate_limit = RateLimit()
+    rate_limit.update(remaining=2, reset=60, limit=10)
+
+    assert policy.try_hedge(rate_limit) is False
+    assert rate_limit.remaining == 2
+
+    rate_limit.update(remaining=5, reset=60, limit=10)
+
+    assert policy.try_hedge(rate_limit) is True
+    assert rate_limit.remaining == 4
+
+
+def test_policy_applies_to_route_groups() -> None:
+    policy = HedgePolicy(groups=["tally", "leaderboard"])
+
+    assert policy.applies("/tally")
+    assert policy.applies("leaderboard/abc/participants")
+    assert not policy.applies("/project")
+    assert HedgePolicy().applies("/project")
+
+
+@pytest.mark.parametrize("percentile", (0, 1))
+def test_percentile_must_be_between_0_and_1(percentile: float) -> None:
+    with pytest.raises(ValueError):
+        HedgePolicy(percentile=percentile)
+
+
+@pytest.mark.parametrize("max_share", (-0.1, 1.5))
+def test_max_share_must_be_between_0_and_1(max_share: float) -> None:
+    with pytest.raises(ValueError, match="max_share"):
+        HedgePolicy(max_share=max_share)
+
+
+def test_slow_get_is_answered_by_hedge() -> None:
+    transport = SlowFirstTransport()
+    transport.add("GET", PROJECT_URL, data=[test_parameters.PROJECT_RESPONSE])
+    client = TrackBearClient(api_token="token", transport=transport, hedging=make_policy())
+
+    try:
+        projects = client.project.list()
+
+    finally:
+        transport.release.set()
+
+    assert len(projects) == 1
+    assert transport.calls == 2
+
+
+def test_fast_get_is_not_hedged() -> None:
+    transport = InMemoryTransport()
+    transport.add("GET", PROJECT_URL, data=[])
+    policy = make_policy(min_delay=5)
+    client = TrackBearClient(api_token="token", transport=transport, hedging=policy)
+
+    client.project.list()
+
+    assert len(transport.requests) == 1
+
+
+def test_hedge_is_skipped_without_spare_budget() -> None:
+    transport = SlowFirstTransport()
+    transport.add("GET", PROJECT_URL, data=[])
+    client = TrackBearClient(api_token="token", transport=transport, hedging=make_policy())
+    client.bare.rate_limit.update(remaining=1, reset=60, limit=10)
+
+    threading.Timer(0.1, transport.release.set).start()
+    client.project.list()
+
+    assert transport.calls == 1
+
+
+def test_error_is_raised_when_every_request_fails() -> None:
+    transport = SlowFirstTransport()
+    transport.add("GET", PROJECT_URL, error=TimeoutError("read timed out"))
+    client = TrackBearClient(api_token="token", transport=transport, hedging=make_policy())
+
+    threading.Timer(0.1, transport.release.set).start()
+    with pytest.raises(exceptions.APITimeoutError):
+        client.project.list()
+
+    assert transport.calls == 2
+
+
+def test_successful_response_beats_a_failed_hedge() -> None:
+    transport = SlowFirstTransport()
+    body = b'{"success": false, "error": {"code": "SERVER_ERROR", "message": "Oops"}}'
+    transport.add("GET", PROJECT_URL, status_code=503, body=body)
+    transport.add("GET", PROJECT_URL, data=[test_parameters.PROJECT_RESPONSE])
+    client = TrackBearClient(api_token="token", transport=transport, hedging=make_policy())
+
+    threading.Timer(0.1, transport.release.set).start()
+    projects = client.project.list()
+
+    assert len(projects) == 1
+    assert transport.calls == 2
+
+
+@pytest.mark.parametrize("last", (None, TimeoutError("read timed out")))
+def test_failed_response_is_returned_when_every_request_fails(last: Exception | None) -> None:
+    transport = SlowFirstTransport()
+    body = b'{"success": false, "error": {"code": "SERVER_ERROR", "message": "Oops"}}'
+    transport.add("GET", PROJECT_URL, status_code=503, body=body)
+    transport.add("GET", PROJECT_URL, status_code=503, body=body, error=last)
+    client = TrackBearClient(api_token="token", transport=transport, hedging=make_policy())
+
+    threading.Timer(0.1, transport.release.set).start()
+    with pytest.raises(exceptions.APIResponseError, match="SERVER_ERROR"):
+        client.project.list()
+
+    assert transport.calls == 2
+
+
+def test_get_is_not_hedged_before_enough_samples() -> None:
+    transport = InMemoryTransport()
+    transport.add("GET", PROJECT_URL, data=[])
+    policy = HedgePolicy(min_samples=2)
+    client = TrackBearClient(api_token="token", transport=transport, hedging=policy)
+
+    client.project.list()
+
+    assert len(transport.requests) == 1
+    assert policy.delay() is None
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import concurrent.futures
+import subprocess
+import sys
+import threading
+
+import pytest
+
+import trackbear_api
+from trackbear_api import TrackBearClient
+
+
+def _loaded_modules(code: str) -> set[str]:
+    """Return the modules loaded by running `code` in a fresh interpreter."""
+    code += "\nimport sys\nprint(' '.join(sys.modules))"
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    )
+    return set(output.stdout.split())
+
+
+def test_import_defers_dependencies() -> None:
+    """Importing the package loads neither requests, the clients, nor the models."""
+    modules = _loaded_modules("import trackbear_api")
+
+    assert "requests" not in modules
+    assert "trackbear_api.trackbearclient" not in modules
+    assert "trackbear_api.models" not in modules
+
+
+def test_client_import_defers_sub_clients() -> None:
+    modules = _loaded_modules("from trackbear_api import TrackBearClient")
+
+    assert "trackbear_api.trackbearclient" in modules
+    assert "requests" not in modules
+    assert "trackbear_api._projectclient" not in modules
+
+
+def test_lazy_attribute_is_cached() -> None:
+    assert trackbear_api.TrackBearClient is TrackBearClient
+    assert "TrackBearClient" in vars(trackbear_api)
+    assert "TrackBearClientPool" in dir(trackbear_api)
+
+
+def test_unknown_attribute_raises() -> None:
+    with pytest.raises(AttributeError):
+        trackbear_api.NotAClient  # noqa: B018
+
+
+@pytest.mark.usefixtures("add_environs")
+def test_sub_clients_are_built_on_first_access() -> None:
+    client = TrackBearClient()
+
+    assert "goal" not in vars(client)
+    assert "tag" not in vars(client)
+
+    goal = client.goal
+
+    assert client.goal is goal
+    assert "tag" in vars(client)
+
+
+@pytest.mark.usefixtures("add_environs")
+def test_sub_clients_racing_on_first_access_share_one_tag_client() -> None:
+    client = TrackBearClient()
+    barrier = threading.Barrier(8)
+
+    def build(name: str) -> object:
+        barrier.wait()
+        sub_client = getattr(client, name)
+        return sub_client._tag_client if name != "tag" else sub_client
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        tag_clients = list(executor.map(build, ["tag", "goal", "tally"] * 2 + ["goal", "tally"]))
+
+    assert all(tag_client is client.tag for tag_client in tag_clients)
+    assert TrackBearClient.tag.__doc__ == "Tag routes of the API."
+
+
+@pytest.mark.usefixtures("add_environs")
+def test_sub_client_built_while_waiting_is_reused() -> None:
+    """A caller which lost the race to the lock returns the already built sub-client."""
+    client = TrackBearClient()
+    tag = client.tag
+
+    assert vars(TrackBearClient)["tag"].__get__(client) is tag
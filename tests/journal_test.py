@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+import json
+import pathlib
+
+import pytest
+
+from trackbear_api import TrackBearClient
+from trackbear_api import enums
+from trackbear_api.journal import WriteJournal
+from trackbear_api.transport import InMemoryTransport
+
+from . import test_parameters
+
+BASE_URL = "https://trackbear.app/api/v1"
+TALLY = {"work_id": 123, "date": "2025-01-01", "measure": "word", "count": 50}
+
+
+@pytest.fixture
+def transport() -> InMemoryTransport:
+    return InMemoryTransport()
+
+
+@pytest.fixture
+def client(transport: InMemoryTransport) -> TrackBearClient:
+    return TrackBearClient(api_token="token", transport=transport)
+
+
+@pytest.fixture
+def path(tmp_path: pathlib.Path) -> pathlib.Path:
+    return tmp_path / "journal.jsonl"
+
+
+def test_submit_persists_and_deduplicates(client: TrackBearClient, path: pathlib.Path) -> None:
+    with WriteJournal(client, path) as journal:
+        first = journal.submit("tally.save", **TALLY)
+        again = journal.submit("tally.save", **TALLY | {"measure": enums.Measure.WORD})
+        other = journal.submit("tally.delete", tally_id=5)
+
+    assert again == first
+    assert len(path.read_text().splitlines()) == 2
+
+    with WriteJournal(client, path) as journal:
+        assert journal.pending() == [first, other]
+        assert first.resource == f"new/{first.entry_id}"
+        assert other.resource == "tally/5"
+
+
+def test_submit_only_deduplicates_the_latest_write_of_a_resource(
+    client: TrackBearClient,
+    transport: InMemoryTransport,
+    path: pathlib.Path,
+) -> None:
+    transport.add("PATCH", f"{BASE_URL}/tally/1", data=test_parameters.TALLY_RESPONSE)
+
+    with WriteJournal(client, path) as journal:
+        first = journal.submit("tally.save", **TALLY, tally_id=1)
+        journal.submit("tally.save", **TALLY | {"count": 70}, tally_id=1)
+        again = journal.submit("tally.save", **TALLY, tally_id=1)
+        repeat = journal.submit("tally.save", **TALLY, tally_id=1)
+
+        assert again != first
+        assert repeat == again
+        assert len(journal) == 3
+
+        journal.replay()
+
+    (patch,) = [request for request in transport.requests if request.method == "PATCH"]
+    assert patch.payload is not None
+    assert patch.payload["count"] == 50
+
+
+@pytest.mark.parametrize("fsync", (True, False))
+def test_replay_sends_pending_writes_and_compacts(
+    client: TrackBearClient,
+    transport: InMemoryTransport,
+    path: pathlib.Path,
+    fsync: bool,
+) -> None:
+    transport.add("POST", f"{BASE_URL}/tally", data=test_parameters.TALLY_RESPONSE)
+    transport.add("DELETE", f"{BASE_URL}/tally/5", data=test_parameters.TALLY_RESPONSE)
+
+    with WriteJournal(client, path, fsync=fsync) as journal:
+        journal.submit("tally.save", **TALLY)
+        journal.submit("tally.save", **TALLY | {"count": 75})
+        journal.submit("tally.delete", tally_id=5)
+
+        results = journal.replay(max_workers=2, batch_size=2)
+
+        assert [result.status for result in results] == [enums.SaveStatus.SAVED] * 3
+        assert len(journal) == 0
+
+    assert len(transport.requests) == 3
+    assert path.read_text() == ""
+
+
+def test_replay_skips_writes_replaced_by_later_writes(
+    client: TrackBearClient,
+    transport: InMemoryTransport,
+    path: pathlib.Path,
+) -> None:
+    transport.add("PATCH", f"{BASE_URL}/project/1", data=test_parameters.PROJECTSTUB_RESPONSE)
+    transport.add("DELETE", f"{BASE_URL}/tag/2", data=test_parameters.TAG_RESPONSE)
+    project = {"description": "", "phase": "drafting", "project_id": 1}
+
+    with WriteJournal(client, path) as journal:
+        journal.submit("project.save", title="First", **project)
+        journal.submit("tag.save", name="Old", color="red", tag_id=2)
+        journal.submit("project.save", title="Second", **project)
+        journal.submit("tag.delete", tag_id=2)
+
+        results = journal.replay()
+
+    statuses = sorted((result.entry.call, result.status) for result in results)
+    assert statuses == [
+        ("project.save", enums.SaveStatus.SAVED),
+        ("project.save", enums.SaveStatus.SKIPPED),
+        ("tag.delete", enums.SaveStatus.SAVED),
+        ("tag.save", enums.SaveStatus.SKIPPED),
+    ]
+    (patch,) = [request for request in transport.requests if request.method == "PATCH"]
+    assert patch.payload is not None
+    assert patch.payload["title"] == "Second"
+    assert len(transport.requests) == 2
+
+
+def test_transient_failure_keeps_resource_pending(
+    client: TrackBearClient,
+    transport: InMemoryTransport,
+    path: pathlib.Path,
+) -> None:
+    url = f"{BASE_URL}/goal/9"
+    transport.add("DELETE", url, error=TimeoutError("read timed out"))
+    transport.add("DELETE", url, data=test_parameters.GOAL_RESPONSE_HABIT)
+    transport.add("DELETE", f"{BASE_URL}/tally/5", data=test_parameters.TALLY_RESPONSE)
+
+    with WriteJournal(client, path) as journal:
+        journal.submit("goal.delete", goal_id=9)
+        journal.submit("tally.delete", tally_id=5)
+
+        results = journal.replay()
+
+        assert {result.entry.call: result.status for result in results} == {
+            "goal.delete": enums.SaveStatus.FAILED,
+            "tally.delete": enums.SaveStatus.SAVED,
+        }
+        assert [entry.call for entry in journal.pending()] == ["goal.delete"]
+
+    with WriteJournal(client, path) as journal:
+        assert [result.status for result in journal.replay()] == [enums.SaveStatus.SAVED]
+        assert len(journal) == 0
+
+
+def test_rejected_write_is_dropped(
+    client: TrackBearClient,
+    transport: InMemoryTransport,
+    path: pathlib.Path,
+) -> None:
+    body = b'{"success": false, "error": {"code": "NOT_FOUND", "message": "Nope"}}'
+    transport.add("DELETE", f"{BASE_URL}/tally/5", status_code=404, body=body)
+
+    with WriteJournal(client, path) as journal:
+        journal.submit("tally.delete", tally_id=5)
+
+        (result,) = journal.replay()
+
+        assert result.status is enums.SaveStatus.FAILED
+        assert len(journal) == 0
+
+
+def test_torn_record_is_skipped_and_compacted(
+    client: TrackBearClient,
+    path: pathlib.Path,
+) -> None:
+    record = {"op": "write", "id": "abc", "call": "tally.delete", "kwargs": {"tally_id": 5}}
+    path.write_text(json.dumps(record) + '\n{"op": "wri')
+
+    with WriteJournal(client, path) as journal:
+        assert len(journal) == 1
+        journal.submit("tally.delete", tally_id=6)
+
+    with WriteJournal(client, path) as journal:
+        assert [entry.kwargs["tally_id"] for entry in journal.pending()] == [5, 6]
+
+
+def test_submit_rejects_unknown_calls_and_values(
+    client: TrackBearClient,
+    path: pathlib.Path,
+) -> None:
+    with WriteJournal(client, path) as journal:
+        with pytest.raises(ValueError, match="Cannot journal"):
+            journal.submit("tally.list")
+
+        with pytest.raises(TypeError):
+            journal.submit("tally.delete", tally_id=object())
+
+        with pytest.raises(TypeError):
+            journal.submit("tally.save", bogus=1)
+
+        assert len(journal) == 0
+
+
+@pytest.mark.parametrize("status_code", (429, 503))
+def test_rate_limited_and_server_errors_stay_pending(
+    client: TrackBearClient,
+    transport: InMemoryTransport,
+    path: pathlib.Path,
+    status_code: int,
+) -> None:
+    body = b'{"success": false, "error": {"code": "BUSY", "message": "Later"}}'
+    transport.add("DELETE", f"{BASE_URL}/tally/5", status_code=status_code, body=body)
+
+    with WriteJournal(client, path) as journal:
+        journal.submit("tally.delete", tally_id=5)
+
+        (result,) = journal.replay()
+
+        assert result.status is enums.SaveStatus.FAILED
+        assert len(journal) == 1
+
+
+def test_unexpected_failure_is_dropped(
+    client: TrackBearClient,
+    path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def broken(tally_id: int) -> None:
+        raise RuntimeError("unexpected")
+
+    with WriteJournal(client, path) as journal:
+        journal.submit("tally.delete", tally_id=5)
+        monkeypatch.setattr(client.tally, "delete", broken)
+
+        (result,) = journal.replay()
+
+        assert isinstance(result.error, RuntimeError)
+        assert len(journal) == 0
+
+
+def test_start_replays_in_background_until_stopped(
+    client: TrackBearClient,
+    transport: InMemoryTransport,
+    path: pathlib.Path,
+) -> None:
+    transport.add("DELETE", f"{BASE_URL}/tally/5", data=test_parameters.TALLY_RESPONSE)
+
+    with WriteJournal(client, path) as journal:
+        journal.submit("tally.delete", tally_id=5)
+        thread = journal.start(interval=0.01)
+
+        test_parameters.wait_until(lambda: not len(journal))
+
+        journal.stop()
+
+        assert len(journal) == 0
+        assert not thread.is_alive()
+
+
+def test_run_waits_while_nothing_is_pending(
+    client: TrackBearClient,
+    transport: InMemoryTransport,
+    path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    with WriteJournal(client, path) as journal:
+        waits: list[float | None] = []
+
+        def wait(timeout: float | None = None) -> bool:
+            waits.append(timeout)
+            journal._stop.set()
+            return True
+
+        monkeypatch.setattr(journal._stop, "wait", wait)
+
+        journal.run(interval=5)
+
+    assert waits == [5]
+    assert transport.requests == []
+
+
+def test_replay_rejects_invalid_workers(client: TrackBearClient, path: pathlib.Path) -> None:
+    with WriteJournal(client, path) as journal:
+        with pytest.raises(ValueError, match="max_workers"):
+            journal.replay(max_workers=0)
+
+
+def test_run_survives_a_failing_replay(
+    client: TrackBearClient,
+    path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    with WriteJournal(client, path) as journal:
+        journal.submit("tally.delete", tally_id=5)
+        calls: list[int] = []
+
+        def failing_replay() -> None:
+            calls.append(1)
+            if len(calls) == 2:
+                journal._stop.set()
+            raise OSError("disk full")
+
+        monkeypatch.setattr(journal, "replay", failing_replay)
+
+        journal.run(interval=0)
+
+    assert len(calls) == 2
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import dataclasses
+import json
 from typing import Any
 from typing import Protocol
 
 import pytest
 
 from trackbear_api import models
+from trackbear_api._serialize import TO_DICT
+from trackbear_api._serialize import serializer
 from trackbear_api.exceptions import ModelBuildError
 
 from . import test_parameters
@@ -70,3 +73,81 @@ def test_build_model_success(data: dict[str, Any], model_type: type[ModelType])
     assert dataclasses.is_dataclass(result)
     assert not isinstance(result, type)
     assert dataclasses.asdict(result) == test_parameters.keys_to_snake_case(data)
+
+
+@pytest.mark.parametrize(
+    "data,model_type",
+    (
+        (test_parameters.PROJECT_RESPONSE, models.Project),
+        (test_parameters.PROJECTSTUB_RESPONSE, models.ProjectStub),
+        (test_parameters.GOAL_RESPONSE_THRESHOLD, models.Goal),
+        (test_parameters.GOAL_RESPONSE_HABIT_THRESHOLD, models.Goal),
+        (test_parameters.GOAL_RESPONSE_HABIT, models.Goal),
+        (test_parameters.STAT_RESPONSE, models.Stat),
+        (test_parameters.TAG_RESPONSE, models.Tag),
+        (test_parameters.TALLY_RESPONSE, models.Tally),
+        (test_parameters.MEMBER_RESPONSE, models.Member),
+        (test_parameters.TEAM_RESPONSE, models.Team),
+        (test_parameters.LEADERBOARD_RESPONSE, models.Leaderboard),
+        (test_parameters.LEADERBOARD_EXTENDED_RESPONSE, models.LeaderboardExtended),
+        (test_parameters.LEADERBOARD_PARTICIPANT_RESPONSE, models.Participant),
+        (test_parameters.STARRED_RESPONSE, models.Starred),
+    ),
+)
+def test_model_dict_round_trip(data: dict[str, Any], model_type: type[ModelType]) -> None:
+    """to_dict() and from_dict() round trip and match dataclasses.asdict()."""
+    model: Any = model_type.build(data)
+
+    as_dict = model.to_dict()
+
+    assert as_dict == dataclasses.asdict(model)
+    assert json.loads(json.dumps(as_dict)) == as_dict
+    assert type(model).from_dict(as_dict) == model
+
+
+@pytest.mark.parametrize(
+    "data,model_type",
+    (
+        (test_parameters.PROJECT_RESPONSE, models.Project),
+        (test_parameters.PROJECTSTUB_RESPONSE, models.ProjectStub),
+        (test_parameters.GOAL_RESPONSE_THRESHOLD, models.Goal),
+        (test_parameters.GOAL_RESPONSE_HABIT_THRESHOLD, models.Goal),
+        (test_parameters.GOAL_RESPONSE_HABIT, models.Goal),
+        (test_parameters.STAT_RESPONSE, models.Stat),
+        (test_parameters.TAG_RESPONSE, models.Tag),
+        (test_parameters.TALLY_RESPONSE, models.Tally),
+        (test_parameters.MEMBER_RESPONSE, models.Member),
+        (test_parameters.TEAM_RESPONSE, models.Team),
+        (test_parameters.LEADERBOARD_RESPONSE, models.Leaderboard),
+        (test_parameters.LEADERBOARD_EXTENDED_RESPONSE, models.LeaderboardExtended),
+        (test_parameters.LEADERBOARD_PARTICIPANT_RESPONSE, models.Participant),
+        (test_parameters.STARRED_RESPONSE, models.Starred),
+    ),
+)
+def test_model_api_dict_round_trip(data: dict[str, Any], model_type: type[ModelType]) -> None:
+    """to_api_dict() uses the API's camelCase keys and builds the same model."""
+    model: Any = model_type.build(data)
+
+    api_dict = model.to_api_dict()
+
+    assert test_parameters.keys_to_snake_case(api_dict) == dataclasses.asdict(model)
+    assert model_type.build(api_dict) == model
+
+
+def test_to_dict_converts_enums_to_values() -> None:
+    tally = models.Tally.build(test_parameters.TALLY_RESPONSE)
+
+    as_dict = tally.to_dict()
+
+    assert type(as_dict["measure"]) is str
+    assert type(as_dict["work"]["phase"]) is str
+    assert models.Tally.from_dict(as_dict).measure is tally.measure
+
+
+def test_serializer_rejects_unsupported_field_types() -> None:
+    @dataclasses.dataclass(frozen=True)
+    class Unsupported:
+        counts: dict[str, int]
+
+    with pytest.raises(TypeError, match="Cannot serialize field of type"):
+        serializer(Unsupported, TO_DICT)
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from trackbear_api import enums
+from trackbear_api.progress import goal_progress
+
+from .test_parameters import make_goal
+from .test_parameters import make_tally
+
+TARGET = {"threshold": {"measure": "word", "count": 1000}}
+
+
+def test_target_progress() -> None:
+    """Target goals sum active tallies of the threshold measure and break down by day."""
+    goal = make_goal(TARGET)
+    tallies = [
+        make_tally("2025-01-02", 600),
+        make_tally("2025-01-01", 300),
+        make_tally("2025-01-02", 200),
+        make_tally("2025-01-03", 999, measure="time"),
+        make_tally("2025-01-03", 999, state="deleted"),
+    ]
+
+    result = goal_progress(goal, tallies)
+
+    assert result.type is enums.GoalType.TARGET
+    assert result.progress == 1100
+    assert result.remaining == 0
+    assert result.complete is True
+    assert [(p.start_date, p.total, p.met) for p in result.periods] == [
+        ("2025-01-01", 300, False),
+        ("2025-01-02", 800, True),
+    ]
+
+
+@pytest.mark.parametrize(
+    "changes,expected",
+    (
+        ({"startDate": "2025-01-02"}, 200),
+        ({"endDate": "2025-01-01"}, 300),
+        ({"workIds": [1]}, 0),
+        ({"workIds": [456]}, 500),
+        ({"tagIds": [1]}, 0),
+        ({"tagIds": [987]}, 500),
+    ),
+)
+def test_target_progress_filters(changes: dict[str, Any], expected: int) -> None:
+    """Date range, work ids, and tag ids limit the applicable tallies."""
+    goal = make_goal(TARGET, **changes)
+    tallies = [make_tally("2025-01-01", 300), make_tally("2025-01-02", 200)]
+
+    result = goal_progress(goal, tallies)
+
+    assert result.progress == expected
+    assert result.remaining == 1000 - expected
+    assert result.complete is False
+
+
+def test_habit_progress_with_threshold() -> None:
+    """Habit goals count periods meeting the threshold."""
+    parameters = {
+        "cadence": {"unit": "week", "period": 1},
+        "threshold": {"measure": "word", "count": 500},
+    }
+    goal = make_goal(parameters, startDate="2025-01-06", endDate="2025-01-26")
+    tallies = [
+        make_tally("2025-01-06", 250),
+        make_tally("2025-01-12", 250),
+        make_tally("2025-01-14", 100),
+        make_tally("2025-01-20", 800),
+    ]
+
+    result = goal_progress(goal, tallies, today="2025-01-26")
+
+    assert result.type is enums.GoalType.HABIT
+    assert [(p.start_date, p.end_date, p.total, p.met) for p in result.periods] == [
+        ("2025-01-06", "2025-01-12", 500, True),
+        ("2025-01-13", "2025-01-19", 100, False),
+        ("2025-01-20", "2025-01-26", 800, True),
+    ]
+    assert result.progress == 2
+    assert result.target == 3
+    assert result.remaining == 1
+    assert result.complete is False
+
+
+@pytest.mark.parametrize(
+    "cadence,dates,expected_starts",
+    (
+        ({"unit": "day", "period": 2}, ["2025-01-01", "2025-01-04"], ["2025-01-01", "2025-01-03"]),
+        (
+            {"unit": "month", "period": 1},
+            ["2025-11-15", "2025-12-01"],
+            ["2025-11-01", "2025-12-01"],
+        ),
+        (
+            {"unit": "month", "period": 2},
+            ["2025-11-15", "2026-01-01"],
+            ["2025-11-01", "2026-01-01"],
+        ),
+        ({"unit": "year", "period": 1}, ["2024-06-01", "2025-02-01"], ["2024-01-01", "2025-01-01"]),
+    ),
+)
+def test_habit_progress_without_threshold(
+    cadence: dict[str, Any],
+    dates: list[str],
+    expected_starts: list[str],
+) -> None:
+    """Habits without a threshold are met by any tally in the period."""
+    goal = make_goal({"cadence": cadence, "threshold": None}, endDate=dates[-1])
+    tallies = [make_tally(date, 1, measure="time") for date in dates]
+
+    result = goal_progress(goal, tallies, today="2030-01-01")
+
+    assert [p.start_date for p in result.periods] == expected_starts
+    assert result.complete is True
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import json
+import threading
+
+import pytest
+import responses
+
+from trackbear_api import TrackBearClient
+from trackbear_api import enums
+from trackbear_api import exceptions
+from trackbear_api._ratelimit import RateLimit
+from trackbear_api._ratelimit import current_priority
+from trackbear_api._ratelimit import prioritized
+
+from . import test_parameters
+
+
+class MockClock:
+    """Manually advanced clock for the RateLimit."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_acquire_without_state_does_not_block() -> None:
+    """Before any response is seen the budget is unknown and no wait occurs."""
+    rate_limit = RateLimit()
+
+    rate_limit.acquire()
+
+    assert rate_limit.remaining is None
+
+
+def test_acquire_reserves_from_remaining() -> None:
+    """Each acquire reserves one request of the remaining budget."""
+    rate_limit = RateLimit()
+    rate_limit.update(remaining=5, reset=60)
+
+    rate_limit.acquire()
+    rate_limit.acquire()
+
+    assert rate_limit.remaining == 3
+
+
+def test_acquire_after_window_reset_clears_state() -> None:
+    """An exhausted budget is released once the reset time passes."""
+    clock = MockClock()
+    rate_limit = RateLimit(clock=clock)
+    rate_limit.update(remaining=0, reset=30)
+    clock.now = 31.0
+
+    rate_limit.acquire()
+
+    assert rate_limit.remaining is None
+    assert rate_limit.reset == 0.0
+
+
+def test_acquire_waits_for_window_reset(monkeypatch: pytest.MonkeyPatch) -> None:
+    """An exhausted budget waits out the remaining window."""
+    clock = MockClock()
+    rate_limit = RateLimit(clock=clock)
+    rate_limit.update(remaining=0, reset=30)
+    waits: list[float | None] = []
+
+    def mock_wait(timeout: float | None = None) -> bool:
+        waits.append(timeout)
+        clock.now += 30
+        return False
+
+    monkeypatch.setattr(rate_limit._lock, "wait", mock_wait)
+
+    rate_limit.acquire()
+
+    assert waits == [30.0]
+
+
+def test_background_leaves_reserve_to_interactive(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Background requests wait once the budget drops to the reserve."""
+    clock = MockClock()
+    rate_limit = RateLimit(clock=clock, reserve_share=0.2)
+    rate_limit.update(remaining=2, reset=30, limit=10)
+    waits: list[float | None] = []
+
+    def mock_wait(timeout: float | None = None) -> bool:
+        waits.append(timeout)
+        clock.now += 30
+        return False
+
+    monkeypatch.setattr(rate_limit._lock, "wait", mock_wait)
+
+    rate_limit.acquire(enums.Priority.INTERACTIVE)
+    assert waits == []
+
+    rate_limit.acquire(enums.Priority.BACKGROUND)
+    assert waits == [30.0]
+    assert rate_limit.reserved == 2
+
+
+def test_limit_is_estimated_without_policy() -> None:
+    """The window budget is estimated from the largest remaining budget seen."""
+    rate_limit = RateLimit(reserve_share=0.5)
+    rate_limit.update(remaining=99, reset=60)
+    rate_limit.update(remaining=40, reset=30)
+
+    assert rate_limit.reserved == 50
+
+
+def test_background_yields_to_waiting_interactive() -> None:
+    """When budget returns, waiting interactive requests are served first."""
+    rate_limit = RateLimit()
+    rate_limit.update(remaining=0, reset=60)
+    order: list[str] = []
+
+    def request(priority: enums.Priority) -> None:
+        rate_limit.acquire(priority)
+        order.append(priority.value)
+
+    background = threading.Thread(target=request, args=(enums.Priority.BACKGROUND,))
+    interactive = threading.Thread(target=request, args=(enums.Priority.INTERACTIVE,))
+    background.start()
+    interactive.start()
+    test_parameters.wait_until(lambda: rate_limit._interactive_waiting > 0)
+
+    rate_limit.update(remaining=1, reset=60, limit=100)
+    interactive.join(timeout=5)
+    rate_limit.update(remaining=0, reset=0)
+    background.join(timeout=5)
+
+    assert order == ["interactive", "background"]
+
+
+def test_prioritized_sets_context_priority() -> None:
+    assert current_priority() is enums.Priority.INTERACTIVE
+
+    with prioritized("background"):
+        assert current_priority() is enums.Priority.BACKGROUND
+
+    assert current_priority() is enums.Priority.INTERACTIVE
+
+
+def test_priority_passes_library_exceptions_through(client: TrackBearClient) -> None:
+    error = exceptions.APIResponseError(status_code=404, code="NOT_FOUND", message="missing")
+
+    with pytest.raises(exceptions.APIResponseError) as raised:
+        with client.priority(enums.Priority.BACKGROUND):
+            raise error
+
+    assert raised.value is error
+    assert current_priority() is enums.Priority.INTERACTIVE
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_rate_limit_policy_header_sets_limit(client: TrackBearClient) -> None:
+    """The `q=` of the RateLimit-Policy header is used as the window budget."""
+    responses.add(
+        method="GET",
+        url="https://trackbear.app/api/v1/stats/days",
+        body=json.dumps({"success": True, "data": []}),
+        headers={
+            "RateLimit": '"100-in-1min"; r=90; t=30',
+            "RateLimit-Policy": '"100-in-1min"; q=100; w=60',
+        },
+    )
+    client.bare.rate_limit.reserve_share = 0.1
+
+    client.bare.get("/stats/days")
+
+    assert client.bare.rate_limit.reserved == 10
+
+
+def test_priority_follows_warm_threads(
+    client: TrackBearClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Requests made from worker threads keep the caller's priority."""
+    priorities: list[enums.Priority] = []
+    monkeypatch.setattr(client.project, "list", lambda: priorities.append(current_priority()))
+    monkeypatch.setattr(client.tag, "list", lambda: priorities.append(current_priority()))
+
+    with client.priority(enums.Priority.BACKGROUND):
+        client.warm(["project", "tag"])
+
+    assert priorities == [enums.Priority.BACKGROUND] * 2
@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+import json
+import pathlib
+from typing import Any
+
+import pytest
+
+from trackbear_api import TrackBearClient
+from trackbear_api import enums
+from trackbear_api.restore import SnapshotRestore
+from trackbear_api.transport import InMemoryTransport
+
+from . import test_parameters
+
+BASE_URL = "https://trackbear.app/api/v1"
+
+SNAPSHOT_PROJECT = test_parameters.PROJECT_RESPONSE | {"id": 1}
+SNAPSHOT_TAG = test_parameters.TAG_RESPONSE | {"id": 10, "name": "Drafting"}
+SNAPSHOT_GOAL = test_parameters.GOAL_RESPONSE_THRESHOLD | {
+    "id": 20,
+    "startDate": "2025-11-01",
+    "endDate": "2025-11-30",
+    "workIds": [1],
+    "tagIds": [10],
+}
+SNAPSHOT_TALLY = test_parameters.TALLY_RESPONSE | {
+    "id": 30,
+    "workId": 1,
+    "tags": [SNAPSHOT_TAG],
+}
+
+
+def make_transport(tags: list[dict[str, Any]]) -> InMemoryTransport:
+    transport = InMemoryTransport()
+    transport.add("GET", f"{BASE_URL}/tag", data=tags)
+    transport.add("POST", f"{BASE_URL}/project", data=test_parameters.PROJECTSTUB_RESPONSE)
+    transport.add("POST", f"{BASE_URL}/tag", data=test_parameters.TAG_RESPONSE | {"id": 600})
+    transport.add("POST", f"{BASE_URL}/goal", data=test_parameters.GOAL_RESPONSE_THRESHOLD)
+    transport.add("POST", f"{BASE_URL}/tally", data=test_parameters.TALLY_RESPONSE)
+    return transport
+
+
+@pytest.fixture
+def transport() -> InMemoryTransport:
+    return make_transport([])
+
+
+@pytest.fixture
+def client(transport: InMemoryTransport) -> TrackBearClient:
+    return TrackBearClient(api_token="token", transport=transport)
+
+
+@pytest.fixture
+def snapshot(tmp_path: pathlib.Path) -> pathlib.Path:
+    directory = tmp_path / "snapshot"
+    directory.mkdir()
+    records: dict[str, list[dict[str, Any]]] = {
+        "project": [SNAPSHOT_PROJECT],
+        "tag": [SNAPSHOT_TAG],
+        "goal": [SNAPSHOT_GOAL],
+        "tally": [SNAPSHOT_TALLY],
+    }
+    for resource, lines in records.items():
+        text = "".join(json.dumps(line) + "\n" for line in lines)
+        (directory / f"{resource}.ndjson").write_text(text)
+
+    return directory
+
+
+@pytest.fixture
+def state(tmp_path: pathlib.Path) -> pathlib.Path:
+    return tmp_path / "state.jsonl"
+
+
+def payloads(transport: InMemoryTransport, route: str) -> list[Any]:
+    url = f"{BASE_URL}/{route}"
+    return [r.payload for r in transport.requests if r.method == "POST" and r.url == url]
+
+
+def test_restore_remaps_ids_by_layer(
+    client: TrackBearClient,
+    transport: InMemoryTransport,
+    snapshot: pathlib.Path,
+    state: pathlib.Path,
+) -> None:
+    with SnapshotRestore(client, snapshot, state) as restore:
+        results = restore.run()
+
+        assert restore.id_map("project") == {1: test_parameters.PROJECTSTUB_RESPONSE["id"]}
+        assert restore.id_map("tag") == {10: 600}
+
+    new_project = test_parameters.PROJECTSTUB_RESPONSE["id"]
+    assert {result.status for result in results} == {enums.SaveStatus.SAVED}
+    assert [result.resource for result in results][2:] == ["goal", "tally"]
+
+    (project,) = payloads(transport, "project")
+    assert project["title"] == SNAPSHOT_PROJECT["title"]
+    assert project["startingBalance"] == SNAPSHOT_PROJECT["startingBalance"]
+
+    (goal,) = payloads(transport, "goal")
+    assert goal["workIds"] == [new_project]
+    assert goal["tagIds"] == [600]
+
+    (tally,) = payloads(transport, "tally")
+    assert tally["workId"] == new_project
+    assert tally["tags"] == ["Drafting"]
+
+    lines = [json.loads(line) for line in state.read_text().splitlines()]
+    assert {line["resource"] for line in lines} == {"project", "tag", "goal", "tally"}
+
+
+def test_restore_resumes_from_state(
+    client: TrackBearClient,
+    transport: InMemoryTransport,
+    snapshot: pathlib.Path,
+    state: pathlib.Path,
+) -> None:
+    state.write_text(
+        json.dumps({"resource": "project", "old": 1, "new": 500})
+        + "\n"
+        + json.dumps({"resource": "tag", "old": 10, "new": 600})
+        + "\n"
+    )
+
+    with SnapshotRestore(client, snapshot, state) as restore:
+        results = restore.run(max_workers=1)
+
+    statuses = {result.resource: result.status for result in results}
+    assert statuses["project"] == enums.SaveStatus.SKIPPED
+    assert statuses["tag"] == enums.SaveStatus.SKIPPED
+    assert statuses["goal"] == enums.SaveStatus.SAVED
+    assert not payloads(transport, "project")
+    assert payloads(transport, "goal")[0]["workIds"] == [500]
+
+
+def test_restore_fails_dependents_and_retries(
+    transport: InMemoryTransport,
+    snapshot: pathlib.Path,
+    state: pathlib.Path,
+) -> None:
+    error = {"success": False, "error": {"code": "VALIDATION_FAILED", "message": "bad phase"}}
+    failing = InMemoryTransport()
+    failing.add("GET", f"{BASE_URL}/tag", data=[])
+    failing.add("POST", f"{BASE_URL}/project", status_code=400, body=json.dumps(error).encode())
+    failing.add("POST", f"{BASE_URL}/tag", data=test_parameters.TAG_RESPONSE | {"id": 600})
+
+    client = TrackBearClient(api_token="token", transport=failing)
+    with SnapshotRestore(client, snapshot, state) as restore:
+        results = restore.run()
+
+    failed = {result.resource for result in results if result.error is not None}
+    assert failed == {"project", "goal", "tally"}
+    assert not payloads(failing, "goal")
+
+    client = TrackBearClient(api_token="token", transport=transport)
+    with SnapshotRestore(client, snapshot, state) as restore:
+        results = restore.run()
+
+    statuses = {result.resource: result.status for result in results}
+    assert statuses == {
+        "project": enums.SaveStatus.SAVED,
+        "tag": enums.SaveStatus.SKIPPED,
+        "goal": enums.SaveStatus.SAVED,
+        "tally": enums.SaveStatus.SAVED,
+    }
+
+
+def test_restore_reuses_existing_tags_by_name(
+    snapshot: pathlib.Path,
+    state: pathlib.Path,
+) -> None:
+    existing = test_parameters.TAG_RESPONSE | {"id": 42, "name": "Drafting"}
+    transport = make_transport([existing])
+    client = TrackBearClient(api_token="token", transport=transport)
+
+    with SnapshotRestore(client, snapshot, state) as restore:
+        restore.run()
+
+        assert restore.id_map("tag") == {10: 42}
+
+    assert not payloads(transport, "tag")
+    assert payloads(transport, "goal")[0]["tagIds"] == [42]
+
+
+def test_restore_rewrites_torn_state(
+    client: TrackBearClient,
+    snapshot: pathlib.Path,
+    state: pathlib.Path,
+) -> None:
+    state.write_text(json.dumps({"resource": "project", "old": 1, "new": 500}) + '\n{"reso')
+
+    with SnapshotRestore(client, snapshot, state) as restore:
+        assert restore.id_map("project") == {1: 500}
+
+    assert state.read_text() == json.dumps({"resource": "project", "old": 1, "new": 500}) + "\n"
+
+
+def test_restore_missing_resources_are_empty(
+    client: TrackBearClient,
+    snapshot: pathlib.Path,
+    state: pathlib.Path,
+) -> None:
+    for resource in ("goal", "tally"):
+        (snapshot / f"{resource}.ndjson").unlink()
+
+    with SnapshotRestore(client, snapshot, state) as restore:
+        results = restore.run()
+
+    assert sorted(result.resource for result in results) == ["project", "tag"]
+
+
+def test_restore_rejects_csv_snapshot(
+    client: TrackBearClient,
+    snapshot: pathlib.Path,
+    state: pathlib.Path,
+) -> None:
+    (snapshot / "manifest.json").write_text(json.dumps({"format": "csv"}))
+
+    with pytest.raises(ValueError, match="csv"):
+        SnapshotRestore(client, snapshot, state)
+
+
+def test_restore_rejects_invalid_workers(
+    client: TrackBearClient,
+    snapshot: pathlib.Path,
+    state: pathlib.Path,
+) -> None:
+    with SnapshotRestore(client, snapshot, state) as restore:
+        with pytest.raises(ValueError, match="max_workers"):
+            restore.run(max_workers=0)
+
+
+def test_restore_habit_goals(
+    client: TrackBearClient,
+    transport: InMemoryTransport,
+    snapshot: pathlib.Path,
+    state: pathlib.Path,
+) -> None:
+    dates = {"startDate": "2025-11-01", "endDate": None}
+    habits = [
+        test_parameters.GOAL_RESPONSE_HABIT | dates | {"id": 21, "workIds": [1], "tagIds": []},
+        test_parameters.GOAL_RESPONSE_HABIT_THRESHOLD
+        | dates
+        | {"id": 22, "workIds": [], "tagIds": [10]},
+    ]
+    (snapshot / "goal.ndjson").write_text("".join(json.dumps(goal) + "\n" for goal in habits))
+
+    with SnapshotRestore(client, snapshot, state) as restore:
+        restore.run()
+
+    parameters = sorted(
+        (goal["parameters"] for goal in payloads(transport, "goal")),
+        key=lambda parameters: parameters["threshold"] is not None,
+    )
+    assert parameters == [
+        {"cadence": {"unit": "day", "period": 1}, "threshold": None},
+        {"cadence": {"unit": "day", "period": 1}, "threshold": {"measure": "word", "count": 1667}},
+    ]
+
+
+def test_restore_bounds_records_in_flight(
+    client: TrackBearClient,
+    transport: InMemoryTransport,
+    snapshot: pathlib.Path,
+    state: pathlib.Path,
+) -> None:
+    tags = [SNAPSHOT_TAG, SNAPSHOT_TAG | {"id": 11, "name": "Editing"}]
+    tallies = [SNAPSHOT_TALLY | {"id": 30 + offset} for offset in range(5)]
+    (snapshot / "tag.ndjson").write_text("".join(json.dumps(tag) + "\n" for tag in tags))
+    # Blank lines between records are skipped
+    (snapshot / "tally.ndjson").write_text("\n\n".join(json.dumps(tally) for tally in tallies))
+
+    with SnapshotRestore(client, snapshot, state, fsync=False) as restore:
+        results = restore.run(max_workers=1)
+
+        assert restore.id_map("tag") == {10: 600, 11: 600}
+
+    assert sum(result.resource == "tally" for result in results) == 5
+    assert {result.status for result in results} == {enums.SaveStatus.SAVED}
+    assert len(payloads(transport, "tally")) == 5
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+import responses
+import responses.matchers
+
+from trackbear_api import TrackBearClient
+from trackbear_api import exceptions
+from trackbear_api import schemas
+
+from . import test_parameters
+
+BASE_URL = "https://trackbear.app/api/v1"
+
+
+@pytest.mark.parametrize(
+    "provider_method,method_name,kwargs,route,api_response",
+    (
+        ("project", "list_raw", {}, "/project", [test_parameters.PROJECT_RESPONSE]),
+        ("goal", "list_raw", {}, "/goal", [test_parameters.GOAL_RESPONSE_THRESHOLD]),
+        ("tag", "list_raw", {}, "/tag", [test_parameters.TAG_RESPONSE]),
+        ("tally", "list_raw", {}, "/tally", [test_parameters.TALLY_RESPONSE]),
+        ("stat", "list_raw", {}, "/stats/days", [test_parameters.STAT_RESPONSE]),
+        (
+            "leaderboard",
+            "list_raw",
+            {},
+            "/leaderboard",
+            [test_parameters.LEADERBOARD_EXTENDED_RESPONSE],
+        ),
+        (
+            "project",
+            "get_raw",
+            {"project_id": 123},
+            "/project/123",
+            test_parameters.PROJECT_RESPONSE,
+        ),
+        ("goal", "get_raw", {"goal_id": 123}, "/goal/123", test_parameters.GOAL_RESPONSE_HABIT),
+        ("tag", "get_raw", {"tag_id": 123}, "/tag/123", test_parameters.TAG_RESPONSE),
+        ("tally", "get_raw", {"tally_id": 123}, "/tally/123", test_parameters.TALLY_RESPONSE),
+        (
+            "leaderboard",
+            "get_raw",
+            {"board_uuid": "abc"},
+            "/leaderboard/abc",
+            test_parameters.LEADERBOARD_EXTENDED_RESPONSE,
+        ),
+        (
+            "leaderboard",
+            "list_participants_raw",
+            {"board_uuid": "abc"},
+            "/leaderboard/abc/participants",
+            [test_parameters.LEADERBOARD_PARTICIPANT_RESPONSE],
+        ),
+    ),
+)
+@responses.activate(assert_all_requests_are_fired=True)
+def test_raw_methods_return_decoded_data(
+    client: TrackBearClient,
+    provider_method: str,
+    method_name: str,
+    kwargs: dict[str, Any],
+    route: str,
+    api_response: Any,
+) -> None:
+    responses.add(
+        method="GET",
+        url=BASE_URL + route,
+        status=200,
+        json={"success": True, "data": api_response},
+    )
+
+    method = getattr(getattr(client, provider_method), method_name)
+
+    assert method(**kwargs) == api_response
+    assert method(**kwargs, validate=True) == api_response
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_list_raw_validate_raises_on_missing_key(client: TrackBearClient) -> None:
+    broken = {k: v for k, v in test_parameters.TAG_RESPONSE.items() if k != "color"}
+    responses.add(
+        method="GET",
+        url=f"{BASE_URL}/tag",
+        status=200,
+        json={"success": True, "data": [test_parameters.TAG_RESPONSE, broken]},
+    )
+
+    # Without validation the data is returned as given
+    assert client.tag.list_raw()[1] == broken
+
+    with pytest.raises(exceptions.ModelBuildError, match="Missing keys: color"):
+        client.tag.list_raw(validate=True)
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_get_raw_validate_raises_on_non_dict(client: TrackBearClient) -> None:
+    responses.add(
+        method="GET",
+        url=f"{BASE_URL}/project/123",
+        status=200,
+        json={"success": True, "data": "not a project"},
+    )
+
+    with pytest.raises(exceptions.ModelBuildError, match="ProjectDict"):
+        client.project.get_raw(123, validate=True)
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_raw_methods_raise_on_api_error(client: TrackBearClient) -> None:
+    responses.add(
+        method="GET",
+        url=f"{BASE_URL}/goal",
+        status=404,
+        json={"success": False, "error": {"code": "NOT_FOUND", "message": "Nope"}},
+    )
+
+    with pytest.raises(exceptions.APIResponseError, match="NOT_FOUND"):
+        client.goal.list_raw()
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_tally_list_raw_uses_list_filters(client: TrackBearClient) -> None:
+    responses.add(
+        method="GET",
+        url=f"{BASE_URL}/tally",
+        status=200,
+        json={"success": True, "data": []},
+        match=[
+            responses.matchers.query_string_matcher(
+                "works[]=1&works[]=2&measure=word&startDate=2025-01-01"
+            )
+        ],
+    )
+
+    assert client.tally.list_raw(works=[1, 2], measure="word", start_date="2025-01-01") == []
+
+    with pytest.raises(ValueError, match="YYYY-MM-DD"):
+        client.tally.list_raw(end_date="yesterday")
+
+
+def test_optional_keys_are_not_required() -> None:
+    assert "starred" not in schemas.ProjectDict.__required_keys__
+    assert "displayOnProfile" not in schemas.GoalDict.__required_keys__
+    assert "totals" in schemas.ProjectDict.__required_keys__
+    assert schemas.BalanceDict.__required_keys__ == frozenset()
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import json
+import threading
+from typing import Any
+
+import pytest
+import responses
+
+from trackbear_api import TrackBearClient
+from trackbear_api import exceptions
+from trackbear_api._singleflight import SingleFlight
+
+from . import test_parameters
+
+PROJECT_URL = "https://trackbear.app/api/v1/project"
+CALLERS = 4
+
+
+def _wait_for_waiters(client: TrackBearClient, key: tuple[str, str], count: int) -> None:
+    """Block the leading request until the other callers have joined its flight."""
+    test_parameters.wait_until(lambda: client.bare._flights.in_flight(key) >= count)
+
+
+def _add_project_callback(client: TrackBearClient) -> None:
+    def callback(_: Any) -> tuple[int, dict[str, str], str]:
+        _wait_for_waiters(client, ("project", "null"), CALLERS - 1)
+        return 200, {}, json.dumps({"success": True, "data": [test_parameters.PROJECT_RESPONSE]})
+
+    responses.add_callback(method="GET", url=PROJECT_URL, callback=callback)
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_concurrent_threads_share_one_request(client: TrackBearClient) -> None:
+    """Concurrent identical GETs from threads result in one HTTP request."""
+    _add_project_callback(client)
+
+    with concurrent.futures.ThreadPoolExecutor(CALLERS) as executor:
+        results = list(executor.map(lambda _: client.project.list(), range(CALLERS)))
+
+    assert len(responses.calls) == 1
+    assert all(result == results[0] for result in results)
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_concurrent_asyncio_callers_share_one_request(client: TrackBearClient) -> None:
+    """Asyncio callers running the client in threads share one HTTP request."""
+    _add_project_callback(client)
+
+    async def main() -> list[Any]:
+        calls = [asyncio.to_thread(client.project.list) for _ in range(CALLERS)]
+        return await asyncio.gather(*calls)
+
+    results = asyncio.run(main())
+
+    assert len(responses.calls) == 1
+    assert len(results) == CALLERS
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_sequential_requests_are_not_shared(client: TrackBearClient) -> None:
+    """Once a flight completes the next call makes a new request."""
+    body = json.dumps({"success": True, "data": []})
+    responses.add(method="GET", url=PROJECT_URL, body=body)
+    responses.add(method="GET", url=PROJECT_URL, body=body)
+
+    client.project.list()
+    client.project.list()
+
+    assert len(responses.calls) == 2
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_single_flight_disabled(client: TrackBearClient) -> None:
+    """Disabling single flight sends every request."""
+    client.bare.single_flight = False
+    responses.add(method="GET", url=PROJECT_URL, body=json.dumps({"success": True, "data": []}))
+
+    client.project.list()
+
+    assert client.bare._flights.in_flight(("project", "null")) == 0
+
+
+def test_waiters_receive_leader_exception() -> None:
+    """An exception raised by the leader is raised to every waiter."""
+    flights: SingleFlight[int] = SingleFlight()
+    release = threading.Event()
+
+    def leader() -> int:
+        release.wait(1)
+        raise exceptions.APIResponseError(500, "BAD", "nope")
+
+    def join() -> int:
+        test_parameters.wait_until(lambda: flights.in_flight("key") >= 1)
+        release.set()
+        return 0
+
+    with concurrent.futures.ThreadPoolExecutor(3) as executor:
+        first = executor.submit(flights.do, "key", leader)
+        test_parameters.wait_until(lambda: "key" in flights._calls)
+        second = executor.submit(flights.do, "key", lambda: 1)
+        executor.submit(join)
+
+        for future in (first, second):
+            with pytest.raises(exceptions.APIResponseError):
+                future.result()
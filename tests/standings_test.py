@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import copy
+from typing import Any
+
+from trackbear_api import enums
+from trackbear_api import models
+from trackbear_api.standings import LeaderboardStandings
+
+from . import test_parameters
+
+
+def make_board(**changes: Any) -> models.Leaderboard:
+    data = copy.deepcopy(test_parameters.LEADERBOARD_RESPONSE)
+    data.update({"individualGoalMode": False, "fundraiserMode": False}, **changes)
+    return models.Leaderboard.build(data)
+
+
+def make_participant(
+    uuid: str,
+    tallies: list[tuple[str, str, int]],
+    goal: dict[str, Any] | None = None,
+) -> models.Participant:
+    data = copy.deepcopy(test_parameters.LEADERBOARD_PARTICIPANT_RESPONSE)
+    data.update(
+        {
+            "uuid": uuid,
+            "displayName": uuid.title(),
+            "goal": goal,
+            "tallies": [
+                {"uuid": tally_uuid, "date": "2025-01-01", "measure": measure, "count": count}
+                for tally_uuid, measure, count in tallies
+            ],
+        }
+    )
+    return models.Participant.build(data)
+
+
+def test_top_ranks_by_first_measure() -> None:
+    """Participants are ranked by the total of the board's first measure."""
+    participants = [
+        make_participant("ann", [("a1", "word", 100), ("a2", "time", 999)]),
+        make_participant("bob", [("b1", "word", 300)]),
+        make_participant("cat", [("c1", "word", 100), ("c2", "page", 500)]),
+    ]
+
+    standings = LeaderboardStandings(make_board(), participants)
+    top = standings.top(3)
+
+    assert [(s.rank, s.participant_uuid, s.score) for s in top] == [
+        (1, "bob", 300.0),
+        (2, "ann", 100.0),
+        (2, "cat", 100.0),
+    ]
+    assert top[1].totals == {enums.Measure.WORD: 100, enums.Measure.TIME: 999}
+    assert standings.collective_totals == {enums.Measure.WORD: 500, enums.Measure.TIME: 999}
+
+
+def test_update_counts_only_new_tallies() -> None:
+    """Re-feeding the same participants does not double count tallies."""
+    standings = LeaderboardStandings(make_board(), [make_participant("ann", [("a1", "word", 5)])])
+
+    counted = standings.update(
+        [
+            make_participant("ann", [("a1", "word", 5), ("a2", "word", 10)]),
+            make_participant("bob", [("b1", "word", 20)]),
+        ]
+    )
+
+    assert counted == 2
+    assert len(standings) == 2
+    assert [s.participant_uuid for s in standings.top(1)] == ["bob"]
+
+
+def test_update_applies_edits_deletions_and_departures() -> None:
+    """Updating with a changed listing matches standings built from it afresh."""
+    board = make_board()
+    standings = LeaderboardStandings(
+        board,
+        [
+            make_participant("ann", [("a1", "word", 5), ("a2", "word", 10)]),
+            make_participant("bob", [("b1", "word", 20)]),
+            make_participant("cat", [("c1", "word", 30)]),
+        ],
+    )
+    listing = [
+        make_participant("ann", [("a1", "word", 50)]),
+        make_participant("bob", [("b1", "word", 20), ("b2", "time", 3)]),
+    ]
+
+    changed = standings.update(listing)
+
+    fresh = LeaderboardStandings(board, listing)
+    assert changed == 4
+    assert len(standings) == 2
+    assert standings.top() == fresh.top()
+    assert standings.collective_totals == fresh.collective_totals
+
+
+def test_participant_rejoining_is_ranked_once() -> None:
+    """Rankings from before a participant left never resurface after it rejoins."""
+    bob = make_participant("bob", [("b1", "word", 50)])
+    standings = LeaderboardStandings(
+        make_board(), [make_participant("ann", [("a1", "word", 100)]), bob]
+    )
+
+    standings.update([bob])
+    standings.update([make_participant("ann", [("a2", "word", 5)]), bob])
+
+    assert [(s.participant_uuid, s.score) for s in standings.top()] == [
+        ("bob", 50.0),
+        ("ann", 5.0),
+    ]
+
+
+def test_replace_and_remove_participant_leave_others_alone() -> None:
+    """Single participants are applied without a full listing."""
+    standings = LeaderboardStandings(
+        make_board(),
+        [
+            make_participant("ann", [("a1", "word", 5)]),
+            make_participant("bob", [("b1", "word", 20)]),
+        ],
+    )
+
+    assert standings.replace_participant(make_participant("ann", [("a1", "word", 50)])) == 1
+    assert standings.replace_participant(make_participant("cat", [("c1", "word", 1)])) == 1
+    assert standings.remove_participant("bob") == 1
+    assert standings.remove_participant("bob") == 0
+
+    assert [(s.participant_uuid, s.score) for s in standings.top()] == [
+        ("ann", 50.0),
+        ("cat", 1.0),
+    ]
+    assert standings.collective_totals == {enums.Measure.WORD: 51}
+
+
+def test_add_tally_replaces_edited_counts() -> None:
+    """A tally seen before only changes the totals when its count was edited."""
+    standings = LeaderboardStandings(
+        make_board(measures=["word"]),
+        [make_participant("ann", [("a1", "word", 5)])],
+    )
+    edited = models.TallyStub("a1", "2025-01-01", enums.Measure.WORD, 8)
+
+    assert standings.add_tally("ann", edited) is True
+    assert standings.add_tally("ann", edited) is False
+    assert (
+        standings.add_tally("ann", models.TallyStub("a2", "2025-01-01", enums.Measure.TIME, 1))
+        is False
+    )
+    assert standings.top(1)[0].totals == {enums.Measure.WORD: 8}
+    assert standings.collective_totals == {enums.Measure.WORD: 8}
+
+
+def test_add_tally_moves_rank_incrementally() -> None:
+    """A single new tally re-ranks a participant without a full rebuild."""
+    standings = LeaderboardStandings(
+        make_board(),
+        [make_participant("ann", [("a1", "word", 5)]), make_participant("bob", [])],
+        measure="word",
+    )
+
+    for index in range(200):
+        standings.add_tally("bob", models.TallyStub(f"b{index}", "2025-01-01", "word", 1))  # type: ignore[arg-type]
+
+    assert [s.participant_uuid for s in standings.top(2)] == ["bob", "ann"]
+    assert standings.top(2)[0].score == 200.0
+    assert len(standings._heap) < 200
+
+
+def test_stale_heap_entries_are_compacted() -> None:
+    """Entries invalidated below the top are dropped once they pile up."""
+    standings = LeaderboardStandings(
+        make_board(),
+        [make_participant("ann", [("a1", "word", 1000)]), make_participant("bob", [])],
+        measure="word",
+    )
+    for index in range(100):
+        standings.add_tally(
+            "bob", models.TallyStub(f"b{index}", "2025-01-01", enums.Measure.WORD, 1)
+        )
+
+    assert [s.participant_uuid for s in standings.top(1)] == ["ann"]
+    assert len(standings._heap) == 2
+
+
+def test_board_without_measures_counts_every_measure() -> None:
+    """A board without measures counts every tally and ranks by words."""
+    standings = LeaderboardStandings(
+        make_board(measures=[]),
+        [
+            make_participant("ann", [("a1", "word", 5), ("a2", "time", 50)]),
+            make_participant("bob", [("b1", "word", 10)]),
+        ],
+    )
+
+    assert [(s.participant_uuid, s.score) for s in standings.top()] == [("bob", 10.0), ("ann", 5.0)]
+    assert standings.collective_totals == {enums.Measure.WORD: 15, enums.Measure.TIME: 50}
+
+
+def test_individual_goal_mode_scores_progress() -> None:
+    """Individual goal mode ranks by progress toward each participant's goal."""
+    participants = [
+        make_participant("ann", [("a1", "word", 500)], goal={"measure": "word", "count": 1000}),
+        make_participant("bob", [("b1", "time", 45)], goal={"measure": "time", "count": 60}),
+        make_participant("cat", [("c1", "word", 900)]),
+    ]
+
+    standings = LeaderboardStandings(make_board(individualGoalMode=True), participants)
+
+    assert [(s.participant_uuid, s.score) for s in standings.top()] == [
+        ("bob", 0.75),
+        ("ann", 0.5),
+        ("cat", 0.0),
+    ]
+
+
+def test_fundraiser_progress() -> None:
+    """Fundraiser progress compares collective totals to the board goal."""
+    participants = [
+        make_participant("ann", [("a1", "word", 60)]),
+        make_participant("bob", [("b1", "word", 50), ("b2", "time", 5)]),
+    ]
+
+    standings = LeaderboardStandings(make_board(fundraiserMode=True), participants)
+
+    assert [(p.measure, p.total, p.goal, p.complete) for p in standings.fundraiser()] == [
+        (enums.Measure.TIME, 5, 0, False),
+        (enums.Measure.WORD, 110, 100, True),
+    ]
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from trackbear_api.streaks import HabitStreakTracker
+
+from .test_parameters import make_goal
+from .test_parameters import make_tally
+
+DAILY_500 = {
+    "cadence": {"unit": "day", "period": 1},
+    "threshold": {"measure": "word", "count": 500},
+}
+
+
+def test_streaks_track_consecutive_periods() -> None:
+    """Consecutive met periods extend the streak, gaps reset it."""
+    tracker = HabitStreakTracker(make_goal(DAILY_500, startDate="2025-01-01"))
+    days = [
+        ("2025-01-01", 500),
+        ("2025-01-02", 300),
+        ("2025-01-02", 300),
+        ("2025-01-03", 600),
+        ("2025-01-05", 500),
+    ]
+
+    for date, count in days:
+        assert tracker.add(make_tally(date, count)) is True
+
+    assert tracker.longest_streak == 3
+    assert tracker.current_streak(today="2025-01-05") == 1
+    assert tracker.current_streak(today="2025-01-06") == 1
+    assert tracker.current_streak(today="2025-01-07") == 0
+    assert tracker.period_total == 500
+
+
+def test_streaks_ignore_closed_periods_and_other_measures() -> None:
+    """Tallies of earlier periods or other measures are not counted."""
+    tracker = HabitStreakTracker(make_goal(DAILY_500))
+
+    assert tracker.add(make_tally("2025-01-02", 100)) is True
+    assert tracker.add(make_tally("2025-01-01", 500)) is False
+    assert tracker.add(make_tally("2025-01-02", 500, measure="time")) is False
+    assert tracker.state.origin == "2025-01-02"
+    assert tracker.period_total == 100
+
+
+def test_streaks_without_threshold() -> None:
+    """Any tally meets a period of a habit without a threshold."""
+    goal = make_goal({"cadence": {"unit": "week", "period": 1}, "threshold": None})
+    tracker = HabitStreakTracker(goal)
+
+    tracker.add(make_tally("2025-01-06", 1, measure="time"))
+    tracker.add(make_tally("2025-01-13", 1))
+
+    assert tracker.current_streak(today="2025-01-19") == 2
+
+
+def test_streaks_without_met_periods() -> None:
+    """A tracker without a met period has no current streak."""
+    tracker = HabitStreakTracker(make_goal(DAILY_500))
+
+    assert tracker.current_streak(today="2025-01-01") == 0
+
+    tracker.add(make_tally("2025-01-01", 100))
+
+    assert tracker.current_streak(today="2025-01-01") == 0
+    assert tracker.longest_streak == 0
+
+
+def test_streak_state_round_trip() -> None:
+    """Serialized state restores a tracker which continues the streak."""
+    goal = make_goal(DAILY_500)
+    tracker = HabitStreakTracker(goal)
+    tracker.add(make_tally("2025-01-01", 500))
+
+    restored = HabitStreakTracker.from_dict(goal, json.loads(json.dumps(tracker.to_dict())))
+    restored.add(make_tally("2025-01-02", 500))
+
+    assert restored.current_streak(today="2025-01-02") == 2
+    assert restored.state.origin == "2025-01-01"
+
+
+def test_streaks_reject_target_goal_and_foreign_state() -> None:
+    """Only habit goals with their own state are accepted."""
+    with pytest.raises(ValueError, match="is not a habit goal"):
+        HabitStreakTracker(make_goal({"threshold": {"measure": "word", "count": 1}}))
+
+    with pytest.raises(ValueError, match="does not belong to goal"):
+        HabitStreakTracker.from_dict(make_goal(DAILY_500), {"goal_id": 999})
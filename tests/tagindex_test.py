@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import copy
+import json
+from typing import Any
+
+import pytest
+import responses
+import responses.matchers
+
+from trackbear_api import TrackBearClient
+
+from . import test_parameters
+
+TAG_URL = "https://trackbear.app/api/v1/tag"
+
+
+def _tag(tag_id: int, name: str) -> dict[str, Any]:
+    data = copy.deepcopy(test_parameters.TAG_RESPONSE)
+    data.update({"id": tag_id, "name": name})
+    return data
+
+
+def _add_tag_list(*tags: dict[str, Any]) -> None:
+    responses.add(
+        method="GET",
+        url=TAG_URL,
+        body=json.dumps({"success": True, "data": list(tags)}),
+    )
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_resolve_ids_loads_index_once(client: TrackBearClient) -> None:
+    """Names are resolved from one lazily loaded index; ids pass through."""
+    _add_tag_list(_tag(1, "draft"), _tag(2, "sprint"))
+
+    assert client.tag.resolve_ids(["sprint", 9, "draft"]) == [2, 9, 1]
+    assert client.tag.resolve_ids(["draft"]) == [1]
+    assert client.tag.resolve_names([1, "other"]) == ["draft", "other"]
+    assert len(responses.calls) == 1
+
+
+def test_resolve_ids_without_names_makes_no_request(client: TrackBearClient) -> None:
+    """Only ids never loads the index."""
+    assert client.tag.resolve_ids([3, 4]) == [3, 4]
+    assert client.tag.resolve_names(["a"]) == ["a"]
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_resolve_miss_reloads_index(client: TrackBearClient) -> None:
+    """A name missing from the index triggers a single reload."""
+    _add_tag_list(_tag(1, "draft"))
+    _add_tag_list(_tag(1, "draft"), _tag(2, "sprint"))
+
+    client.tag.resolve_ids(["draft"])
+
+    assert client.tag.resolve_ids(["sprint"]) == [2]
+    assert len(responses.calls) == 2
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_resolve_unknown_name_raises(client: TrackBearClient) -> None:
+    """Names which do not exist after a reload raise."""
+    _add_tag_list(_tag(1, "draft"))
+
+    with pytest.raises(ValueError, match="Unknown tag name\\(s\\): nope"):
+        client.tag.resolve_ids(["nope"])
+
+    _add_tag_list(_tag(1, "draft"))
+
+    with pytest.raises(ValueError, match="Unknown tag id\\(s\\): 5"):
+        client.tag.resolve_names([5])
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_save_and_delete_refresh_index(client: TrackBearClient) -> None:
+    """Saved tags are added to the index and deleted tags removed."""
+    _add_tag_list(_tag(1, "draft"))
+    responses.add(
+        method="PATCH",
+        url=f"{TAG_URL}/1",
+        body=json.dumps({"success": True, "data": _tag(1, "revision")}),
+    )
+    responses.add(
+        method="DELETE",
+        url=f"{TAG_URL}/1",
+        body=json.dumps({"success": True, "data": _tag(1, "revision")}),
+    )
+    _add_tag_list()
+
+    client.tag.list()
+    client.tag.save("revision", "red", tag_id=1)
+
+    assert client.tag.resolve_ids(["revision"]) == [1]
+
+    client.tag.delete(1)
+
+    with pytest.raises(ValueError):
+        client.tag.resolve_ids(["revision"])
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_goal_and_tally_accept_tag_names(client: TrackBearClient) -> None:
+    """Goal saves and tally lists translate tag names into ids."""
+    _add_tag_list(_tag(987, "DaBomb"))
+    responses.add(
+        method="GET",
+        url="https://trackbear.app/api/v1/tally",
+        body=json.dumps({"success": True, "data": []}),
+        match=[responses.matchers.query_string_matcher("tags[]=987")],
+    )
+    responses.add(
+        method="POST",
+        url="https://trackbear.app/api/v1/goal",
+        body=json.dumps({"success": True, "data": test_parameters.GOAL_RESPONSE_THRESHOLD}),
+        match=[
+            responses.matchers.json_params_matcher(
+                {"tagIds": [987, 5]},
+                strict_match=False,
+            )
+        ],
+    )
+
+    client.tally.list(tags=["DaBomb"])
+    client.goal.save_target("title", "description", "word", 100, tag_ids=["DaBomb", 5])
+
+    assert len(responses.calls) == 3
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_tally_save_records_created_tags(client: TrackBearClient) -> None:
+    """Tags returned with a saved tally are recorded in a loaded index."""
+    _add_tag_list()
+    responses.add(
+        method="POST",
+        url="https://trackbear.app/api/v1/tally",
+        body=json.dumps({"success": True, "data": test_parameters.TALLY_RESPONSE}),
+    )
+
+    client.tag.list()
+    client.tally.save(456, "2021-03-23", "word", 1667, tags=["DaBomb"])
+
+    assert client.tag.resolve_ids(["DaBomb"]) == [987]
+    assert len(responses.calls) == 2
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_invalidate_index_reloads(client: TrackBearClient) -> None:
+    """An invalidated index is reloaded on the next resolve."""
+    _add_tag_list(_tag(1, "draft"))
+    _add_tag_list(_tag(1, "renamed"))
+
+    assert client.tag.resolve_ids(["draft"]) == [1]
+
+    client.tag.invalidate_index()
+
+    assert client.tag.resolve_names([1]) == ["renamed"]
+    assert len(responses.calls) == 2
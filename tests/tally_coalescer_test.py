@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pytest
+import requests
+import responses
+import responses.matchers
+
+from trackbear_api import TrackBearClient
+from trackbear_api import exceptions
+
+from . import test_parameters
+
+TALLY_URL = "https://trackbear.app/api/v1/tally"
+TALLY_BODY = json.dumps({"success": True, "data": test_parameters.TALLY_RESPONSE})
+
+
+def _payload(count: int, note: str = "", tags: list[str] | None = None) -> dict[str, object]:
+    return {
+        "date": "2025-01-01",
+        "measure": "word",
+        "count": count,
+        "note": note,
+        "workId": 123,
+        "setTotal": False,
+        "tags": tags or [],
+    }
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_coalesce_merges_increments_on_exit(client: TrackBearClient) -> None:
+    """Increments for the same key are saved once when the context exits."""
+    expected = _payload(150, note="first\nsecond", tags=["a", "b"])
+    responses.add(
+        method="POST",
+        url=TALLY_URL,
+        body=TALLY_BODY,
+        match=[responses.matchers.json_params_matcher(expected)],
+    )
+    responses.add(
+        method="POST",
+        url=TALLY_URL,
+        body=TALLY_BODY,
+        match=[responses.matchers.json_params_matcher(_payload(10) | {"measure": "time"})],
+    )
+
+    with client.tally.coalesce(window_seconds=60) as buffer:
+        buffer.save(123, "2025-01-01", "word", 50, note="first", tags=["a"])
+        buffer.save(123, "2025-01-01", "word", 50, note="second", tags=["a", "b"])
+        buffer.save(123, "2025-01-01", "word", 50, note="first")
+        buffer.save(123, "2025-01-01", "time", 10)
+
+        assert buffer.pending == 4
+        assert len(responses.calls) == 0
+
+    assert len(responses.calls) == 2
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_coalesce_flushes_at_max_pending(client: TrackBearClient) -> None:
+    """Reaching max_pending flushes without waiting for the window."""
+    responses.add(method="POST", url=TALLY_URL, body=TALLY_BODY)
+
+    buffer = client.tally.coalesce(window_seconds=60, max_pending=2)
+    buffer.save(123, "2025-01-01", "word", 1)
+    buffer.save(123, "2025-01-01", "word", 1)
+
+    assert buffer.pending == 0
+    assert len(responses.calls) == 1
+    assert buffer.close() == []
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_coalesce_flushes_after_window(client: TrackBearClient) -> None:
+    """Pending increments are flushed once the window expires."""
+    responses.add(method="POST", url=TALLY_URL, body=TALLY_BODY)
+
+    buffer = client.tally.coalesce(window_seconds=0.01)
+    buffer.save(123, "2025-01-01", "word", 1)
+
+    test_parameters.wait_until(lambda: len(responses.calls) > 0)
+
+    assert len(responses.calls) == 1
+    buffer.close()
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_coalesce_requeues_failed_flush(client: TrackBearClient) -> None:
+    """A failed save keeps the increments buffered for the next flush."""
+    failure = {"success": False, "error": {"code": "BAD", "message": "nope"}}
+    responses.add(method="POST", url=TALLY_URL, status=500, body=json.dumps(failure))
+    responses.add(method="POST", url=TALLY_URL, body=TALLY_BODY)
+
+    buffer = client.tally.coalesce(window_seconds=60)
+    buffer.save(123, "2025-01-01", "word", 5)
+
+    with pytest.raises(exceptions.APIResponseError):
+        buffer.flush()
+
+    assert buffer.pending == 1
+    assert len(buffer.close()) == 1
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_coalesce_requeues_keys_failing_outside_the_api(client: TrackBearClient) -> None:
+    """A lost connection keeps the failed key and still saves the keys after it."""
+    responses.add(
+        method="POST",
+        url=TALLY_URL,
+        body=requests.exceptions.ConnectionError("connection refused"),
+    )
+    responses.add(method="POST", url=TALLY_URL, body=TALLY_BODY)
+
+    buffer = client.tally.coalesce(window_seconds=60)
+    buffer.save(123, "2025-01-01", "word", 5)
+    buffer.save(123, "2025-01-02", "word", 7)
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        buffer.flush()
+
+    assert len(responses.calls) == 2
+    assert buffer.pending == 1
+    assert len(buffer.close()) == 1
+
+
+def test_coalesce_rejects_save_after_close(client: TrackBearClient) -> None:
+    """A closed buffer does not accept new increments."""
+    buffer = client.tally.coalesce()
+    buffer.close()
+
+    with pytest.raises(RuntimeError, match="closed TallyCoalescer"):
+        buffer.save(123, "2025-01-01", "word", 5)
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_coalesce_close_stays_open_when_flush_fails(client: TrackBearClient) -> None:
+    """A failed final flush keeps the increments, the timer, and the buffer open."""
+    failure = {"success": False, "error": {"code": "BAD", "message": "nope"}}
+    responses.add(method="POST", url=TALLY_URL, status=500, body=json.dumps(failure))
+    responses.add(method="POST", url=TALLY_URL, body=TALLY_BODY)
+
+    buffer = client.tally.coalesce(window_seconds=60)
+    buffer.save(123, "2025-01-01", "word", 5)
+
+    with pytest.raises(exceptions.APIResponseError):
+        buffer.close()
+
+    assert buffer.pending == 1
+    assert buffer._timer is not None
+    buffer.save(123, "2025-01-01", "word", 5)
+
+    assert len(buffer.close()) == 1
+    assert buffer._timer is None
+
+
+@pytest.mark.parametrize(
+    "failure",
+    (
+        {
+            "status": 500,
+            "body": json.dumps({"success": False, "error": {"code": "BAD", "message": ""}}),
+        },
+        {"body": requests.exceptions.ConnectionError("connection refused")},
+    ),
+)
+@responses.activate(assert_all_requests_are_fired=True)
+def test_coalesce_timer_retries_failed_flush(
+    client: TrackBearClient,
+    failure: dict[str, Any],
+) -> None:
+    """A flush failing on the timer is retried when the timer fires again."""
+    responses.add(method="POST", url=TALLY_URL, **failure)
+    responses.add(method="POST", url=TALLY_URL, body=TALLY_BODY)
+
+    buffer = client.tally.coalesce(window_seconds=0.01)
+    buffer.save(123, "2025-01-01", "word", 5)
+
+    test_parameters.wait_until(lambda: buffer.pending == 0 and len(responses.calls) == 2)
+
+    assert len(responses.calls) == 2
+    assert buffer.close() == []
+
+
+def test_coalesce_skips_increments_netting_to_zero(client: TrackBearClient) -> None:
+    """Increments cancelling out are not saved."""
+    buffer = client.tally.coalesce(window_seconds=60)
+    buffer.save(123, "2025-01-01", "word", 5)
+    buffer.save(123, "2025-01-01", "word", -5)
+
+    assert buffer.close() == []
+
+
+@pytest.mark.parametrize("kwargs", ({"window_seconds": 0}, {"max_pending": 0}))
+def test_coalesce_rejects_invalid_limits(client: TrackBearClient, kwargs: dict[str, Any]) -> None:
+    with pytest.raises(ValueError):
+        client.tally.coalesce(**kwargs)
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_coalesce_close_flushes_saves_made_while_flushing(client: TrackBearClient) -> None:
+    """Increments buffered while the final flush runs are saved before closing."""
+    buffer = client.tally.coalesce(window_seconds=60)
+
+    def callback(_: Any) -> tuple[int, dict[str, str], str]:
+        if len(responses.calls) == 0:
+            buffer.save(123, "2025-01-02", "word", 5)
+        return 200, {}, TALLY_BODY
+
+    responses.add_callback(method="POST", url=TALLY_URL, callback=callback)
+    buffer.save(123, "2025-01-01", "word", 5)
+
+    assert len(buffer.close()) == 2
+    assert len(responses.calls) == 2
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import json
+import pathlib
+
+import pytest
+import requests
+import responses
+import responses.matchers
+
+from trackbear_api import TrackBearClient
+from trackbear_api import enums
+
+from . import test_parameters
+
+TALLY_URL = "https://trackbear.app/api/v1/tally"
+
+ROWS = [
+    {
+        "work_id": 456,
+        "date": "2021-03-23",
+        "measure": "word",
+        "count": 1667,
+        "note": "Did well, enough.",
+    },
+    {"work_id": 456, "date": "2021-03-24", "measure": "word", "count": 500, "tags": ["Sprint"]},
+    {"work_id": 456, "date": "2021-03-24", "measure": "word", "count": 500, "tags": ["Sprint"]},
+]
+
+
+def _add_list_response(tallies: list[dict[str, object]]) -> None:
+    query = "works[]=456&startDate=2021-03-23&endDate=2021-03-24"
+    responses.add(
+        method="GET",
+        url=TALLY_URL,
+        body=json.dumps({"success": True, "data": tallies}),
+        match=[responses.matchers.query_string_matcher(query)],
+    )
+
+
+@pytest.mark.parametrize(
+    "row,pattern",
+    (
+        (
+            {"date": "2021-03-23", "measure": "word", "count": 1},
+            "Row 1: missing required key 'work_id'",
+        ),
+        (
+            {"work_id": 1, "date": "03/23/2021", "measure": "word", "count": 1},
+            "Row 1: invalid date",
+        ),
+        ({"work_id": 1, "date": "2021-03-23", "measure": "words", "count": 1}, "Row 1: 'words'"),
+        (
+            {"work_id": 1, "date": "2021-03-23", "measure": "word", "count": "many"},
+            "Row 1: invalid",
+        ),
+    ),
+)
+@responses.activate(assert_all_requests_are_fired=True)
+def test_save_many_validates_all_rows_before_requests(
+    client: TrackBearClient,
+    row: dict[str, object],
+    pattern: str,
+) -> None:
+    """A single invalid row fails the whole import before any request is sent."""
+    with pytest.raises(ValueError, match=pattern):
+        client.tally.save_many([ROWS[0], row])
+
+
+def test_save_many_rejects_invalid_max_workers(client: TrackBearClient) -> None:
+    """At least one worker is required."""
+    with pytest.raises(ValueError, match="max_workers"):
+        client.tally.save_many(ROWS, max_workers=0)
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_save_many_skips_existing_and_duplicate_rows(client: TrackBearClient) -> None:
+    """Rows matching an existing tally or an earlier row are not saved."""
+    _add_list_response([test_parameters.TALLY_RESPONSE])
+    responses.add(
+        method="POST",
+        url=TALLY_URL,
+        body=json.dumps({"success": True, "data": test_parameters.TALLY_RESPONSE}),
+        match=[
+            responses.matchers.json_params_matcher(
+                {
+                    "date": "2021-03-24",
+                    "measure": "word",
+                    "count": 500,
+                    "note": "",
+                    "workId": 456,
+                    "setTotal": False,
+                    "tags": ["Sprint"],
+                }
+            )
+        ],
+    )
+
+    results = sorted(client.tally.save_many(ROWS, max_workers=2), key=lambda r: r.index)
+
+    assert [result.status for result in results] == [
+        enums.SaveStatus.SKIPPED,
+        enums.SaveStatus.SAVED,
+        enums.SaveStatus.SKIPPED,
+    ]
+    assert results[1].tally is not None
+    assert len(responses.calls) == 2
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_save_many_reports_failed_rows(client: TrackBearClient) -> None:
+    """API failures are captured per row without stopping the import."""
+    failure = {"success": False, "error": {"code": "BAD", "message": "nope"}}
+    responses.add(method="POST", url=TALLY_URL, status=400, body=json.dumps(failure))
+
+    results = list(client.tally.save_many(ROWS[:1], skip_existing=False))
+
+    assert len(results) == 1
+    assert results[0].status is enums.SaveStatus.FAILED
+    assert results[0].error is not None
+    assert results[0].tally is None
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_save_many_reports_connection_errors_per_row(client: TrackBearClient) -> None:
+    """Errors raised outside of the API, like a lost connection, fail only their row."""
+    error = requests.exceptions.ConnectionError("connection refused")
+    responses.add(method="POST", url=TALLY_URL, body=error)
+    responses.add(
+        method="POST",
+        url=TALLY_URL,
+        body=json.dumps({"success": True, "data": test_parameters.TALLY_RESPONSE}),
+    )
+
+    results = list(client.tally.save_many(ROWS, max_workers=1, skip_existing=False))
+
+    assert [result.status for result in results] == [
+        enums.SaveStatus.FAILED,
+        enums.SaveStatus.SAVED,
+        enums.SaveStatus.SAVED,
+    ]
+    assert results[0].error is error
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_save_many_bounds_requests_in_flight(client: TrackBearClient) -> None:
+    """Rows beyond `max_workers` wait for an earlier save to complete."""
+    responses.add(
+        method="POST",
+        url=TALLY_URL,
+        body=json.dumps({"success": True, "data": test_parameters.TALLY_RESPONSE}),
+    )
+
+    results = list(client.tally.save_many(ROWS, max_workers=1, skip_existing=False))
+
+    assert sorted(result.index for result in results) == [0, 1, 2]
+    assert {result.status for result in results} == {enums.SaveStatus.SAVED}
+    assert len(responses.calls) == 3
+
+
+@pytest.mark.parametrize(
+    "filename,content",
+    (
+        (
+            "import.csv",
+            "work_id,date,measure,count,note,tags\n456,2021-03-24,word,500,,Sprint;Draft\n",
+        ),
+        (
+            "import.ndjson",
+            '{"work_id": 456, "date": "2021-03-24", "measure": "word", "count": 500, "tags": ["Sprint", "Draft"]}\n\n',
+        ),
+    ),
+)
+@responses.activate(assert_all_requests_are_fired=True)
+def test_import_file(
+    client: TrackBearClient,
+    tmp_path: pathlib.Path,
+    filename: str,
+    content: str,
+) -> None:
+    """Rows are read from csv and ndjson files and saved."""
+    import_file = tmp_path / filename
+    import_file.write_text(content)
+    responses.add(
+        method="POST",
+        url=TALLY_URL,
+        body=json.dumps({"success": True, "data": test_parameters.TALLY_RESPONSE}),
+        match=[
+            responses.matchers.json_params_matcher(
+                {
+                    "date": "2021-03-24",
+                    "measure": "word",
+                    "count": 500,
+                    "note": "",
+                    "workId": 456,
+                    "setTotal": False,
+                    "tags": ["Sprint", "Draft"],
+                }
+            )
+        ],
+    )
+
+    results = list(client.tally.import_file(import_file, skip_existing=False))
+
+    assert [result.status for result in results] == [enums.SaveStatus.SAVED]
+
+
+def test_import_file_unsupported_type(client: TrackBearClient) -> None:
+    """Unknown file extensions are rejected."""
+    with pytest.raises(ValueError, match="Unsupported import file type '.xlsx'"):
+        client.tally.import_file("tallies.xlsx")
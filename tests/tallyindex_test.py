@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import datetime
+import random
+from collections.abc import Sequence
+from typing import Any
+
+import pytest
+
+from trackbear_api import enums
+from trackbear_api import models
+from trackbear_api.tallyindex import TallyIndex
+
+from . import test_parameters
+
+TAGS = {
+    name: test_parameters.TAG_RESPONSE | {"id": id_, "name": name} for id_, name in enumerate("abc")
+}
+
+
+def build_tallies(count: int) -> list[models.Tally]:
+    rng = random.Random(4)
+    start = datetime.date(2025, 1, 1)
+    tallies = []
+    for tally_id in range(count):
+        date = start + datetime.timedelta(days=rng.randrange(90))
+        tallies.append(
+            test_parameters.make_tally(
+                date.isoformat(),
+                rng.randrange(1, 2000),
+                id=tally_id,
+                workId=rng.choice([1, 2, 3]),
+                measure=rng.choice(["word", "time"]),
+                tags=[TAGS[name] for name in rng.sample("abc", rng.randrange(3))],
+            )
+        )
+    return tallies
+
+
+TALLIES = build_tallies(300)
+
+
+def brute_force(
+    works: Sequence[int] | None = None,
+    tags: Sequence[int | str] | None = None,
+    measure: str | None = None,
+    start_date: str | None = None,
+    end_date: str | None = None,
+) -> list[int]:
+    matches = []
+    for tally in sorted(TALLIES, key=lambda tally: (tally.date, tally.id)):
+        tag_keys = {tag.id for tag in tally.tags} | {tag.name for tag in tally.tags}
+        if works and tally.work_id not in works:
+            continue
+        if tags and not tag_keys & set(tags):
+            continue
+        if measure is not None and tally.measure != measure:
+            continue
+        if start_date is not None and tally.date < start_date:
+            continue
+        if end_date is not None and tally.date > end_date:
+            continue
+        matches.append(tally.id)
+    return matches
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {},
+        {"start_date": "2025-02-01"},
+        {"end_date": "2025-01-15"},
+        {"start_date": "2025-02-10", "end_date": "2025-02-10"},
+        {"works": [2]},
+        {"works": [1, 3, 3], "start_date": "2025-01-20", "end_date": "2025-03-01"},
+        {"works": [99]},
+        {"measure": "time"},
+        {"works": [1], "measure": enums.Measure.WORD, "end_date": "2025-02-01"},
+        {"tags": ["a"]},
+        {"tags": [1, "c"], "start_date": "2025-01-10"},
+        {"tags": ["a", 0], "works": [2], "measure": "word"},
+        {"tags": ["missing"]},
+        {"works": [], "tags": []},
+        {"start_date": "2025-03-01", "end_date": "2025-01-01"},
+    ],
+)
+def test_query_matches_brute_force(filters: dict[str, Any]) -> None:
+    index = TallyIndex(TALLIES)
+
+    result = index.query(**filters)
+
+    assert [tally.id for tally in result] == brute_force(**filters)
+
+
+def test_iterates_in_date_order() -> None:
+    index = TallyIndex(TALLIES)
+
+    assert len(index) == len(TALLIES)
+    assert [tally.id for tally in index] == brute_force()
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [{"measure": "bogus"}, {"start_date": "2025/01/01"}, {"end_date": "soon"}],
+)
+def test_query_rejects_invalid_filters(filters: dict[str, Any]) -> None:
+    with pytest.raises(ValueError):
+        TallyIndex(TALLIES).query(**filters)
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import copy
+from unittest.mock import Mock
+
+import pytest
+
+from trackbear_api import TrackBearClient
+from trackbear_api import enums
+from trackbear_api import models
+from trackbear_api._cache import ResponseCache
+from trackbear_api._tallyplanner import TallyFilter
+from trackbear_api._tallyplanner import TallyQueryPlanner
+from trackbear_api.transport import InMemoryTransport
+
+from . import test_parameters
+
+TALLY_URL = "https://trackbear.app/api/v1/tally"
+
+
+def tally(tally_id: int, date: str, work_id: int, measure: str = "word") -> dict[str, object]:
+    data = copy.deepcopy(test_parameters.TALLY_RESPONSE)
+    data.update({"id": tally_id, "date": date, "workId": work_id, "measure": measure})
+    return data
+
+
+TALLIES = [
+    tally(1, "2025-01-05", 3),
+    tally(2, "2025-02-10", 3),
+    tally(3, "2025-03-02", 3, "time"),
+    tally(4, "2025-03-05", 4),
+    tally(5, "2025-04-01", 3),
+]
+
+
+@pytest.fixture
+def transport() -> InMemoryTransport:
+    transport = InMemoryTransport()
+    transport.add("GET", TALLY_URL, data=TALLIES)
+    transport.add("POST", TALLY_URL, data=test_parameters.TALLY_RESPONSE)
+    return transport
+
+
+@pytest.fixture
+def client(transport: InMemoryTransport) -> TrackBearClient:
+    return TrackBearClient(api_token="token", transport=transport, cache_seconds=60)
+
+
+def listed(transport: InMemoryTransport) -> list[object]:
+    return [request.params for request in transport.requests if request.method == "GET"]
+
+
+def test_narrower_listing_is_filtered_locally(
+    client: TrackBearClient,
+    transport: InMemoryTransport,
+) -> None:
+    client.tally.list()
+
+    result = client.tally.list(works=[3], measure="word", start_date="2025-02-01")
+
+    assert [tally.id for tally in result] == [2, 5]
+    assert listed(transport) == [None]
+
+
+def test_only_uncovered_dates_are_fetched(
+    client: TrackBearClient,
+    transport: InMemoryTransport,
+) -> None:
+    client.tally.list(start_date="2025-02-01", end_date="2025-02-28")
+
+    client.tally.list(works=[3], start_date="2025-01-15", end_date="2025-03-10")
+
+    assert listed(transport)[1:] == [
+        {"works[]": [3], "startDate": "2025-01-15", "endDate": "2025-01-31"},
+        {"works[]": [3], "startDate": "2025-03-01", "endDate": "2025-03-10"},
+    ]
+
+
+def test_listings_are_combined_across_ranges(
+    client: TrackBearClient,
+    transport: InMemoryTransport,
+) -> None:
+    client.tally.list(end_date="2025-01-31")
+    client.tally.list(start_date="2025-02-01")
+
+    result = client.tally.list(start_date="2025-01-01", end_date="2025-03-31")
+
+    assert len(listed(transport)) == 2
+    assert [tally.id for tally in result] == [1, 2, 3, 4]
+
+
+def test_wider_listing_is_fetched(client: TrackBearClient, transport: InMemoryTransport) -> None:
+    client.tally.list(works=[3])
+    client.tally.list(works=[3, 4])
+    client.tally.list(works=[3], tags=[987])
+
+    assert listed(transport) == [{"works[]": [3]}, {"works[]": [3, 4]}]
+
+
+def test_write_drops_kept_listings(client: TrackBearClient, transport: InMemoryTransport) -> None:
+    client.tally.list()
+    client.tally.save(work_id=3, date="2025-05-01", measure="word", count=10)
+
+    client.tally.list(works=[3])
+
+    assert listed(transport) == [None, {"works[]": [3]}]
+
+
+def test_expired_listings_are_fetched(
+    client: TrackBearClient,
+    transport: InMemoryTransport,
+) -> None:
+    now = [0.0]
+    client.bare.cache = ResponseCache(60, clock=lambda: now[0])
+    client.tally.list()
+
+    now[0] = 61.0
+    client.tally.list(works=[3])
+
+    assert listed(transport) == [None, {"works[]": [3]}]
+
+
+def test_without_cache_every_listing_is_fetched(transport: InMemoryTransport) -> None:
+    client = TrackBearClient(api_token="token", transport=transport)
+    client.tally.list()
+
+    result = client.tally.list(works=[3])
+
+    assert len(listed(transport)) == 2
+    assert len(result) == len(TALLIES)
+
+
+def test_oldest_listings_are_dropped_beyond_max_entries() -> None:
+    planner = TallyQueryPlanner(ResponseCache(60), max_entries=2)
+    tallies = [models.Tally.build(data) for data in TALLIES]
+
+    for work_id in (3, 4, 5):
+        planner.list({"works[]": [work_id]}, lambda params: tallies)
+
+    assert len(planner) == 2
+
+    planner.clear()
+
+    assert len(planner) == 0
+
+
+def test_listing_fetched_while_cache_clears_is_not_kept() -> None:
+    cache = ResponseCache(60)
+    planner = TallyQueryPlanner(cache)
+    tallies = [models.Tally.build(data) for data in TALLIES]
+
+    def fetch(params: object) -> list[models.Tally]:
+        cache.clear()
+        return tallies
+
+    result = planner.list({}, fetch)
+
+    assert len(result) == len(TALLIES)
+    assert len(planner) == 0
+
+
+def test_reversed_date_range_is_empty_without_fetching() -> None:
+    planner = TallyQueryPlanner(ResponseCache(60))
+    fetch = Mock(return_value=[])
+
+    result = planner.list({"startDate": "2025-03-01", "endDate": "2025-01-01"}, fetch)
+
+    assert result == []
+    fetch.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "wider, narrower, expected",
+    [
+        (TallyFilter(None, None, None), TallyFilter(frozenset({1}), frozenset({2}), None), True),
+        (TallyFilter(frozenset({1, 2}), None, None), TallyFilter(frozenset({1}), None, None), True),
+        (TallyFilter(frozenset({1}), None, None), TallyFilter(None, None, None), False),
+        (TallyFilter(None, frozenset({1}), None), TallyFilter(None, None, None), False),
+        (TallyFilter(None, None, enums.Measure.WORD), TallyFilter(None, None, None), False),
+    ],
+)
+def test_filter_covers(wider: TallyFilter, narrower: TallyFilter, expected: bool) -> None:
+    assert wider.covers(narrower) is expected
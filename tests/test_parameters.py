@@ -4,10 +4,14 @@ All of the mock API repsonses by route type and helper functions. Shared across
 
 from __future__ import annotations
 
+import copy
 import re
+import time
+from collections.abc import Callable
 from typing import Any
 
 from trackbear_api import enums
+from trackbear_api import models
 
 
 def keys_to_snake_case(response: dict[str, Any]) -> dict[str, Any]:
@@ -32,6 +36,38 @@ def keys_to_snake_case(response: dict[str, Any]) -> dict[str, Any]:
     return result
 
 
+def make_tally(date: str, count: int, **changes: Any) -> models.Tally:
+    """Build a Tally from the mock response with the given changes."""
+    data = copy.deepcopy(TALLY_RESPONSE)
+    data.update({"date": date, "count": count}, **changes)
+    return models.Tally.build(data)
+
+
+def make_goal(parameters: dict[str, Any], **changes: Any) -> models.Goal:
+    """Build a Goal from the mock response with the given parameters and changes."""
+    data = copy.deepcopy(GOAL_RESPONSE_THRESHOLD)
+    data.update(
+        {
+            "type": "habit" if "cadence" in parameters else "target",
+            "parameters": parameters,
+            "startDate": None,
+            "endDate": None,
+            "workIds": [],
+            "tagIds": [],
+        },
+        **changes,
+    )
+    return models.Goal.build(data)
+
+
+def wait_until(predicate: Callable[[], bool], timeout: float = 5) -> None:
+    """Poll until the predicate holds or `timeout` seconds pass."""
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        # Whether the predicate already holds on the first poll depends on timing
+        time.sleep(0.001)  # pragma: no cover
+
+
 PROJECT_RESPONSE = {
     "id": 123,
     "uuid": "8fb3e519-fc08-477f-a70e-4132eca599d4",
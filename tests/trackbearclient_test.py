@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import importlib.metadata
 import json
+from typing import Any
 
 import pytest
 import requests
@@ -9,6 +10,7 @@ import responses
 import responses.matchers
 
 from trackbear_api import TrackBearClient
+from trackbear_api._cache import ResponseCache
 from trackbear_api.exceptions import APITimeoutError
 from trackbear_api.models import TrackBearResponse
 
@@ -348,3 +350,149 @@ def test_get_with_timeout_exception(client: TrackBearClient) -> None:
 
     with pytest.raises(APITimeoutError, match=pattern):
         client.bare.get("/ping")
+
+
+@pytest.mark.usefixtures("add_token")
+@responses.activate(assert_all_requests_are_fired=True)
+def test_get_served_from_cache_until_write() -> None:
+    """Cached GET responses are reused until a write clears the cache."""
+    client = TrackBearClient(cache_seconds=60)
+    body = json.dumps({"success": True, "data": "pong"})
+    responses.add(method="GET", url="https://trackbear.app/api/v1/ping", body=body)
+    responses.add(method="POST", url="https://trackbear.app/api/v1/ping", body=body)
+    responses.add(method="GET", url="https://trackbear.app/api/v1/ping", body=body)
+
+    first = client.bare.get("/ping")
+    second = client.bare.get("/ping")
+    client.bare.post("/ping", {})
+    third = client.bare.get("/ping")
+
+    assert first is second
+    assert third is not first
+    assert len(responses.calls) == 3
+
+
+@pytest.mark.usefixtures("add_token")
+@responses.activate(assert_all_requests_are_fired=True)
+def test_get_racing_a_write_is_not_cached() -> None:
+    """A GET answered before a write cleared the cache is not cached afterwards."""
+    client = TrackBearClient(cache_seconds=60)
+    body = json.dumps({"success": True, "data": "pong"})
+
+    def callback(_: Any) -> tuple[int, dict[str, str], str]:
+        assert client.bare.cache is not None
+        if len(responses.calls) == 0:
+            client.bare.cache.clear()
+        return 200, {}, body
+
+    responses.add_callback(method="GET", url="https://trackbear.app/api/v1/ping", callback=callback)
+
+    client.bare.get("/ping")
+    client.bare.get("/ping")
+    client.bare.get("/ping")
+
+    assert len(responses.calls) == 2
+
+
+@pytest.mark.usefixtures("add_token")
+@responses.activate(assert_all_requests_are_fired=True)
+def test_failed_write_clears_cache() -> None:
+    """A write whose outcome is unknown still clears the cache."""
+    client = TrackBearClient(cache_seconds=60)
+    body = json.dumps({"success": True, "data": "pong"})
+    responses.add(method="GET", url="https://trackbear.app/api/v1/ping", body=body)
+    responses.add(
+        method="POST",
+        url="https://trackbear.app/api/v1/ping",
+        body=requests.exceptions.Timeout("A Mock Timeout"),
+    )
+
+    client.bare.get("/ping")
+    with pytest.raises(APITimeoutError):
+        client.bare.post("/ping", {})
+    client.bare.get("/ping")
+
+    assert [call.request.method for call in responses.calls] == ["GET", "POST", "GET"]
+
+
+def test_cache_evicts_long_expired_responses() -> None:
+    """Responses expired for longer than the time-to-live are evicted on set."""
+    now = [0.0]
+    cache = ResponseCache(10, clock=lambda: now[0])
+    response = TrackBearResponse.build({"success": True, "data": "pong"}, 100, 0, 200)
+    cache.set("old", response)
+
+    now[0] = 15.0
+    assert cache.now() == 15.0
+    cache.set("new", response)
+    assert cache.get("old", stale=True) is response
+
+    now[0] = 25.0
+    cache.set("newer", response)
+    assert cache.get("old", stale=True) is None
+    assert len(cache) == 2
+
+
+@pytest.mark.usefixtures("add_token")
+@responses.activate(assert_all_requests_are_fired=True)
+def test_failed_get_is_not_cached() -> None:
+    """Unsuccessful responses are never cached."""
+    client = TrackBearClient(cache_seconds=60)
+    failure = json.dumps({"success": False, "error": {"code": "BAD", "message": "nope"}})
+    responses.add(method="GET", url="https://trackbear.app/api/v1/ping", status=500, body=failure)
+    responses.add(method="GET", url="https://trackbear.app/api/v1/ping", status=500, body=failure)
+
+    client.bare.get("/ping")
+    client.bare.get("/ping")
+
+    assert len(responses.calls) == 2
+
+
+@pytest.mark.usefixtures("add_token")
+@responses.activate(assert_all_requests_are_fired=True)
+def test_preload_warms_cache(caplog: pytest.LogCaptureFixture) -> None:
+    """Preloaded resources are fetched at construction and then served from cache."""
+    empty = json.dumps({"success": True, "data": []})
+    responses.add(method="GET", url="https://trackbear.app/api/v1/project", body=empty)
+    responses.add(method="GET", url="https://trackbear.app/api/v1/tag", body=empty)
+
+    with caplog.at_level("INFO", logger="trackbear-api"):
+        client = TrackBearClient(preload=["project", "tag"])
+
+    client.project.list()
+    client.tag.list()
+
+    assert client.bare.cache is not None
+    assert client.bare.cache.ttl_seconds == 300
+    assert len(responses.calls) == 2
+    assert "Warmed project in" in caplog.text
+    assert "Warmup finished in" in caplog.text
+
+
+@pytest.mark.usefixtures("add_token")
+@responses.activate(assert_all_requests_are_fired=True)
+def test_warm_logs_failures(caplog: pytest.LogCaptureFixture) -> None:
+    """A failing resource is logged and excluded from the timings."""
+    failure = json.dumps({"success": False, "error": {"code": "BAD", "message": "nope"}})
+    empty = json.dumps({"success": True, "data": []})
+    responses.add(method="GET", url="https://trackbear.app/api/v1/goal", status=500, body=failure)
+    responses.add(method="GET", url="https://trackbear.app/api/v1/leaderboard", body=empty)
+    client = TrackBearClient(cache_seconds=60)
+
+    timings = client.warm(["goal", "leaderboard"])
+
+    assert list(timings) == ["leaderboard"]
+    assert "Failed to warm goal" in caplog.text
+
+
+@pytest.mark.usefixtures("add_token")
+def test_warm_unknown_resource() -> None:
+    """Unknown resources are rejected before any request is made."""
+    with pytest.raises(ValueError, match="Unknown resources"):
+        TrackBearClient(preload=["stat"])
+
+
+def test_cache_rejects_invalid_ttl() -> None:
+    """The time-to-live must be positive."""
+    with pytest.raises(ValueError, match="ttl_seconds"):
+        ResponseCache(0)
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+import requests
+import urllib3
+
+from trackbear_api import TrackBearClient
+from trackbear_api.exceptions import APITimeoutError
+from trackbear_api.transport import InMemoryTransport
+from trackbear_api.transport import RequestsTransport
+from trackbear_api.transport import Urllib3Transport
+
+from . import test_parameters
+
+PROJECT_URL = "https://trackbear.app/api/v1/project"
+
+
+class MockPoolManager:
+    """Records requests made through a Urllib3Transport."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        self.calls: list[dict[str, Any]] = []
+        self.error = error
+        self.cleared = False
+
+    def request(self, method: str, url: str, **kwargs: Any) -> Any:
+        self.calls.append({"method": method, "url": url, **kwargs})
+        if self.error is not None:
+            raise self.error
+
+        headers = urllib3.HTTPHeaderDict({"ratelimit": '"100-in-1min"; r=42; t=30'})
+        return SimpleNamespace(status=200, headers=headers, data=b'{"success": true, "data": []}')
+
+    def clear(self) -> None:
+        self.cleared = True
+
+
+def test_in_memory_transport_serves_client() -> None:
+    """Registered responses are returned and requests recorded with client headers."""
+    transport = InMemoryTransport()
+    transport.add("GET", PROJECT_URL, data=[test_parameters.PROJECT_RESPONSE])
+    client = TrackBearClient(api_token="token", user_agent="agent", transport=transport)
+
+    projects = client.project.list()
+
+    assert [project.id for project in projects] == [test_parameters.PROJECT_RESPONSE["id"]]
+    (request,) = transport.requests
+    assert request.method == "GET"
+    assert request.headers == {"User-Agent": "agent", "Authorization": "Bearer token"}
+    assert client.bare.rate_limit.remaining == 100
+
+
+def test_in_memory_transport_returns_responses_in_order() -> None:
+    """Responses are returned in the order added and the last one repeats."""
+    transport = InMemoryTransport()
+    transport.add("GET", PROJECT_URL, status_code=500, body=b"{}")
+    transport.add("GET", PROJECT_URL, data=[])
+
+    statuses = [transport.request("GET", PROJECT_URL, timeout=1).status_code for _ in range(3)]
+
+    assert statuses == [500, 200, 200]
+
+
+def test_in_memory_transport_response_headers() -> None:
+    """Headers given to a response replace the default RateLimit header."""
+    transport = InMemoryTransport()
+    transport.add("GET", PROJECT_URL, data=[], headers={"Retry-After": "5"})
+
+    response = transport.request("GET", PROJECT_URL, timeout=1)
+
+    assert response.headers == {"Retry-After": "5"}
+
+
+def test_in_memory_transport_unregistered_route() -> None:
+    transport = InMemoryTransport()
+
+    with pytest.raises(LookupError, match="GET"):
+        transport.request("GET", PROJECT_URL, timeout=1)
+
+
+def test_transport_timeout_raises_api_timeout() -> None:
+    """A TimeoutError from any transport is raised as an APITimeoutError."""
+    transport = InMemoryTransport()
+    transport.add("GET", PROJECT_URL, error=TimeoutError("too slow"))
+    client = TrackBearClient(api_token="token", timeout_seconds=2, transport=transport)
+
+    with pytest.raises(APITimeoutError, match="timed out after 2 seconds.*too slow"):
+        client.bare.get("/project")
+
+
+def test_urllib3_transport_request() -> None:
+    """Params are encoded into the url and payloads sent as JSON with the headers."""
+    pool_manager = MockPoolManager()
+    transport = Urllib3Transport({"Authorization": "Bearer token"}, pool_manager=pool_manager)  # type: ignore[arg-type]
+
+    transport.request("GET", PROJECT_URL, params={"works": [1, 2], "measure": "word"}, timeout=3)
+    response = transport.request("POST", PROJECT_URL, payload={"title": "new"}, timeout=3)
+
+    get, post = pool_manager.calls
+    assert get["url"] == f"{PROJECT_URL}?works=1&works=2&measure=word"
+    assert get["body"] is None
+    assert post["body"] == b'{"title": "new"}'
+    assert post["headers"] == {"Authorization": "Bearer token", "Content-Type": "application/json"}
+    assert post["timeout"].read_timeout == 3
+    assert post["retries"] is False
+    assert response.headers["RateLimit"] == '"100-in-1min"; r=42; t=30'
+    assert response.json() == {"success": True, "data": []}
+
+
+def test_urllib3_transport_close() -> None:
+    pool_manager = MockPoolManager()
+    transport = Urllib3Transport(pool_manager=pool_manager)  # type: ignore[arg-type]
+
+    transport.close()
+
+    assert pool_manager.cleared is True
+
+
+def test_urllib3_transport_timeout() -> None:
+    error = urllib3.exceptions.ReadTimeoutError(None, PROJECT_URL, "read timed out")  # type: ignore[arg-type]
+    transport = Urllib3Transport(pool_manager=MockPoolManager(error))  # type: ignore[arg-type]
+
+    with pytest.raises(TimeoutError, match="read timed out"):
+        transport.request("GET", PROJECT_URL, timeout=3)
+
+
+@pytest.mark.parametrize(
+    "error",
+    (
+        urllib3.exceptions.NewConnectionError(None, "connection refused"),  # type: ignore[arg-type]
+        urllib3.exceptions.ProtocolError("connection aborted"),
+        urllib3.exceptions.SSLError("bad handshake"),
+    ),
+)
+def test_urllib3_transport_connection_error(error: Exception) -> None:
+    """Failures to reach the server raise what the requests transport raises."""
+    transport = Urllib3Transport(pool_manager=MockPoolManager(error))  # type: ignore[arg-type]
+
+    with pytest.raises(requests.exceptions.ConnectionError) as caught:
+        transport.request("GET", PROJECT_URL, timeout=3)
+
+    assert caught.value.__cause__ is error
+
+
+def test_client_selects_transport_by_name() -> None:
+    client = TrackBearClient(api_token="token", transport="urllib3")
+
+    assert isinstance(client.bare.transport, Urllib3Transport)
+    assert client.bare.transport.headers["Authorization"] == "Bearer token"
+    with pytest.raises(AttributeError):
+        client.bare.session
+
+
+def test_default_transport_uses_requests() -> None:
+    client = TrackBearClient(api_token="token")
+
+    assert isinstance(client.bare.transport, RequestsTransport)
+    assert client.bare.session is client.bare.transport.session
+
+
+def test_requests_transport_headers_and_close(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Headers are those of the session, which is closed with the transport."""
+    closed: list[bool] = []
+    session = requests.Session()
+    monkeypatch.setattr(session, "close", lambda: closed.append(True))
+    transport = RequestsTransport({"Authorization": "Bearer token"}, session=session)
+
+    transport.close()
+
+    assert transport.headers is session.headers
+    assert transport.headers["Authorization"] == "Bearer token"
+    assert closed == [True]
+
+
+def test_unknown_transport_name() -> None:
+    with pytest.raises(ValueError, match="Unknown transport"):
+        TrackBearClient(api_token="token", transport="carrier-pigeon")
+
+
+def test_session_can_be_replaced() -> None:
+    """Assigning a session keeps the client's headers unless the session sets them."""
+    client = TrackBearClient(api_token="token", transport="urllib3")
+    session = requests.Session()
+    session.headers["User-Agent"] = "my app/1.0"
+
+    client.bare.session = session
+
+    assert client.bare.session is session
+    assert session.headers["Authorization"] == "Bearer token"
+    assert session.headers["User-Agent"] == "my app/1.0"
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+import responses
+import responses.matchers
+
+from trackbear_api import TrackBearClient
+from trackbear_api import enums
+from trackbear_api import exceptions
+from trackbear_api import models
+
+from . import test_parameters
+
+BASE_URL = "https://trackbear.app/api/v1"
+
+PROJECT = models.Project.build(test_parameters.PROJECT_RESPONSE)
+GOAL = models.Goal.build(test_parameters.GOAL_RESPONSE_THRESHOLD)
+TAG = models.Tag.build(test_parameters.TAG_RESPONSE)
+LEADERBOARD = models.Leaderboard.build(test_parameters.LEADERBOARD_RESPONSE)
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_update_sends_only_changed_fields(client: TrackBearClient) -> None:
+    responses.add(
+        method="PATCH",
+        url=f"{BASE_URL}/project/123",
+        status=200,
+        json={"success": True, "data": test_parameters.PROJECT_RESPONSE},
+        match=[responses.matchers.json_params_matcher({"phase": "drafting"}, strict_match=True)],
+    )
+
+    result = client.project.update(
+        PROJECT,
+        title=PROJECT.title,
+        phase="drafting",
+        starred=True,
+    )
+
+    assert isinstance(result, models.ProjectStub)
+
+
+@pytest.mark.parametrize(
+    "provider,model,changes",
+    (
+        ("project", PROJECT, {"title": PROJECT.title, "phase": enums.Phase.PLANNING}),
+        ("project", PROJECT, {"phase": "planning", "starting_balance": PROJECT.starting_balance}),
+        ("goal", GOAL, {"work_ids": (123,), "starred": False}),
+        ("tag", TAG, {"name": TAG.name, "color": "red"}),
+        ("leaderboard", LEADERBOARD, {"measures": ["word", "time"], "is_joinable": True}),
+        ("leaderboard", LEADERBOARD, {}),
+    ),
+)
+@responses.activate(assert_all_requests_are_fired=True)
+def test_update_skips_request_when_nothing_changed(
+    client: TrackBearClient,
+    provider: str,
+    model: object,
+    changes: dict[str, object],
+) -> None:
+    assert getattr(client, provider).update(model, **changes) is None
+    assert len(responses.calls) == 0
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_update_serializes_nested_and_enum_fields(client: TrackBearClient) -> None:
+    responses.add(
+        method="PATCH",
+        url=f"{BASE_URL}/leaderboard/{LEADERBOARD.uuid}",
+        status=200,
+        json={"success": True, "data": test_parameters.LEADERBOARD_RESPONSE},
+    )
+    goal = models.Balance(word=500, time=0, page=0, chapter=0, scene=0, line=0)
+
+    result = client.leaderboard.update(LEADERBOARD, measures=["word"], goal=goal)
+
+    assert isinstance(result, models.Leaderboard)
+    assert json.loads(responses.calls[0].request.body or b"") == {
+        "measures": ["word"],
+        "goal": {"word": 500, "time": 0, "page": 0, "chapter": 0, "scene": 0, "line": 0},
+    }
+
+
+@pytest.mark.parametrize(
+    "provider,model,url,changes,expected",
+    (
+        (
+            "project",
+            PROJECT,
+            f"{BASE_URL}/project/123",
+            {"starting_balance": {"word": 10}},
+            {
+                "startingBalance": {
+                    "word": 10,
+                    "time": 0,
+                    "page": 2,
+                    "chapter": 0,
+                    "scene": 0,
+                    "line": 0,
+                }
+            },
+        ),
+        (
+            "leaderboard",
+            LEADERBOARD,
+            f"{BASE_URL}/leaderboard/{LEADERBOARD.uuid}",
+            {"goal": {"word": 5}},
+            {"goal": {"word": 5, "time": 0, "page": 0, "chapter": 0, "scene": 0, "line": 0}},
+        ),
+        (
+            "goal",
+            GOAL,
+            f"{BASE_URL}/goal/123",
+            {"parameters": {"threshold": {"measure": "time", "count": 5}}},
+            {"parameters": {"threshold": {"measure": "time", "count": 5}}},
+        ),
+        (
+            "goal",
+            GOAL,
+            f"{BASE_URL}/goal/123",
+            {"parameters": {"cadence": {"unit": "day", "period": 1}, "threshold": None}},
+            {"parameters": {"cadence": {"unit": "day", "period": 1}, "threshold": None}},
+        ),
+    ),
+)
+@responses.activate(assert_all_requests_are_fired=True)
+def test_update_builds_nested_fields_from_dicts(
+    client: TrackBearClient,
+    provider: str,
+    model: object,
+    url: str,
+    changes: dict[str, object],
+    expected: dict[str, object],
+) -> None:
+    """Nested fields given as dicts are built, keeping fields left out from the model."""
+    data = {
+        "project": test_parameters.PROJECT_RESPONSE,
+        "leaderboard": test_parameters.LEADERBOARD_RESPONSE,
+        "goal": test_parameters.GOAL_RESPONSE_THRESHOLD,
+    }[provider]
+    responses.add(
+        method="PATCH",
+        url=url,
+        status=200,
+        json={"success": True, "data": data},
+        match=[responses.matchers.json_params_matcher(expected, strict_match=True)],
+    )
+
+    assert getattr(client, provider).update(model, **changes) is not None
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_update_goal_resolves_tag_names(client: TrackBearClient) -> None:
+    responses.add(
+        method="GET",
+        url=f"{BASE_URL}/tag",
+        status=200,
+        json={"success": True, "data": [test_parameters.TAG_RESPONSE]},
+    )
+    responses.add(
+        method="PATCH",
+        url=f"{BASE_URL}/goal/123",
+        status=200,
+        json={"success": True, "data": test_parameters.GOAL_RESPONSE_THRESHOLD},
+        match=[responses.matchers.json_params_matcher({"tagIds": [123, 456]}, strict_match=True)],
+    )
+
+    assert client.goal.update(GOAL, tag_ids=["Pure Awesome", 456]) is not None
+    # Tag names resolving to the current ids are not a change
+    assert client.goal.update(GOAL, tag_ids=["Pure Awesome"]) is None
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_update_tag_refreshes_index(client: TrackBearClient) -> None:
+    responses.add(
+        method="GET",
+        url=f"{BASE_URL}/tag",
+        status=200,
+        json={"success": True, "data": [test_parameters.TAG_RESPONSE]},
+    )
+    responses.add(
+        method="PATCH",
+        url=f"{BASE_URL}/tag/123",
+        status=200,
+        json={"success": True, "data": test_parameters.TAG_RESPONSE | {"name": "Renamed"}},
+        match=[responses.matchers.json_params_matcher({"name": "Renamed"}, strict_match=True)],
+    )
+
+    assert client.tag.resolve_ids(["Pure Awesome"]) == [123]
+
+    client.tag.update(TAG, name="Renamed")
+
+    assert client.tag.resolve_ids(["Renamed"]) == [123]
+    assert len(responses.calls) == 2
+
+
+@pytest.mark.parametrize(
+    "provider,model,changes,match",
+    (
+        ("project", PROJECT, {"id": 456}, "Cannot update Project field"),
+        ("project", PROJECT, {"phase": "napping"}, "napping"),
+        ("tag", TAG, {"color": "plaid"}, "plaid"),
+        ("goal", GOAL, {"type": "habit"}, "Cannot update Goal field"),
+        ("goal", GOAL, {"end_date": "tomorrow"}, "end_date"),
+        ("leaderboard", LEADERBOARD, {"start_date": "today"}, "start_date"),
+        ("leaderboard", LEADERBOARD, {"measures": ["words"]}, "words"),
+        ("project", PROJECT, {"starting_balance": {"words": 10}}, "Cannot build Balance"),
+        ("leaderboard", LEADERBOARD, {"goal": {"word": 5, "pages": 1}}, "pages"),
+        (
+            "goal",
+            GOAL,
+            {"parameters": {"cadence": {"unit": "day"}}},
+            "Cannot build HabitParameter or TargetParameter",
+        ),
+        ("goal", GOAL, {"parameters": {"threshold": {"measure": "lines"}}}, "lines"),
+    ),
+)
+def test_update_rejects_invalid_changes(
+    client: TrackBearClient,
+    provider: str,
+    model: object,
+    changes: dict[str, object],
+    match: str,
+) -> None:
+    with pytest.raises(ValueError, match=match):
+        getattr(client, provider).update(model, **changes)
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_update_raises_on_api_error(client: TrackBearClient) -> None:
+    responses.add(
+        method="PATCH",
+        url=f"{BASE_URL}/tag/123",
+        status=404,
+        json={"success": False, "error": {"code": "NOT_FOUND", "message": "Nope"}},
+    )
+
+    with pytest.raises(exceptions.APIResponseError, match="NOT_FOUND"):
+        client.tag.update(TAG, color="blue")
@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+import copy
+import json
+import threading
+from typing import Any
+
+import pytest
+import requests
+import responses
+
+from trackbear_api import TrackBearClient
+from trackbear_api.watcher import LeaderboardDelta
+from trackbear_api.watcher import LeaderboardWatcher
+
+from . import test_parameters
+
+BOARD_UUID = "board-uuid"
+BOARD_URL = f"https://trackbear.app/api/v1/leaderboard/{BOARD_UUID}"
+
+
+def participant(
+    uuid: str,
+    tallies: list[tuple[str, int]],
+    goal: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    data = copy.deepcopy(test_parameters.LEADERBOARD_PARTICIPANT_RESPONSE)
+    data.update(
+        {
+            "uuid": uuid,
+            "displayName": uuid.title(),
+            "goal": goal,
+            "tallies": [
+                {"uuid": tally_uuid, "date": "2025-01-01", "measure": "word", "count": count}
+                for tally_uuid, count in tallies
+            ],
+        }
+    )
+    return data
+
+
+def add_board(individual_goal_mode: bool = False) -> None:
+    board = copy.deepcopy(test_parameters.LEADERBOARD_RESPONSE)
+    board.update(
+        {"individualGoalMode": individual_goal_mode, "fundraiserMode": False, "measures": ["word"]}
+    )
+    responses.add(method="GET", url=BOARD_URL, body=json.dumps({"success": True, "data": board}))
+
+
+def add_participants(*participants: dict[str, Any]) -> None:
+    responses.add(
+        method="GET",
+        url=f"{BOARD_URL}/participants",
+        body=json.dumps({"success": True, "data": list(participants)}),
+    )
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_first_poll_reports_everyone_joined(client: TrackBearClient) -> None:
+    """The first poll reports every participant as joined and ranked."""
+    add_participants(participant("ann", [("a1", 10)]), participant("bob", [("b1", 20)]))
+    add_board()
+    received: list[LeaderboardDelta] = []
+    watcher = LeaderboardWatcher(client, [BOARD_UUID])
+    watcher.subscribe(received.append)
+
+    deltas = watcher.poll()
+
+    assert received == list(deltas)
+    assert deltas[0].joined == ["ann", "bob"]
+    assert deltas[0].rank_changes == {"bob": (None, 1), "ann": (None, 2)}
+    assert [tally.uuid for tally in deltas[0].new_tallies["ann"]] == ["a1"]
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_unchanged_poll_emits_nothing(client: TrackBearClient) -> None:
+    """A poll where no tally set changed publishes no delta."""
+    add_participants(participant("ann", [("a1", 10)]))
+    add_board()
+    add_participants(participant("ann", [("a1", 10)]))
+    received: list[LeaderboardDelta] = []
+    watcher = LeaderboardWatcher(client, [BOARD_UUID])
+    watcher.poll()
+    watcher.subscribe(received.append)
+
+    assert watcher.poll() == []
+    assert received == []
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_poll_emits_only_deltas(client: TrackBearClient) -> None:
+    """New tallies, rank changes, and departures are reported without repeating old ones."""
+    add_participants(
+        participant("ann", [("a1", 10)]),
+        participant("bob", [("b1", 20)]),
+        participant("cat", [("c1", 5)]),
+    )
+    add_board()
+    add_participants(participant("ann", [("a1", 10), ("a2", 15)]), participant("bob", [("b1", 20)]))
+    watcher = LeaderboardWatcher(client, [BOARD_UUID])
+    watcher.poll()
+
+    (delta,) = watcher.poll()
+
+    assert delta.joined == []
+    assert delta.left == ["cat"]
+    assert list(delta.new_tallies) == ["ann"]
+    assert [tally.uuid for tally in delta.new_tallies["ann"]] == ["a2"]
+    assert delta.rank_changes == {"ann": (2, 1), "bob": (1, 2), "cat": (3, None)}
+    standings = watcher.standings(BOARD_UUID)
+    assert standings is not None
+    assert [standing.score for standing in standings.top()] == [25.0, 20.0]
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_unchanged_participants_are_not_rediffed(
+    client: TrackBearClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Only participants whose hash changed are applied to the standings."""
+    add_participants(participant("ann", [("a1", 10)]), participant("bob", [("b1", 20)]))
+    add_board()
+    add_participants(participant("ann", [("a1", 10)]), participant("bob", [("b1", 30)]))
+    watcher = LeaderboardWatcher(client, [BOARD_UUID])
+    watcher.poll()
+    standings = watcher.standings(BOARD_UUID)
+    assert standings is not None
+    replaced: list[str] = []
+    replace = standings.replace_participant
+
+    def record(participant: Any) -> int:
+        replaced.append(participant.uuid)
+        return replace(participant)
+
+    monkeypatch.setattr(standings, "replace_participant", record)
+
+    watcher.poll()
+
+    assert replaced == ["bob"]
+    assert [standing.score for standing in standings.top()] == [30.0, 10.0]
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_edited_tally_replaces_its_count(client: TrackBearClient) -> None:
+    """An edited tally count is reported and replaces the old count in the standings."""
+    add_participants(participant("ann", [("a1", 10)]))
+    add_board()
+    add_participants(participant("ann", [("a1", 50)]))
+    watcher = LeaderboardWatcher(client, [BOARD_UUID])
+    watcher.poll()
+
+    (delta,) = watcher.poll()
+
+    assert [tally.count for tally in delta.new_tallies["ann"]] == [50]
+    standings = watcher.standings(BOARD_UUID)
+    assert standings is not None
+    assert standings.top(1)[0].score == 50.0
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_changed_goal_reranks_participants(client: TrackBearClient) -> None:
+    """A participant's goal change alone is picked up by the next poll."""
+    word_goal = {"measure": "word", "count": 100}
+    add_participants(
+        participant("ann", [("a1", 50)], goal=word_goal),
+        participant("bob", [("b1", 40)], goal=word_goal),
+    )
+    add_board(individual_goal_mode=True)
+    add_participants(
+        participant("ann", [("a1", 50)], goal=word_goal),
+        participant("bob", [("b1", 40)], goal={"measure": "word", "count": 50}),
+    )
+    watcher = LeaderboardWatcher(client, [BOARD_UUID])
+    watcher.poll()
+
+    (delta,) = watcher.poll()
+
+    assert delta.new_tallies == {}
+    assert delta.rank_changes == {"bob": (2, 1), "ann": (1, 2)}
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_start_polls_until_stopped(client: TrackBearClient) -> None:
+    """A started watcher polls in the background and publishes to subscribers."""
+    add_participants(participant("ann", [("a1", 10)]))
+    add_board()
+    received = threading.Event()
+    watcher = LeaderboardWatcher(client, [BOARD_UUID], min_interval=0.01)
+    watcher.subscribe(lambda delta: received.set())
+
+    thread = watcher.start()
+
+    assert received.wait(2)
+    watcher.stop()
+    watcher.stop()
+    assert not thread.is_alive()
+
+
+@pytest.mark.parametrize(
+    "failure",
+    (
+        {
+            "status": 404,
+            "body": json.dumps({"success": False, "error": {"code": "NOT_FOUND", "message": ""}}),
+        },
+        {"body": requests.exceptions.ConnectionError("connection refused")},
+    ),
+)
+@responses.activate(assert_all_requests_are_fired=True)
+def test_failed_board_is_skipped(client: TrackBearClient, failure: dict[str, Any]) -> None:
+    """A board which fails to load is logged and does not stop the poll."""
+    responses.add(method="GET", url=f"{BOARD_URL}/participants", **failure)
+    watcher = LeaderboardWatcher(client, [BOARD_UUID])
+
+    assert watcher.poll() == []
+    assert watcher.standings(BOARD_UUID) is None
+
+
+@responses.activate(assert_all_requests_are_fired=True)
+def test_started_watcher_survives_lost_connections(client: TrackBearClient) -> None:
+    """A poll failing outside of the API does not end the background thread."""
+    responses.add(
+        method="GET",
+        url=f"{BOARD_URL}/participants",
+        body=requests.exceptions.ConnectionError("connection refused"),
+    )
+    add_participants(participant("ann", [("a1", 10)]))
+    add_board()
+    received = threading.Event()
+    watcher = LeaderboardWatcher(client, [BOARD_UUID], min_interval=0.01)
+    watcher.subscribe(lambda delta: received.set())
+
+    watcher.start()
+
+    assert received.wait(2)
+    watcher.stop()
+
+
+def test_subscriber_errors_are_contained(client: TrackBearClient) -> None:
+    """A failing subscriber does not prevent delivery to the others."""
+    received: list[LeaderboardDelta] = []
+    watcher = LeaderboardWatcher(client, [BOARD_UUID])
+
+    def broken(delta: LeaderboardDelta) -> None:
+        raise RuntimeError("subscriber failed")
+
+    watcher.subscribe(broken)
+    unsubscribe = watcher.subscribe(received.append)
+    delta = LeaderboardDelta(BOARD_UUID, ["ann"], [], {}, {})
+
+    watcher._publish(delta)
+    unsubscribe()
+    watcher._publish(delta)
+
+    assert received == [delta]
+
+
+@pytest.mark.parametrize(
+    "remaining,reset,expected",
+    (
+        (None, 0, 15.0),
+        (100, 60, 15.0),
+        (10, 60, 24.0),
+        (4, 60, 60.0),
+        (0, 200, 300.0),
+    ),
+)
+def test_interval_adapts_to_rate_budget(
+    client: TrackBearClient,
+    remaining: int | None,
+    reset: int,
+    expected: float,
+) -> None:
+    """The interval spreads half the remaining budget over the reset window."""
+    watcher = LeaderboardWatcher(client, [BOARD_UUID, "other"])
+    if remaining is not None:
+        client.bare.rate_limit.update(remaining, reset)
+
+    assert watcher.next_interval() == pytest.approx(expected, abs=0.5)
+
+
+def test_budget_share_is_validated(client: TrackBearClient) -> None:
+    with pytest.raises(ValueError):
+        LeaderboardWatcher(client, [BOARD_UUID], budget_share=0)